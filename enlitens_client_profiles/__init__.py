@@ -2,12 +2,13 @@
 
 from .config import ProfilePipelineConfig
 from .schema import ClientProfileDocument
-from .matching import build_ai_context, load_persona_library, match_personas
+from .matching import PersonaMatcher, build_ai_context, load_persona_library, match_personas
 from .similarity import SimilarityIndex
 
 __all__ = [
     "ProfilePipelineConfig",
     "ClientProfileDocument",
+    "PersonaMatcher",
     "SimilarityIndex",
     "build_ai_context",
     "load_persona_library",
@@ -135,6 +135,13 @@ class BrandIntelligenceAgent:
         self.config = config
         self.base_url = config.enlitens_site_root.rstrip("/") + "/"
         self.brave_key = config.brave_api_key or os.environ.get("BRAVE_API_KEY")
+        self._crawler: Optional[SiteCrawler] = None
+
+    def _site_crawler(self) -> SiteCrawler:
+        """Incremental crawler shared by sitemap and page fetches, cached under ``site_cache_dir``."""
+        if self._crawler is None:
+            self._crawler = SiteCrawler(self.base_url, cache_dir=self.config.site_cache_dir, incremental=True)
+        return self._crawler
 
     def collect(self, *, force_refresh: bool = False) -> BrandIntelSnapshot:
         if not force_refresh and self.config.brand_snapshot_path.exists():
@@ -166,50 +173,47 @@ class BrandIntelligenceAgent:
 
     def _fetch_sitemap_urls(self) -> List[str]:
         candidates = ["sitemap_index.xml", "sitemap.xml"]
+        crawler = self._site_crawler()
         collected: List[str] = []
         for candidate in candidates:
             target = urljoin(self.base_url, candidate)
-            try:
-                response = httpx.get(target, timeout=20.0)
-                response.raise_for_status()
-            except Exception:
+            body = crawler.fetch_documents([target]).get(target)
+            if body is None:
                 continue
 
             try:
-                root = ET.fromstring(response.text)
+                root = ET.fromstring(body)
             except ET.ParseError:
                 continue
 
             if root.tag.endswith("sitemapindex"):
-                for child in root.findall("{*}sitemap/{*}loc"):
-                    sub_url = child.text.strip()
-                    collected.extend(self._fetch_sitemap_leaf(sub_url))
+                leaves = [child.text.strip() for child in root.findall("{*}sitemap/{*}loc") if child.text]
+                collected.extend(self._fetch_sitemap_leaves(leaves))
                 break
             elif root.tag.endswith("urlset"):
                 for child in root.findall("{*}url/{*}loc"):
-                    loc = child.text.strip()
+                    loc = (child.text or "").strip()
                     if loc:
                         collected.append(loc)
                 break
 
         return sorted(set(collected))
 
-    def _fetch_sitemap_leaf(self, url: str) -> List[str]:
+    def _fetch_sitemap_leaves(self, sitemap_urls: Sequence[str]) -> List[str]:
         urls: List[str] = []
-        try:
-            response = httpx.get(url, timeout=20.0)
-            response.raise_for_status()
-            root = ET.fromstring(response.text)
-        except Exception:
-            return urls
-
-        if not root.tag.endswith("urlset"):
-            return urls
-
-        for child in root.findall("{*}url/{*}loc"):
-            loc = child.text.strip()
-            if loc:
-                urls.append(loc)
+        for body in self._site_crawler().fetch_documents(sitemap_urls).values():
+            try:
+                root = ET.fromstring(body)
+            except ET.ParseError:
+                continue
+
+            if not root.tag.endswith("urlset"):
+                continue
+
+            for child in root.findall("{*}url/{*}loc"):
+                loc = (child.text or "").strip()
+                if loc:
+                    urls.append(loc)
         return urls
 
     # --- Crawling ------------------------------------------------------------------------
@@ -218,8 +222,7 @@ class BrandIntelligenceAgent:
         if not urls:
             return []
 
-        crawler = SiteCrawler(self.base_url, cache_dir=self.config.site_cache_dir)
-        pages = crawler.crawl(urls=urls)
+        pages = self._site_crawler().crawl(urls=urls)
         documents: List[SiteDocument] = []
         for url, payload in pages.items():
             documents.append(
@@ -1,24 +1,213 @@
 """
 Cluster intake messages into distinct client segments.
 Generate one persona per cluster for guaranteed diversity and authenticity.
+
+For large intake imports use ``mode="minibatch"`` (MiniBatchKMeans), ``k_values``
+to sweep several cluster counts in parallel with sampled silhouette scoring,
+and ``compact=True`` to store texts once and reference them by index.
 """
+import hashlib
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, List, Dict, Optional, Sequence, Tuple
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.metrics import silhouette_score
 
 from enlitens_client_profiles.config import ProfilePipelineConfig
 from enlitens_client_profiles.data_ingestion import load_ingestion_bundle
 
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SILHOUETTE_SAMPLE_SIZE = 10000
+
+
+def _text_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _load_embedding_cache(model_dir: Path) -> Dict[str, np.ndarray]:
+    """Read ``{text key: vector}`` from the manifest and the vectors file it names."""
+    keys_path = model_dir / "keys.json"
+    if not keys_path.exists():
+        return {}
+    try:
+        manifest = json.loads(keys_path.read_text(encoding="utf-8"))
+        if isinstance(manifest, list):  # earlier layout: bare key list beside embeddings.npy
+            manifest = {"vectors": "embeddings.npy", "keys": manifest}
+        keys = manifest["keys"]
+        matrix = np.load(model_dir / manifest["vectors"], mmap_mode="r")
+    except Exception as exc:
+        print(f"⚠️  Ignoring unreadable embedding cache ({exc})")
+        return {}
+    if len(keys) != len(matrix):
+        print("⚠️  Ignoring embedding cache whose key table does not match its vectors")
+        return {}
+    return {key: matrix[row] for row, key in enumerate(keys)}
+
 
-def cluster_intakes(n_clusters: int = 100):
+def _save_embedding_cache(model_dir: Path, cached: Dict[str, np.ndarray]) -> None:
+    """
+    Write the vectors to a new file named after its contents, then swap in the
+    manifest that points at it. The manifest replace is the commit point, so a
+    crash at any step leaves the previous keys and vectors readable together.
+    """
+    model_dir.mkdir(parents=True, exist_ok=True)
+    keys_path = model_dir / "keys.json"
+    previous = None
+    if keys_path.exists():
+        try:
+            manifest = json.loads(keys_path.read_text(encoding="utf-8"))
+            previous = manifest.get("vectors") if isinstance(manifest, dict) else "embeddings.npy"
+        except Exception:
+            previous = None
+
+    all_keys = list(cached.keys())
+    vectors_name = f"embeddings_{_text_key(''.join(all_keys))[:16]}.npy"
+    tmp_vectors = model_dir / f"{vectors_name}.tmp.npy"
+    np.save(tmp_vectors, np.vstack([cached[key] for key in all_keys]).astype(np.float32))
+    os.replace(tmp_vectors, model_dir / vectors_name)
+
+    tmp_keys = keys_path.with_suffix(".json.tmp")
+    tmp_keys.write_text(json.dumps({"vectors": vectors_name, "keys": all_keys}), encoding="utf-8")
+    os.replace(tmp_keys, keys_path)
+
+    if previous and previous != vectors_name:
+        (model_dir / previous).unlink(missing_ok=True)
+
+
+def embed_intakes(
+    intakes: Sequence[str],
+    cache_dir: Optional[Path] = None,
+    model_name: str = EMBEDDING_MODEL,
+    batch_size: int = 256,
+) -> np.ndarray:
+    """
+    Encode intakes, reusing vectors cached by text hash from previous runs.
+    Only texts missing from the cache are sent to the encoder.
+    """
+    model_dir = Path(cache_dir) / _text_key(model_name)[:12] if cache_dir is not None else None
+    cached: Dict[str, np.ndarray] = _load_embedding_cache(model_dir) if model_dir is not None else {}
+
+    keys = [_text_key(text) for text in intakes]
+    missing = [i for i, key in enumerate(keys) if key not in cached]
+    print(f"   Embedding cache: {len(intakes) - len(missing)} hits, {len(missing)} to encode")
+
+    if missing:
+        model = SentenceTransformer(model_name, device="cpu")
+        fresh = model.encode(
+            [intakes[i] for i in missing],
+            batch_size=batch_size,
+            show_progress_bar=True,
+            normalize_embeddings=True,
+        )
+        fresh = np.asarray(fresh, dtype=np.float32)
+        for offset, i in enumerate(missing):
+            cached[keys[i]] = fresh[offset]
+
+        if model_dir is not None:
+            _save_embedding_cache(model_dir, cached)
+
+    if not keys:
+        return np.zeros((0, 0), dtype=np.float32)
+    return np.vstack([cached[key] for key in keys]).astype(np.float32)
+
+
+def fit_clusters(
+    embeddings: np.ndarray,
+    n_clusters: int,
+    mode: str = "full",
+    random_state: int = 42,
+    batch_size: int = 4096,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Fit KMeans ("full") or MiniBatchKMeans ("minibatch"); return (labels, centers)."""
+    if mode == "minibatch":
+        model = MiniBatchKMeans(
+            n_clusters=n_clusters,
+            random_state=random_state,
+            batch_size=batch_size,
+            n_init=3,
+            max_iter=100,
+        )
+    elif mode == "full":
+        model = KMeans(n_clusters=n_clusters, random_state=random_state, n_init=10, max_iter=300)
+    else:
+        raise ValueError(f"Unknown clustering mode: {mode}")
+    labels = model.fit_predict(embeddings)
+    return labels, model.cluster_centers_
+
+
+def cluster_member_count(entry: Dict[str, Any]) -> int:
+    """Number of intakes in a saved cluster entry, for both the full and compact layouts."""
+    if "size" in entry:
+        return int(entry["size"])
+    members = entry.get("all_texts") or entry.get("member_indices") or []
+    return len(members)
+
+
+def distances_to_centroids(embeddings: np.ndarray, centers: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """Euclidean distance from every point to its assigned centroid, in one pass."""
+    return np.linalg.norm(embeddings - centers[labels], axis=1)
+
+
+def sampled_silhouette(
+    embeddings: np.ndarray,
+    labels: np.ndarray,
+    sample_size: int = SILHOUETTE_SAMPLE_SIZE,
+    random_state: int = 42,
+) -> float:
+    if len(set(labels.tolist())) < 2:
+        return float("nan")
+    return float(
+        silhouette_score(
+            embeddings,
+            labels,
+            sample_size=min(sample_size, len(embeddings)),
+            random_state=random_state,
+        )
+    )
+
+
+def sweep_cluster_counts(
+    embeddings: np.ndarray,
+    k_values: Sequence[int],
+    mode: str = "minibatch",
+    sample_size: int = SILHOUETTE_SAMPLE_SIZE,
+    max_workers: Optional[int] = None,
+) -> Dict[int, Dict[str, Any]]:
+    """Fit each k in parallel and score it with a sampled silhouette."""
+
+    def _evaluate(k: int) -> Tuple[int, Dict[str, Any]]:
+        labels, centers = fit_clusters(embeddings, k, mode=mode)
+        return k, {
+            "labels": labels,
+            "centers": centers,
+            "silhouette": sampled_silhouette(embeddings, labels, sample_size),
+        }
+
+    workers = max_workers or min(len(k_values), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return dict(pool.map(_evaluate, k_values))
+
+
+def cluster_intakes(
+    n_clusters: int = 100,
+    *,
+    mode: str = "full",
+    k_values: Optional[Sequence[int]] = None,
+    compact: bool = False,
+    embedding_cache_dir: Optional[Path] = None,
+    silhouette_sample_size: int = SILHOUETTE_SAMPLE_SIZE,
+):
     """
     Cluster intake messages into n_clusters distinct segments.
     Returns cluster assignments and representative samples from each cluster.
+
+    When ``k_values`` is given, every k is fitted in parallel and the one with
+    the best sampled silhouette score is kept.
     """
     
     project_root = Path("/home/antons-gs/enlitens-ai")
@@ -40,41 +229,48 @@ def cluster_intakes(n_clusters: int = 100):
     
     print(f"✅ Loaded {len(intakes)} intakes\n")
     
-    # Load embedding model
-    print("Loading embedding model...")
-    model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2", device="cpu")
-    print("✅ Model loaded\n")
-    
-    # Generate embeddings
+    # Generate embeddings (cached by text hash across runs)
     print("Generating embeddings (this may take a few minutes)...")
-    embeddings = model.encode(intakes, show_progress_bar=True, normalize_embeddings=True)
+    if embedding_cache_dir is None:
+        embedding_cache_dir = project_root / "enlitens_client_profiles" / "cache" / "intake_embeddings"
+    embeddings = embed_intakes(intakes, cache_dir=embedding_cache_dir)
     print(f"✅ Generated {len(embeddings)} embeddings\n")
     
     # Cluster
-    print(f"Clustering into {n_clusters} segments...")
-    kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10, max_iter=300)
-    cluster_labels = kmeans.fit_predict(embeddings)
-    
-    # Calculate silhouette score (quality metric)
-    silhouette = silhouette_score(embeddings, cluster_labels, sample_size=min(10000, len(embeddings)))
+    if k_values:
+        print(f"Sweeping k in {list(k_values)} ({mode} mode)...")
+        sweep = sweep_cluster_counts(embeddings, k_values, mode=mode, sample_size=silhouette_sample_size)
+        for k in sorted(sweep):
+            print(f"   k={k:>4}: silhouette {sweep[k]['silhouette']:.3f}")
+        n_clusters = max(
+            sweep,
+            key=lambda k: sweep[k]["silhouette"] if not np.isnan(sweep[k]["silhouette"]) else -1.0,
+        )
+        cluster_labels = sweep[n_clusters]["labels"]
+        cluster_centers = sweep[n_clusters]["centers"]
+        silhouette = sweep[n_clusters]["silhouette"]
+        print(f"✅ Selected k={n_clusters}")
+    else:
+        print(f"Clustering into {n_clusters} segments ({mode} mode)...")
+        cluster_labels, cluster_centers = fit_clusters(embeddings, n_clusters, mode=mode)
+        # Calculate silhouette score (quality metric)
+        silhouette = sampled_silhouette(embeddings, cluster_labels, silhouette_sample_size)
     print(f"✅ Clustering complete")
     print(f"   Silhouette score: {silhouette:.3f} (higher is better, range: -1 to 1)\n")
     
-    # Organize clusters
+    # Organize clusters: member indices ordered by distance to center
+    # (closest = most representative)
+    distances = distances_to_centroids(embeddings, cluster_centers, cluster_labels)
+    order = np.lexsort((distances, cluster_labels))
     clusters = {}
-    for i, (intake, label) in enumerate(zip(intakes, cluster_labels)):
-        if label not in clusters:
-            clusters[label] = []
-        clusters[label].append({
-            "index": i,
-            "text": intake,
-            "distance_to_center": float(np.linalg.norm(embeddings[i] - kmeans.cluster_centers_[label]))
+    for i in order:
+        label = int(cluster_labels[i])
+        clusters.setdefault(label, []).append({
+            "index": int(i),
+            "text": intakes[i],
+            "distance_to_center": float(distances[i]),
         })
     
-    # Sort each cluster by distance to center (closest = most representative)
-    for label in clusters:
-        clusters[label].sort(key=lambda x: x["distance_to_center"])
-    
     # Print cluster summary
     print("="*80)
     print("CLUSTER SUMMARY")
@@ -102,9 +298,14 @@ def cluster_intakes(n_clusters: int = 100):
         "total_intakes": len(intakes),
         "clusters": {}
     }
+    if compact:
+        # Texts are stored once; clusters reference them by index
+        cluster_data["format"] = "compact"
+        cluster_data["texts"] = intakes
+        cluster_data["labels"] = cluster_labels.astype(int).tolist()
     
     for label, members in clusters.items():
-        cluster_data["clusters"][str(label)] = {
+        entry = {
             "size": len(members),
             "percentage": (len(members) / len(intakes)) * 100,
             "representative_samples": [
@@ -114,12 +315,20 @@ def cluster_intakes(n_clusters: int = 100):
                 }
                 for m in members[:5]  # Top 5 most representative
             ],
-            "all_texts": [m["text"] for m in members]  # All texts for persona generation
         }
+        if compact:
+            entry["member_indices"] = [m["index"] for m in members]
+            entry["distances"] = [round(m["distance_to_center"], 5) for m in members]
+        else:
+            entry["all_texts"] = [m["text"] for m in members]  # All texts for persona generation
+        cluster_data["clusters"][str(label)] = entry
     
     output_file = output_dir / f"clusters_{n_clusters}.json"
     with open(output_file, "w") as f:
-        json.dump(cluster_data, f, indent=2)
+        if compact:
+            json.dump(cluster_data, f, separators=(",", ":"))
+        else:
+            json.dump(cluster_data, f, indent=2)
     
     print(f"\n✅ Saved cluster data to: {output_file}")
     
@@ -152,15 +361,22 @@ def cluster_intakes(n_clusters: int = 100):
 
 
 if __name__ == "__main__":
-    import sys
+    import argparse
     
-    # Allow command line argument for number of clusters
-    n_clusters = 50  # Default to 50 for 224 intakes
-    if len(sys.argv) > 1:
-        try:
-            n_clusters = int(sys.argv[1])
-        except ValueError:
-            print(f"Invalid number of clusters: {sys.argv[1]}, using default: 50")
+    parser = argparse.ArgumentParser(description="Cluster intake messages into client segments.")
+    # Default to 50 for 224 intakes
+    parser.add_argument("n_clusters", nargs="?", type=int, default=50)
+    parser.add_argument("--mode", choices=["full", "minibatch"], default="full")
+    parser.add_argument("--sweep", type=str, default="", help="Comma-separated k values to compare, e.g. 50,100,200")
+    parser.add_argument("--compact", action="store_true", help="Store texts once and reference them by index")
+    parser.add_argument("--silhouette-sample", type=int, default=SILHOUETTE_SAMPLE_SIZE)
+    args = parser.parse_args()
     
-    cluster_intakes(n_clusters=n_clusters)
-
+    sweep_values = [int(value) for value in args.sweep.split(",") if value.strip()] or None
+    cluster_intakes(
+        n_clusters=args.n_clusters,
+        mode=args.mode,
+        k_values=sweep_values,
+        compact=args.compact,
+        silhouette_sample_size=args.silhouette_sample,
+    )
@@ -41,6 +41,9 @@ class ProfilePipelineConfig:
     llm_temperature: float = 0.3
     llm_top_p: float = 0.92
     batch_size: int = 5
+    persona_concurrency: int = field(
+        default_factory=lambda: int(os.environ.get("ENLITENS_PERSONA_CONCURRENCY", "1"))
+    )
     max_profiles: int = 500
     profile_depth_tokens: int = 4096
     reuse_existing: bool = True
@@ -6,6 +6,7 @@ import json
 import re
 from collections import Counter
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
@@ -19,6 +20,7 @@ from .brand_intelligence import (
 )
 from .analytics import AnalyticsSnapshot, build_analytics_snapshot
 from .config import ProfilePipelineConfig
+from .gazetteer import Gazetteer
 from .stl_geography import STL_REGION_DATA
 
 
@@ -26,6 +28,9 @@ from .stl_geography import STL_REGION_DATA
 class IntakeRecord:
     raw_text: str
     line_number: int
+    # Filled by the locality scan so the knowledge graph build can reuse them
+    tokens: List[str] = field(default_factory=list)
+    localities: List[str] = field(default_factory=list)
 
 
 @dataclass(slots=True)
@@ -143,15 +148,23 @@ def _split_sentences(blocks: Iterable[str]) -> List[str]:
     return sentences
 
 
+@lru_cache(maxsize=1)
+def _locality_gazetteer() -> Gazetteer:
+    return Gazetteer(STL_REGION_DATA.all_municipalities)
+
+
 def _collect_localities(records: Iterable[IntakeRecord]) -> Dict[str, int]:
+    """Count intakes mentioning each municipality, scanning every intake once.
+
+    Each record keeps its tokens and matched localities for the knowledge graph.
+    """
     locality_counter: Counter[str] = Counter()
-    all_municipalities = {name.lower(): name for name in STL_REGION_DATA.all_municipalities}
+    gazetteer = _locality_gazetteer()
 
     for record in records:
-        lowered = record.raw_text.lower()
-        for city_lower, city_proper in all_municipalities.items():
-            if city_lower in lowered:
-                locality_counter[city_proper] += 1
+        record.tokens, hits = gazetteer.scan(record.raw_text)
+        record.localities = sorted({hit.label for hit in hits})
+        locality_counter.update(record.localities)
 
     return dict(locality_counter)
 
@@ -7,6 +7,7 @@ import logging
 import os
 import re
 import time
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -241,8 +242,9 @@ class DeepResearchAgent:
         return filtered
 
     def _persist(self, cache: ResearchCache) -> None:
+        # Concurrent persona workers can finish research in the same second
         timestamp = cache.generated_at.strftime("%Y%m%d_%H%M%S")
-        target = self.output_dir / f"research_{timestamp}.json"
+        target = self.output_dir / f"research_{timestamp}_{uuid.uuid4().hex[:8]}.json"
         try:
             target.write_text(json.dumps(cache.to_json(), indent=2), encoding="utf-8")
         except Exception as exc:
@@ -0,0 +1,109 @@
+"""Compiled multi-phrase matcher for locality and keyword scanning.
+
+``Gazetteer`` compiles its phrases into an Aho-Corasick automaton over word
+tokens, so a single pass over a text reports every phrase occurrence however
+many phrases are loaded. Matching is on whole tokens, which keeps short place
+names from hitting inside longer words ("Shaw" in "Shawnee") and lets
+punctuation differ ("St. Louis" matches "st louis"); a possessive "'s" is
+ignored while matching ("Alton's" hits "Alton"). Tokens use the same
+``[a-z0-9']+`` split as the knowledge keeper, so one scan serves both the
+locality counts and the keyword graph.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Set, Tuple, Union
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case ``text`` and split it into word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _match_form(token: str) -> str:
+    return token[:-2] if token.endswith("'s") else token
+
+
+@dataclass(frozen=True)
+class GazetteerHit:
+    """A phrase occurrence, as token offsets ``[start, end)`` into the scanned tokens."""
+
+    label: str
+    start: int
+    end: int
+
+
+class Gazetteer:
+    """Aho-Corasick automaton over the tokens of a fixed phrase list.
+
+    ``phrases`` is either an iterable of phrases (each labelled by itself) or a
+    mapping of phrase → label, so several spellings can report one label.
+    """
+
+    def __init__(self, phrases: Union[Iterable[str], Mapping[str, str]]) -> None:
+        items = phrases.items() if isinstance(phrases, Mapping) else ((phrase, phrase) for phrase in phrases)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._outputs: List[Tuple[Tuple[str, int], ...]] = [()]
+        for phrase, label in items:
+            self._add(tokenize(phrase), label)
+        self._fail = self._link()
+
+    def __len__(self) -> int:
+        return sum(len(outputs) for outputs in self._outputs)
+
+    def _add(self, tokens: List[str], label: str) -> None:
+        if not tokens:
+            return
+        state = 0
+        for token in map(_match_form, tokens):
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][token] = next_state
+                self._goto.append({})
+                self._outputs.append(())
+            state = next_state
+        if (label, len(tokens)) not in self._outputs[state]:
+            self._outputs[state] += ((label, len(tokens)),)
+
+    def _link(self) -> List[int]:
+        """Breadth-first failure links; each state also inherits its suffixes' outputs."""
+        fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in self._goto[state].items():
+                fallback = fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = self._goto[fallback].get(token, 0)
+                self._outputs[child] += self._outputs[fail[child]]
+                queue.append(child)
+        return fail
+
+    def scan_tokens(self, tokens: List[str]) -> List[GazetteerHit]:
+        """Return every phrase occurrence in ``tokens``, nested and overlapping ones included."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        hits: List[GazetteerHit] = []
+        state = 0
+        for position, token in enumerate(map(_match_form, tokens), start=1):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for label, length in outputs[state]:
+                hits.append(GazetteerHit(label, position - length, position))
+        return hits
+
+    def scan(self, text: str) -> Tuple[List[str], List[GazetteerHit]]:
+        """Tokenize ``text`` once and return ``(tokens, hits)``."""
+        tokens = tokenize(text)
+        return tokens, self.scan_tokens(tokens)
+
+    def labels(self, text: str) -> Set[str]:
+        """Distinct labels found in ``text``."""
+        return {hit.label for hit in self.scan(text)[1]}
@@ -7,6 +7,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict
 
+from enlitens_client_profiles.cluster_intakes import cluster_member_count
 from enlitens_client_profiles.gemini_client import GeminiClient
 from enlitens_client_profiles.schema_v2_real_stories import ClientProfileV2RealStories
 
@@ -19,7 +20,8 @@ def build_cluster_persona_prompt(cluster_id: int, cluster_data: Dict, cluster_nu
     
     # Get representative samples from this cluster
     samples = cluster_data["representative_samples"][:5]  # Top 5 most representative
-    all_texts = cluster_data["all_texts"]
+    # Only the segment size is used; compact files list member indices instead of texts
+    member_count = cluster_member_count(cluster_data)
     
     # Build intake examples from this cluster
     intake_examples = "\n\n".join([f"INTAKE {i+1}:\n{s['text']}" for i, s in enumerate(samples)])
@@ -28,7 +30,7 @@ def build_cluster_persona_prompt(cluster_id: int, cluster_data: Dict, cluster_nu
 
 **THIS PERSONA REPRESENTS CLIENT SEGMENT #{cluster_number} of {total_clusters}**
 
-This segment contains {len(all_texts)} real client intakes with similar characteristics. You MUST create a persona that represents this SPECIFIC client segment.
+This segment contains {member_count} real client intakes with similar characteristics. You MUST create a persona that represents this SPECIFIC client segment.
 
 ---
 
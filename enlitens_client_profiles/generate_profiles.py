@@ -23,6 +23,11 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--no-cache", action="store_true", help="Disable cache reuse and force regeneration")
     parser.add_argument("--allow-duplicates", action="store_true", help="Do not halt on similarity >= 0.41")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Personas to assemble in parallel (defaults to ENLITENS_PERSONA_CONCURRENCY or 1)",
+    )
     parser.add_argument("--config-dump", action="store_true", help="Print resolved configuration before running")
     parser.add_argument("--google-credentials", type=Path, help="Path to Google service account JSON for GA/GSC pulls")
     parser.add_argument("--ga-property", type=str, help="Google Analytics 4 property id (numbers only)")
@@ -50,6 +55,8 @@ def main() -> None:
         config.analytics_lookback_days = max(7, args.analytics_lookback)
     if args.no_cache:
         config.reuse_existing = False
+    if args.concurrency:
+        config.persona_concurrency = max(1, args.concurrency)
 
     if args.config_dump:
         from dataclasses import asdict
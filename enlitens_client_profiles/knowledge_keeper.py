@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import json
 import logging
-import re
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -14,12 +13,12 @@ import networkx as nx
 
 from .brand_intelligence import BrandMention, SiteDocument
 from .config import ProfilePipelineConfig
-from .data_ingestion import IngestionBundle, KnowledgeAsset, TranscriptSnippet
+from .data_ingestion import IngestionBundle, IntakeRecord, KnowledgeAsset, TranscriptSnippet
+from .gazetteer import tokenize
 
 logger = logging.getLogger(__name__)
 
 
-_TOKEN_SPLIT = re.compile(r"[^a-zA-Z0-9']+")
 _STOPWORDS = {
     "the",
     "and",
@@ -77,19 +76,14 @@ class KnowledgeKeeperAgent:
         self.config = config
         self.graph_path = config.cache_dir / "knowledge_graph.graphml"
 
-    def _tokenise(self, text: str) -> Iterable[str]:
-        for token in _TOKEN_SPLIT.split(text.lower()):
-            if not token or token in _STOPWORDS or len(token) < 3:
-                continue
-            yield token
+    def _intake_keywords(self, record: IntakeRecord) -> List[str]:
+        """Keyword tokens of an intake, reusing the tokens from the ingestion scan."""
+        tokens = record.tokens or tokenize(record.raw_text)
+        return [token for token in tokens if len(token) >= 3 and token not in _STOPWORDS]
 
-    def _extract_keywords(self, sentences: Iterable[str], *, limit: int = 50) -> List[Tuple[str, int]]:
+    def _add_intake_nodes(self, graph: nx.MultiDiGraph, bundle: IngestionBundle) -> Counter[str]:
+        """Add intake, keyword and locality links; return keyword counts over all intakes."""
         counter: Counter[str] = Counter()
-        for sentence in sentences:
-            counter.update(self._tokenise(sentence))
-        return counter.most_common(limit)
-
-    def _add_intake_nodes(self, graph: nx.MultiDiGraph, bundle: IngestionBundle) -> None:
         for record in bundle.intakes:
             node_id = f"intake::{record.line_number}"
             graph.add_node(
@@ -98,10 +92,15 @@ class KnowledgeKeeperAgent:
                 line=record.line_number,
                 text=record.raw_text,
             )
-            for keyword in set(self._tokenise(record.raw_text)):
+            keywords = self._intake_keywords(record)
+            counter.update(keywords)
+            for keyword in set(keywords):
                 keyword_id = f"keyword::{keyword}"
                 graph.add_node(keyword_id, type="keyword", label=keyword)
                 graph.add_edge(node_id, keyword_id, relation="mentions")
+            for locality in record.localities:
+                graph.add_edge(node_id, f"locality::{locality}", relation="mentions_locality")
+        return counter
 
     def _add_transcript_nodes(self, graph: nx.MultiDiGraph, snippets: Iterable[TranscriptSnippet]) -> List[str]:
         highlights: List[str] = []
@@ -159,7 +158,7 @@ class KnowledgeKeeperAgent:
         graph = nx.MultiDiGraph()
         graph.add_node("root", type="root", label="knowledge")
 
-        self._add_intake_nodes(graph, bundle)
+        keyword_counts = self._add_intake_nodes(graph, bundle)
         founder_highlights = self._add_transcript_nodes(graph, bundle.transcripts)
         self._add_locality_nodes(graph, bundle.locality_counts)
         self._add_analytics_nodes(graph, bundle.analytics_summary_block())
@@ -176,7 +175,7 @@ class KnowledgeKeeperAgent:
             )
             graph.add_edge("root", node_id, relation="knowledge_asset")
 
-        keywords = self._extract_keywords(record.raw_text for record in bundle.intakes)
+        keywords = keyword_counts.most_common(50)
 
         try:
             nx.write_graphml(graph, Path(self.graph_path))
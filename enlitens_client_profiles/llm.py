@@ -13,6 +13,16 @@ from src.synthesis.ollama_client import OllamaClient
 from src.utils.settings import get_settings
 
 
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Return the calling thread's event loop, creating one for worker threads."""
+    try:
+        return asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        return loop
+
+
 class ProfileLLMClient:
     """Thin wrapper that exposes a synchronous interface for profile prompts."""
 
@@ -43,7 +53,7 @@ class ProfileLLMClient:
         return response.get("response", "")
 
     def generate_json(self, prompt: str, *, system_prompt: Optional[str] = None) -> Dict[str, Any]:
-        loop = asyncio.get_event_loop()
+        loop = _event_loop()
         text = loop.run_until_complete(self._generate_async(prompt, system_prompt))
         try:
             return json.loads(text)
@@ -61,7 +71,7 @@ class ProfileLLMClient:
         system_prompt: Optional[str] = None,
         fallback_prompt: Optional[str] = None,
     ) -> BaseModel:
-        loop = asyncio.get_event_loop()
+        loop = _event_loop()
         combined_prompt = prompt if not system_prompt else f"{system_prompt}\n\n{prompt}"
         result = loop.run_until_complete(
             self._client.generate_structured_response(
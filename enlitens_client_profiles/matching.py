@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 
 from .schema import ClientProfileDocument
-from .similarity import build_corpus, embed_text, _jaccard_similarity
+from .similarity import SimilarityIndex, build_corpus, embed_text, _jaccard_similarity
+
+COSINE_WEIGHT = 0.7
+JACCARD_WEIGHT = 0.3
+VECTOR_CACHE_SIZE = int(os.getenv("ENLITENS_PERSONA_VECTOR_CACHE_SIZE", "4096"))
+MATCHER_CACHE_SIZE = 8
 
 
 def load_persona_library(directory: Path) -> List[ClientProfileDocument]:
@@ -40,7 +49,145 @@ def score_persona_match(
     cosine = float(np.dot(persona_vector, candidate_vector))
     jaccard = _jaccard_similarity(attribute_tags, persona.attribute_set())
     # Weighted blend emphasises linguistic alignment while respecting attribute tags
-    return 0.7 * cosine + 0.3 * jaccard
+    return COSINE_WEIGHT * cosine + JACCARD_WEIGHT * jaccard
+
+
+class PersonaMatcher:
+    """Match intakes against a persona library embedded once.
+
+    Persona vectors are cached process-wide by the SHA-256 of each persona's
+    corpus (least recently used first out, at most ``VECTOR_CACHE_SIZE``), so
+    rebuilding a matcher over an unchanged (or partially changed) library only
+    encodes the personas whose content differs. Batch matching encodes every
+    intake narrative in one call and scores them with a single
+    ``(intakes x personas)`` matrix product.
+    """
+
+    _vector_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    def __init__(self, personas: Iterable[ClientProfileDocument]) -> None:
+        self.personas: List[ClientProfileDocument] = list(personas)
+        corpora = [build_corpus(persona) for persona in self.personas]
+        self.content_hashes = [hashlib.sha256(corpus.encode("utf-8")).hexdigest() for corpus in corpora]
+        self.library_hash = hashlib.sha256("".join(self.content_hashes).encode("utf-8")).hexdigest()
+        self.matrix = self._embed_library(corpora)
+
+        vocab: Dict[str, int] = {}
+        rows: List[List[int]] = []
+        for persona in self.personas:
+            rows.append([vocab.setdefault(tag, len(vocab)) for tag in set(persona.attribute_set())])
+        self._attribute_vocab = vocab
+        self._attribute_matrix = np.zeros((len(self.personas), len(vocab)), dtype=bool)
+        for row, columns in enumerate(rows):
+            self._attribute_matrix[row, columns] = True
+        self._attribute_sizes = self._attribute_matrix.sum(axis=1)
+
+    def _embed_library(self, corpora: List[str]) -> np.ndarray:
+        if not self.personas:
+            return np.zeros((0, 0), dtype=np.float32)
+        found: Dict[str, np.ndarray] = {}
+        with self._cache_lock:
+            for digest in self.content_hashes:
+                vector = self._vector_cache.get(digest)
+                if vector is not None:
+                    self._vector_cache.move_to_end(digest)
+                    found[digest] = vector
+        missing = [index for index, digest in enumerate(self.content_hashes) if digest not in found]
+        if missing:
+            vectors = SimilarityIndex._embed_many([corpora[index] for index in missing])
+            with self._cache_lock:
+                for offset, index in enumerate(missing):
+                    digest = self.content_hashes[index]
+                    found[digest] = vectors[offset]
+                    self._vector_cache[digest] = vectors[offset]
+                    self._vector_cache.move_to_end(digest)
+                while len(self._vector_cache) > VECTOR_CACHE_SIZE:
+                    self._vector_cache.popitem(last=False)
+        return np.vstack([found[digest] for digest in self.content_hashes]).astype(np.float32)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._cache_lock:
+            cls._vector_cache.clear()
+        with _MATCHERS_LOCK:
+            _MATCHERS.clear()
+
+    def _jaccard_matrix(self, tag_sets: Sequence[Sequence[str]]) -> np.ndarray:
+        scores = np.zeros((len(tag_sets), len(self.personas)), dtype=np.float32)
+        for row, tags in enumerate(tag_sets):
+            candidate = set(tags)
+            if not candidate:
+                continue
+            columns = [self._attribute_vocab[tag] for tag in candidate if tag in self._attribute_vocab]
+            intersection = self._attribute_matrix[:, columns].sum(axis=1) if columns else 0
+            union = self._attribute_sizes + len(candidate) - intersection
+            scores[row] = np.where(self._attribute_sizes > 0, intersection / np.maximum(union, 1), 0.0)
+        return scores
+
+    def score_many(
+        self,
+        narrative_texts: Sequence[str],
+        attribute_tags: Optional[Sequence[Sequence[str]]] = None,
+    ) -> np.ndarray:
+        """Return an ``(intakes x personas)`` matrix of blended match scores."""
+
+        if not self.personas or not narrative_texts:
+            return np.zeros((len(narrative_texts), len(self.personas)), dtype=np.float32)
+        tag_sets = attribute_tags if attribute_tags is not None else [[] for _ in narrative_texts]
+        if len(tag_sets) != len(narrative_texts):
+            raise ValueError("attribute_tags must align with narrative_texts")
+
+        intake_vectors = SimilarityIndex._embed_many(list(narrative_texts))
+        cosine = intake_vectors @ self.matrix.T
+        return COSINE_WEIGHT * cosine + JACCARD_WEIGHT * self._jaccard_matrix(tag_sets)
+
+    def match_many(
+        self,
+        narrative_texts: Sequence[str],
+        attribute_tags: Optional[Sequence[Sequence[str]]] = None,
+        *,
+        top_k: int = 3,
+    ) -> List[List[Tuple[ClientProfileDocument, float]]]:
+        """Return top-k persona matches for each intake, in input order."""
+
+        scores = self.score_many(narrative_texts, attribute_tags)
+        results: List[List[Tuple[ClientProfileDocument, float]]] = []
+        for row in scores:
+            order = np.argsort(-row, kind="stable")[:top_k]
+            results.append([(self.personas[index], float(row[index])) for index in order])
+        return results
+
+    def match(
+        self,
+        *,
+        narrative_text: str,
+        attribute_tags: Sequence[str],
+        top_k: int = 3,
+    ) -> List[Tuple[ClientProfileDocument, float]]:
+        return self.match_many([narrative_text], [attribute_tags], top_k=top_k)[0]
+
+
+_MATCHERS: "OrderedDict[Tuple[int, ...], PersonaMatcher]" = OrderedDict()
+_MATCHERS_LOCK = threading.Lock()
+
+
+def _matcher_for(personas: Iterable[ClientProfileDocument]) -> PersonaMatcher:
+    """Reuse the matcher built for the same persona objects (the matcher keeps them alive, so ids stay unique)."""
+
+    library = list(personas)
+    key = tuple(id(persona) for persona in library)
+    with _MATCHERS_LOCK:
+        matcher = _MATCHERS.get(key)
+        if matcher is not None:
+            _MATCHERS.move_to_end(key)
+            return matcher
+    matcher = PersonaMatcher(library)
+    with _MATCHERS_LOCK:
+        _MATCHERS[key] = matcher
+        while len(_MATCHERS) > MATCHER_CACHE_SIZE:
+            _MATCHERS.popitem(last=False)
+    return matcher
 
 
 def match_personas(
@@ -50,15 +197,15 @@ def match_personas(
     attribute_tags: Sequence[str],
     top_k: int = 3,
 ) -> List[Tuple[ClientProfileDocument, float]]:
-    """Return top-k persona matches given intake narrative and attribute hints."""
+    """Return top-k persona matches given intake narrative and attribute hints.
 
-    scores: List[Tuple[ClientProfileDocument, float]] = []
-    for persona in personas:
-        score = score_persona_match(persona, narrative_text=narrative_text, attribute_tags=attribute_tags)
-        scores.append((persona, score))
+    Repeated calls with the same persona objects reuse one ``PersonaMatcher``.
+    Personas edited in place are not re-embedded; build a ``PersonaMatcher``
+    directly (or call ``PersonaMatcher.clear_cache``) after changing them.
+    """
 
-    scores.sort(key=lambda item: item[1], reverse=True)
-    return scores[:top_k]
+    matcher = _matcher_for(personas)
+    return matcher.match(narrative_text=narrative_text, attribute_tags=attribute_tags, top_k=top_k)
 
 
 def build_ai_context(persona: ClientProfileDocument) -> Dict[str, str]:
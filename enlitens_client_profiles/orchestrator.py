@@ -32,6 +32,15 @@ class PersonaOrchestrator:
             self._knowledge_context = self.knowledge_keeper.build_graph(bundle)
         return self._knowledge_context
 
+    def fork(self) -> "PersonaOrchestrator":
+        """Return an orchestrator with its own agents that reuses this knowledge context.
+
+        Used to give each pipeline worker thread a private LLM client.
+        """
+        clone = PersonaOrchestrator(self.config)
+        clone._knowledge_context = self._knowledge_context
+        return clone
+
     def assemble_persona(
         self,
         bundle: IngestionBundle,
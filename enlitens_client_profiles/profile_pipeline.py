@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import closing
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from .config import ProfilePipelineConfig
 from .data_ingestion import IngestionBundle, load_ingestion_bundle
+from .deep_research import ResearchCache
+from .foundation_builder import PersonaFoundation
+from .knowledge_keeper import KnowledgeGraphContext
 from .orchestrator import PersonaOrchestrator
 from .schema import ClientProfileDocument
 from .similarity import SIMILARITY_THRESHOLD, SimilarityIndex
@@ -32,24 +39,83 @@ def load_manifest(path: Path) -> List[str]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+def _write_atomic(path: Path, text: str) -> None:
+    """Write via a temporary file so a crash never leaves a truncated file behind."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
 def save_manifest(path: Path, profile_ids: Iterable[str]) -> None:
-    path.write_text(json.dumps(list(profile_ids), indent=2), encoding="utf-8")
+    _write_atomic(path, json.dumps(sorted(profile_ids), indent=2))
 
 
 def save_profile(document: ClientProfileDocument, directory: Path) -> Path:
     filename = f"{document.meta.profile_id}.json"
     target = directory / filename
-    target.write_text(document.model_dump_json(indent=2), encoding="utf-8")
+    _write_atomic(target, document.model_dump_json(indent=2))
     return target
 
 
+AssembledPersona = Tuple[
+    Optional[ClientProfileDocument],
+    KnowledgeGraphContext,
+    PersonaFoundation,
+    ResearchCache,
+]
+
+
+def _assemble_concurrently(
+    orchestrator: PersonaOrchestrator,
+    bundle: IngestionBundle,
+    attempts: int,
+    workers: int,
+) -> Iterator[AssembledPersona]:
+    """Yield ``assemble_persona`` results in completion order, ``workers`` calls in flight.
+
+    Each worker thread runs a forked orchestrator so it owns its LLM client;
+    the consumer handles one result at a time while the others keep running.
+    """
+    local = threading.local()
+
+    def _assemble() -> AssembledPersona:
+        worker = getattr(local, "orchestrator", None)
+        if worker is None:
+            worker = local.orchestrator = orchestrator.fork()
+        return worker.assemble_persona(bundle)
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="persona")
+    try:
+        in_flight = {executor.submit(_assemble) for _ in range(min(workers, attempts))}
+        submitted = len(in_flight)
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                if submitted < attempts:
+                    in_flight.add(executor.submit(_assemble))
+                    submitted += 1
+                yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def run_profile_pipeline(
     config: ProfilePipelineConfig,
     *,
     desired_profiles: int,
     telemetry: ClientProfileTelemetry,
     allow_duplicates: bool = False,
+    concurrency: Optional[int] = None,
 ) -> PipelineResult:
+    """Generate ``desired_profiles`` personas and persist the unique ones.
+
+    With ``concurrency`` > 1 (default ``config.persona_concurrency``) several
+    personas are assembled in parallel threads. Similarity checks, writes and
+    index registration still happen one persona at a time on this thread, so
+    near-duplicates produced side by side are caught against each other. Each
+    accepted profile is written before the manifest that lists it, both
+    atomically, so an interrupted run leaves a consistent output directory.
+    """
     bundle = load_ingestion_bundle(config)
 
     orchestrator = PersonaOrchestrator(config)
@@ -74,19 +140,19 @@ def run_profile_pipeline(
 
     orchestrator.prepare_context(bundle)
 
-    for _ in range(desired_profiles):
-        document, knowledge_context, foundation, research = orchestrator.assemble_persona(bundle)
+    def _accept(assembled: AssembledPersona) -> None:
+        document, knowledge_context, foundation, research = assembled
 
         if document is None:
             telemetry.log_event(
                 "persona_research_missing",
                 {"reason": "no_results", "queries": research.queries, "gaps": foundation.gaps},
             )
-            continue
+            return
 
         if document.meta.profile_id in existing_ids:
             telemetry.log_event("profile_duplicate_skipped", {"profile_id": document.meta.profile_id})
-            continue
+            return
         similarity_report = index.evaluate(document)
         if not allow_duplicates and similarity_report.exceeds_threshold():
             conflict_dir = config.cache_dir / "conflicts"
@@ -103,7 +169,7 @@ def run_profile_pipeline(
                     "threshold": SIMILARITY_THRESHOLD,
                 },
             )
-            continue
+            return
         elif allow_duplicates and similarity_report.exceeds_threshold():
             telemetry.log_event(
                 "profile_similarity_allowed",
@@ -117,6 +183,7 @@ def run_profile_pipeline(
             )
         save_profile(document, config.output_dir)
         existing_ids.add(document.meta.profile_id)
+        save_manifest(manifest_file, existing_ids)
         generated_documents.append(document)
         index.register(document)
         telemetry.log_profile_created(document)
@@ -133,7 +200,19 @@ def run_profile_pipeline(
             },
         )
 
-    save_manifest(manifest_file, existing_ids)
+    workers = max(1, min(concurrency or config.persona_concurrency, desired_profiles))
+    try:
+        if workers == 1:
+            for _ in range(desired_profiles):
+                _accept(orchestrator.assemble_persona(bundle))
+        else:
+            with closing(_assemble_concurrently(orchestrator, bundle, desired_profiles, workers)) as results:
+                for assembled in results:
+                    _accept(assembled)
+    finally:
+        index.flush()
+        save_manifest(manifest_file, existing_ids)
+
     telemetry.log_event(
         "profiles_pipeline_completed",
         {
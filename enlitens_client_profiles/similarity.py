@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -76,15 +77,32 @@ class SimilarityReport:
 
 
 class SimilarityIndex:
-    """Persistent index of persona vectors to enforce uniqueness."""
+    """Persistent index of persona vectors to enforce uniqueness.
+
+    Vectors live in a float32 ``.npy`` matrix next to ``index_path`` (memory-mapped
+    on load) while ``index_path`` holds the id table and attribute vocabulary.
+    Attribute sets are kept as rows of a boolean membership matrix so cosine and
+    Jaccard against every stored profile are computed in a single pass. New
+    vectors go into an in-memory buffer whose capacity doubles as it fills, so
+    registering one profile does not copy the whole matrix. Writes are buffered
+    and flushed every ``flush_every`` registrations or via :meth:`flush`.
+    """
 
     _embedding_model: Optional[SentenceTransformer] = None
     _embedding_model_name = "sentence-transformers/all-MiniLM-L6-v2"
 
-    def __init__(self, index_path: Path) -> None:
+    def __init__(self, index_path: Path, flush_every: int = 25) -> None:
         self.index_path = index_path
-        self.vectors: Dict[str, List[float]] = {}
-        self.attribute_sets: Dict[str, List[str]] = {}
+        self.vectors_path = index_path.with_suffix(".npy")
+        self.flush_every = max(1, flush_every)
+        self.profile_ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._matrix: np.ndarray = np.zeros((0, 0), dtype=np.float32)
+        self._buffer: Optional[np.ndarray] = None
+        self._attribute_vocab: Dict[str, int] = {}
+        self._attribute_rows: List[List[int]] = []
+        self._attribute_matrix: Optional[np.ndarray] = None
+        self._pending_writes = 0
         self._load()
 
     @classmethod
@@ -95,70 +113,199 @@ class SimilarityIndex:
 
     @classmethod
     def _embed(cls, text: str) -> np.ndarray:
+        return cls._embed_many([text])[0]
+
+    @classmethod
+    def _embed_many(cls, texts: List[str]) -> np.ndarray:
         model = cls._load_model()
-        embedding = model.encode([text], normalize_embeddings=True, show_progress_bar=False)
-        return embedding[0]
+        embeddings = model.encode(texts, normalize_embeddings=True, show_progress_bar=False)
+        return np.asarray(embeddings, dtype=np.float32).reshape(len(texts), -1)
 
     def _load(self) -> None:
         if not self.index_path.exists():
             return
         try:
             payload = json.loads(self.index_path.read_text(encoding="utf-8"))
-            self.vectors = {k: list(map(float, v)) for k, v in payload.get("vectors", {}).items()}
-            self.attribute_sets = {k: list(v) for k, v in payload.get("attributes", {}).items()}
         except Exception:
-            self.vectors = {}
-            self.attribute_sets = {}
+            return
+
+        if "vectors" in payload:
+            self._load_legacy(payload)
+            return
+
+        try:
+            ids = [str(item) for item in payload.get("ids", [])]
+            matrix = np.load(self.vectors_path, mmap_mode="r") if ids else np.zeros((0, 0), dtype=np.float32)
+            if matrix.shape[0] != len(ids):
+                raise ValueError("vector table does not match id table")
+        except Exception:
+            return
+
+        self.profile_ids = ids
+        self._rows = {profile_id: row for row, profile_id in enumerate(ids)}
+        self._matrix = matrix
+        self._attribute_vocab = {str(tag): col for col, tag in enumerate(payload.get("attribute_vocab", []))}
+        self._attribute_rows = [list(map(int, row)) for row in payload.get("attribute_rows", [])]
+        if len(self._attribute_rows) != len(ids):
+            self._attribute_rows = [[] for _ in ids]
+
+    def _load_legacy(self, payload: Dict[str, Any]) -> None:
+        """Migrate the JSON-vector index format to the binary layout."""
+
+        vectors = payload.get("vectors", {}) or {}
+        attributes = payload.get("attributes", {}) or {}
+        if not vectors:
+            return
+        ids = list(vectors.keys())
+        self.profile_ids = ids
+        self._rows = {profile_id: row for row, profile_id in enumerate(ids)}
+        self._matrix = np.asarray([vectors[profile_id] for profile_id in ids], dtype=np.float32)
+        self._attribute_rows = [self._encode_attributes(attributes.get(profile_id, [])) for profile_id in ids]
+        self._persist()
+
+    def _encode_attributes(self, attributes: Iterable[str]) -> List[int]:
+        columns = []
+        for tag in set(attributes):
+            if tag not in self._attribute_vocab:
+                self._attribute_vocab[tag] = len(self._attribute_vocab)
+                self._attribute_matrix = None
+            columns.append(self._attribute_vocab[tag])
+        return sorted(columns)
+
+    def _attributes_matrix(self) -> np.ndarray:
+        if self._attribute_matrix is None or self._attribute_matrix.shape != (len(self.profile_ids), len(self._attribute_vocab)):
+            matrix = np.zeros((len(self.profile_ids), len(self._attribute_vocab)), dtype=bool)
+            for row, columns in enumerate(self._attribute_rows):
+                matrix[row, columns] = True
+            self._attribute_matrix = matrix
+        return self._attribute_matrix
 
     def _persist(self) -> None:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        vocab = sorted(self._attribute_vocab, key=self._attribute_vocab.__getitem__)
         payload = {
-            "vectors": self.vectors,
-            "attributes": self.attribute_sets,
+            "format": 2,
+            "ids": self.profile_ids,
+            "attribute_vocab": vocab,
+            "attribute_rows": self._attribute_rows,
+        }
+
+        tmp_vectors = self.vectors_path.with_suffix(".tmp.npy")
+        np.save(tmp_vectors, np.ascontiguousarray(self._matrix, dtype=np.float32))
+        os.replace(tmp_vectors, self.vectors_path)
+        tmp_index = self.index_path.with_suffix(self.index_path.suffix + ".tmp")
+        tmp_index.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_index, self.index_path)
+
+        if self.profile_ids and self._buffer is None:
+            self._matrix = np.load(self.vectors_path, mmap_mode="r")
+        self._pending_writes = 0
+
+    def flush(self) -> None:
+        """Write buffered registrations to disk."""
+
+        if self._pending_writes:
+            self._persist()
+
+    @property
+    def attribute_sets(self) -> Dict[str, List[str]]:
+        vocab = sorted(self._attribute_vocab, key=self._attribute_vocab.__getitem__)
+        return {
+            profile_id: [vocab[col] for col in self._attribute_rows[row]]
+            for profile_id, row in self._rows.items()
         }
-        self.index_path.parent.mkdir(parents=True, exist_ok=True)
-        self.index_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
     def has(self, profile_id: str) -> bool:
-        return profile_id in self.vectors
+        return profile_id in self._rows
+
+    def _reserve(self, rows: int, dimension: int) -> np.ndarray:
+        """Return the writable vector buffer with room for ``rows`` rows, doubling its capacity as needed."""
+        if self._buffer is None or self._buffer.shape[0] < rows:
+            current = 0 if self._buffer is None else self._buffer.shape[0]
+            grown = np.empty((max(rows, 2 * current, 16), dimension), dtype=np.float32)
+            if self._matrix.size:
+                grown[: len(self.profile_ids)] = self._matrix[: len(self.profile_ids)]
+            self._buffer = grown
+        return self._buffer
+
+    def _add_rows(self, profile_ids: List[str], vectors: np.ndarray, attribute_sets: List[List[str]]) -> None:
+        if self._matrix.size and self._matrix.shape[1] != vectors.shape[1]:
+            raise ValueError("Embedding dimension does not match the stored similarity index")
+
+        added = len({profile_id for profile_id in profile_ids if profile_id not in self._rows})
+        buffer = self._reserve(len(self.profile_ids) + added, vectors.shape[1])
+        for profile_id, vector, attributes in zip(profile_ids, vectors, attribute_sets):
+            encoded = self._encode_attributes(attributes)
+            row = self._rows.get(profile_id)
+            if row is None:
+                row = len(self.profile_ids)
+                self._rows[profile_id] = row
+                self.profile_ids.append(profile_id)
+                self._attribute_rows.append(encoded)
+            else:
+                self._attribute_rows[row] = encoded
+            buffer[row] = vector
+        self._matrix = buffer[: len(self.profile_ids)]
+        self._attribute_matrix = None
+        self._pending_writes += len(profile_ids)
 
     def register(self, document: ClientProfileDocument, persist: bool = True) -> None:
-        corpus = build_corpus(document)
-        vector = self._embed(corpus)
-        self.vectors[document.meta.profile_id] = vector.tolist()
-        self.attribute_sets[document.meta.profile_id] = document.attribute_set()
-        if persist:
+        """Add ``document`` to the index; see :meth:`register_many` for ``persist``."""
+        self.register_many([document], persist=persist)
+
+    def register_many(self, documents: Iterable[ClientProfileDocument], persist: bool = True) -> None:
+        """Embed ``documents`` in one encoder call and add them to the index.
+
+        With ``persist=True`` the index is written once ``flush_every``
+        registrations are pending, not on every call; call :meth:`flush` (as
+        ``run_profile_pipeline`` does when it finishes) to write the rest.
+        ``persist=False`` never writes.
+        """
+
+        docs = list(documents)
+        if not docs:
+            return
+        vectors = self._embed_many([build_corpus(document) for document in docs])
+        self._add_rows(
+            [document.meta.profile_id for document in docs],
+            vectors,
+            [document.attribute_set() for document in docs],
+        )
+        if persist and self._pending_writes >= self.flush_every:
             self._persist()
 
     def evaluate(self, document: ClientProfileDocument) -> SimilarityReport:
-        if not self.vectors:
+        if not self.profile_ids:
             return SimilarityReport(profile_id=None, cosine=0.0, jaccard=0.0)
 
         candidate_vector = self._embed(build_corpus(document))
-        candidate_attributes = document.attribute_set()
-
-        best_cosine = 0.0
-        best_jaccard = 0.0
-        best_profile: Optional[str] = None
-
-        for profile_id, vector in self.vectors.items():
-            stored = np.asarray(vector, dtype=np.float32)
-            cosine = float(np.dot(candidate_vector, stored))
-            jaccard = _jaccard_similarity(candidate_attributes, self.attribute_sets.get(profile_id, []))
-            score = max(cosine, jaccard)
-            if score > max(best_cosine, best_jaccard):
-                best_cosine = cosine
-                best_jaccard = jaccard
-                best_profile = profile_id
-
-        return SimilarityReport(profile_id=best_profile, cosine=best_cosine, jaccard=best_jaccard)
+        cosines = np.asarray(self._matrix, dtype=np.float32) @ candidate_vector
+
+        candidate_attributes = set(document.attribute_set())
+        jaccards = np.zeros(len(self.profile_ids), dtype=np.float32)
+        if candidate_attributes:
+            attribute_matrix = self._attributes_matrix()
+            columns = [self._attribute_vocab[tag] for tag in candidate_attributes if tag in self._attribute_vocab]
+            intersection = attribute_matrix[:, columns].sum(axis=1) if columns else 0
+            row_sizes = attribute_matrix.sum(axis=1)
+            union = row_sizes + len(candidate_attributes) - intersection
+            with np.errstate(divide="ignore", invalid="ignore"):
+                jaccards = np.where(row_sizes > 0, intersection / np.maximum(union, 1), 0.0)
+
+        scores = np.maximum(cosines, jaccards)
+        best = int(np.argmax(scores))
+        if scores[best] <= 0.0:
+            return SimilarityReport(profile_id=None, cosine=0.0, jaccard=0.0)
+        return SimilarityReport(
+            profile_id=self.profile_ids[best],
+            cosine=float(cosines[best]),
+            jaccard=float(jaccards[best]),
+        )
 
     def register_existing_if_needed(self, documents: Iterable[ClientProfileDocument]) -> None:
-        updated = False
-        for document in documents:
-            if not self.has(document.meta.profile_id):
-                self.register(document, persist=False)
-                updated = True
-        if updated:
+        missing = [document for document in documents if not self.has(document.meta.profile_id)]
+        if missing:
+            self.register_many(missing, persist=False)
             self._persist()
 
 
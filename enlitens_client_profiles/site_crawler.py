@@ -1,28 +1,70 @@
-"""Minimal site crawler for enlitens.com to prime persona prompts."""
+"""Minimal site crawler for enlitens.com to prime persona prompts.
+
+In incremental mode pages are cached by URL together with their ``ETag`` /
+``Last-Modified`` validators. Refreshes send conditional requests and reuse the
+cached parse on ``304 Not Modified``. Fetches run concurrently, with a cap on
+requests in flight per host and a minimum gap between request starts.
+"""
 
 from __future__ import annotations
 
 from collections import deque
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Optional, Sequence, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set
+from urllib.parse import urlparse
 
 import httpx
 from bs4 import BeautifulSoup
 
+from src.utils.artifact_cache import ArtifactCache
+
+DEFAULT_PER_HOST_LIMIT = int(os.environ.get("ENLITENS_SITE_CRAWL_PER_HOST", "4"))
+DEFAULT_REQUEST_INTERVAL = float(os.environ.get("ENLITENS_SITE_CRAWL_INTERVAL", "0.1"))
+
+PAGE_NAMESPACE = "pages"
+DOCUMENT_NAMESPACE = "documents"
+
 
 class SiteCrawler:
-    def __init__(self, base_url: str, *, limit: int = 50, cache_dir: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        limit: int = 50,
+        cache_dir: Optional[Path] = None,
+        incremental: bool = False,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+        request_interval: float = DEFAULT_REQUEST_INTERVAL,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self.limit = limit
         self.visited: Set[str] = set()
         self.cache_dir = cache_dir
         if self.cache_dir:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.incremental = incremental
+        self.per_host_limit = max(1, per_host_limit)
+        self.request_interval = max(0.0, request_interval)
+        self.cache = ArtifactCache(root=cache_dir) if cache_dir and incremental else ArtifactCache(enabled=False)
+        self.stats = {"fetched": 0, "not_modified": 0, "failed": 0}
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    def _client(self) -> httpx.Client:
+        return httpx.Client(timeout=12.0, headers={"User-Agent": "EnlitensPersonaCrawler/1.1"})
 
     def crawl(self, *, urls: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, object]]:
+        if self.incremental:
+            return self._crawl_incremental(urls)
+
         pages: Dict[str, Dict[str, object]] = {}
-        client = httpx.Client(timeout=12.0, headers={"User-Agent": "EnlitensPersonaCrawler/1.1"})
+        client = self._client()
 
         try:
             if urls:
@@ -67,21 +109,26 @@ class SiteCrawler:
         except Exception:
             return None
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        title_tag = soup.find("title")
-        headings = [h.get_text(strip=True) for h in soup.find_all(["h1", "h2", "h3"]) if h.get_text(strip=True)]
-        text = soup.get_text(separator=" ")
-        flattened = " ".join(text.split())
-        header_summary = " | ".join(headings[:5])
-        summary = f"{title_tag.get_text(strip=True) if title_tag else ''}\n{header_summary}\n\n{flattened}".strip()
+        payload = self._parse_page(response.text)
 
         if self.cache_dir:
             cache_file = self.cache_dir / f"{len(self.visited)}.txt"
             try:
-                cache_file.write_text(summary, encoding="utf-8")
+                cache_file.write_text(str(payload["summary"]), encoding="utf-8")
             except Exception:
                 pass
 
+        return payload
+
+    def _parse_page(self, html: str) -> Dict[str, object]:
+        soup = BeautifulSoup(html, "html.parser")
+        title_tag = soup.find("title")
+        headings = [h.get_text(strip=True) for h in soup.find_all(["h1", "h2", "h3"]) if h.get_text(strip=True)]
+        text = soup.get_text(separator=" ")
+        flattened = " ".join(text.split())
+        header_summary = " | ".join(headings[:5])
+        summary = f"{title_tag.get_text(strip=True) if title_tag else ''}\n{header_summary}\n\n{flattened}".strip()
+
         links: Set[str] = set()
         for link in soup.find_all("a", href=True):
             href = link["href"].split("#")[0]
@@ -92,7 +139,111 @@ class SiteCrawler:
             elif href.startswith("/"):
                 links.add(self.base_url + href)
 
-        return {"title": title_tag.get_text(strip=True) if title_tag else "", "headings": headings, "summary": summary, "links": list(links)}
+        return {"title": title_tag.get_text(strip=True) if title_tag else "", "headings": headings, "summary": summary, "links": sorted(links)}
+
+    # --- Incremental mode ------------------------------------------------------------------
+
+    def _crawl_incremental(self, urls: Optional[Sequence[str]]) -> Dict[str, Dict[str, object]]:
+        """Fetch ``urls`` (or crawl breadth-first from the base URL) in concurrent batches."""
+        pages: Dict[str, Dict[str, object]] = {}
+        # Every call re-checks its pages; unchanged ones cost a 304 each. The
+        # home page is keyed as base_url + "/" so links to "/" match it.
+        pending = list(dict.fromkeys(urls or [self.base_url + "/"]))
+        if urls:
+            pending = pending[: self.limit]
+        seen = set(pending)
+        with self._client() as client:
+            while pending and len(pages) < self.limit:
+                batch = pending[: self.limit - len(pages)]
+                pending = pending[len(batch):]
+                self.visited.update(batch)
+                for url, payload in zip(batch, self._fetch_all(client, batch, self._fetch_page)):
+                    if not payload:
+                        continue
+                    pages[url] = payload
+                    if urls:
+                        continue
+                    for link in payload.get("links", []):
+                        if link.startswith(self.base_url) and link not in seen:
+                            seen.add(link)
+                            pending.append(link)
+        return self._finalise_pages(pages)
+
+    def fetch_documents(self, urls: Sequence[str]) -> Dict[str, str]:
+        """Fetch raw bodies (e.g. sitemaps) with the same conditional cache; failures are omitted."""
+        with self._client() as client:
+            bodies = self._fetch_all(client, list(urls), self._fetch_document)
+        return {url: body for url, body in zip(urls, bodies) if body is not None}
+
+    def _fetch_all(self, client: httpx.Client, urls: List[str], fetch: Callable[[httpx.Client, str], Any]) -> List[Any]:
+        if len(urls) <= 1:
+            return [fetch(client, url) for url in urls]
+        hosts = {urlparse(url).netloc for url in urls}
+        workers = min(len(urls), self.per_host_limit * len(hosts))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crawler") as executor:
+            return list(executor.map(lambda url: fetch(client, url), urls))
+
+    @contextmanager
+    def _host_slot(self, url: str) -> Iterator[None]:
+        """Hold one of the host's request slots, spacing request starts by ``request_interval``."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            slot = self._host_slots.setdefault(host, threading.Semaphore(self.per_host_limit))
+        with slot:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start.get(host, 0.0))
+                self._next_start[host] = start + self.request_interval
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+    def _conditional_get(
+        self,
+        client: httpx.Client,
+        url: str,
+        namespace: str,
+        build: Callable[[httpx.Response], Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """Return the cached entry on ``304``, else ``build(response)`` stored with its validators."""
+        cached = self.cache.get(namespace, url)
+        headers: Dict[str, str] = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        try:
+            with self._host_slot(url):
+                response = client.get(url, headers=headers)
+            if response.status_code == 304 and cached:
+                with self._lock:
+                    self.stats["not_modified"] += 1
+                return cached
+            response.raise_for_status()
+        except Exception:
+            with self._lock:
+                self.stats["failed"] += 1
+            return None
+
+        entry = build(response)
+        entry["etag"] = response.headers.get("etag")
+        entry["last_modified"] = response.headers.get("last-modified")
+        if entry["etag"] or entry["last_modified"]:
+            self.cache.set(namespace, entry, url)
+        with self._lock:
+            self.stats["fetched"] += 1
+        return entry
+
+    def _fetch_page(self, client: httpx.Client, url: str) -> Optional[Dict[str, object]]:
+        entry = self._conditional_get(client, url, PAGE_NAMESPACE, lambda response: self._parse_page(response.text))
+        if entry is None:
+            return None
+        return {key: entry[key] for key in ("title", "headings", "summary", "links")}
+
+    def _fetch_document(self, client: httpx.Client, url: str) -> Optional[str]:
+        entry = self._conditional_get(client, url, DOCUMENT_NAMESPACE, lambda response: {"text": response.text})
+        return entry["text"] if entry is not None else None
 
     def _finalise_pages(self, pages: Dict[str, Dict[str, object]]) -> Dict[str, Dict[str, object]]:
         for value in pages.values():
@@ -23,7 +23,7 @@ from src.graph.neo4j_publisher import Neo4jPublisher  # noqa: E402
 from src.pipeline.document_pipeline import process_pdf_document  # noqa: E402
 from src.persistence.postgres_store import PostgresStore  # noqa: E402
 from src.persistence.vector_mirror import VectorMirror  # noqa: E402
-from src.utils.jsonl_store import append_jsonl_record  # noqa: E402
+from src.utils.jsonl_store import JsonlLedger  # noqa: E402
 from src.utils.llm_client import LLMClient  # noqa: E402
 from src.utils.local_model_manager import LocalModelManager  # noqa: E402
 
@@ -128,6 +128,7 @@ def ingest_batch(args: argparse.Namespace) -> Tuple[int, int]:
     postgres_store = PostgresStore()
     vector_mirror = VectorMirror()
     graph_publisher = Neo4jPublisher()
+    ledger = JsonlLedger(ledger_path, mirror_path=mirror_path)
 
     if args.auto_start:
         manager.start(args.model)
@@ -151,11 +152,7 @@ def ingest_batch(args: argparse.Namespace) -> Tuple[int, int]:
                     force_extraction=args.force_extraction,
                     run_gemini=not args.skip_gemini,
                 )
-                append_jsonl_record(
-                    record,
-                    ledger_path=ledger_path,
-                    mirror_path=mirror_path,
-                )
+                ledger.append(record)
                 if postgres_store.available:
                     try:
                         postgres_store.upsert_record(record)
@@ -166,6 +163,9 @@ def ingest_batch(args: argparse.Namespace) -> Tuple[int, int]:
                             db_exc,
                         )
                 vector_mirror.mirror(record)
+                # The ledger line must be durable before the PDF leaves the input
+                # directory, or a crash here would skip it without a record
+                ledger.flush()
                 new_location = move_file(pdf_path, processed_dir)
                 logger.info("✅ Stored %s and moved PDF to %s", record["document_id"], new_location)
                 graph_publisher.publish_document(record)
@@ -179,6 +179,7 @@ def ingest_batch(args: argparse.Namespace) -> Tuple[int, int]:
     finally:
         if args.auto_stop:
             manager.stop(args.model)
+        ledger.close()
         graph_publisher.close()
 
 
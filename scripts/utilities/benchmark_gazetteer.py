@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for intake locality and keyword scanning.
+
+Builds a deterministic synthetic intake set and times two ways of producing
+the per-intake locality hits and keyword tokens used by ingestion and the
+knowledge graph build:
+
+* ``substring`` – the previous approach: lower-case each intake, test every
+  municipality with ``in``, then tokenise the intake twice for keywords
+* ``gazetteer`` – one ``Gazetteer.scan`` per intake (Aho-Corasick over word
+  tokens) whose tokens are reused for keywords
+
+Both are run against the St. Louis municipality list and against that list
+padded with ``--extra-phrases`` synthetic keyword phrases, to show how each
+scales with the number of patterns. The report also counts substring hits
+that are not whole-word matches (e.g. "Shaw" inside "Shawnee").
+
+    python scripts/utilities/benchmark_gazetteer.py --records 50000
+    python scripts/utilities/benchmark_gazetteer.py --records 50000 --output gazetteer.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from enlitens_client_profiles.gazetteer import Gazetteer  # noqa: E402
+from enlitens_client_profiles.stl_geography import STL_REGION_DATA  # noqa: E402
+
+_TOKEN_SPLIT = re.compile(r"[^a-zA-Z0-9']+")
+_STOPWORDS = {"the", "and", "with", "that", "from", "this", "have", "they", "their", "about", "just", "like"}
+
+_VOCABULARY = (
+    "i feel overwhelmed at work and my son struggles with school routines sensory overload "
+    "after long days masking burnout anxiety adhd autism diagnosis therapy sleep focus "
+    "commute traffic appointments insurance waitlist support partner parent teacher"
+).split()
+# Words that contain a municipality name without being one
+_DISTRACTORS = ["Shawnee", "Arnoldsville", "Altona", "Festuses", "Shilohs", "Lemaysburg", "Affton-ish"]
+
+
+# ----------------------------------------------------------------------
+# Synthetic intakes
+# ----------------------------------------------------------------------
+def build_intakes(records: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    places = STL_REGION_DATA.all_municipalities
+    intakes = []
+    for _ in range(records):
+        words = [rng.choice(_VOCABULARY) for _ in range(rng.randint(30, 70))]
+        for _ in range(rng.randint(0, 2)):
+            words.insert(rng.randrange(len(words)), rng.choice(places))
+        if rng.random() < 0.2:
+            words.insert(rng.randrange(len(words)), rng.choice(_DISTRACTORS))
+        intakes.append(" ".join(words).capitalize() + ".")
+    return intakes
+
+
+def extra_phrases(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed + 1)
+    return [f"{rng.choice(_VOCABULARY)} {rng.choice(_VOCABULARY)} term{idx}" for idx in range(count)]
+
+
+# ----------------------------------------------------------------------
+# Scanners
+# ----------------------------------------------------------------------
+def _legacy_keywords(text: str) -> List[str]:
+    return [token for token in _TOKEN_SPLIT.split(text.lower()) if token and len(token) >= 3 and token not in _STOPWORDS]
+
+
+def scan_substring(intakes: List[str], phrases: List[str]) -> Dict[str, Any]:
+    lowered_phrases = {phrase.lower(): phrase for phrase in phrases}
+    counts: Counter[str] = Counter()
+    keywords: Counter[str] = Counter()
+    for text in intakes:
+        lowered = text.lower()
+        for phrase_lower, phrase in lowered_phrases.items():
+            if phrase_lower in lowered:
+                counts[phrase] += 1
+        set(_legacy_keywords(text))  # graph edges
+        keywords.update(_legacy_keywords(text))  # top keywords
+    return {"counts": counts, "keywords": keywords}
+
+
+def scan_gazetteer(intakes: List[str], gazetteer: Gazetteer) -> Dict[str, Any]:
+    counts: Counter[str] = Counter()
+    keywords: Counter[str] = Counter()
+    for text in intakes:
+        tokens, hits = gazetteer.scan(text)
+        counts.update({hit.label for hit in hits})
+        keywords.update(token for token in tokens if len(token) >= 3 and token not in _STOPWORDS)
+    return {"counts": counts, "keywords": keywords}
+
+
+def _timed(call) -> tuple:
+    started = time.perf_counter()
+    result = call()
+    return result, time.perf_counter() - started
+
+
+def run(records: int, extra: int, seed: int) -> Dict[str, Any]:
+    intakes = build_intakes(records, seed)
+    places = STL_REGION_DATA.all_municipalities
+    report: Dict[str, Any] = {
+        "records": records,
+        "characters": sum(len(text) for text in intakes),
+        "python": platform.python_version(),
+        "pattern_sets": {},
+    }
+
+    for name, phrases in (("municipalities", places), ("municipalities+keywords", places + extra_phrases(extra, seed))):
+        gazetteer, compile_seconds = _timed(lambda: Gazetteer(phrases))
+        legacy, legacy_seconds = _timed(lambda: scan_substring(intakes, phrases))
+        compiled, compiled_seconds = _timed(lambda: scan_gazetteer(intakes, gazetteer))
+        false_hits = {
+            phrase: legacy["counts"][phrase] - compiled["counts"][phrase]
+            for phrase in legacy["counts"]
+            if legacy["counts"][phrase] > compiled["counts"][phrase]
+        }
+        report["pattern_sets"][name] = {
+            "patterns": len(phrases),
+            "compile_seconds": round(compile_seconds, 4),
+            "substring_seconds": round(legacy_seconds, 3),
+            "gazetteer_seconds": round(compiled_seconds, 3),
+            "speedup": round(legacy_seconds / compiled_seconds, 2) if compiled_seconds else None,
+            "substring_records_per_second": round(records / legacy_seconds),
+            "gazetteer_records_per_second": round(records / compiled_seconds),
+            "substring_only_hits": false_hits,
+            "keywords_identical": legacy["keywords"] == compiled["keywords"],
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=50_000, help="Synthetic intakes to scan (default 50k)")
+    parser.add_argument("--extra-phrases", type=int, default=2_000, help="Synthetic keyword phrases added to the second run")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here as well")
+    args = parser.parse_args()
+
+    report = run(args.records, args.extra_phrases, args.seed)
+    rendered = json.dumps(report, indent=2)
+    print(rendered)
+    if args.output:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Count statements and round-trips per document for the Postgres loaders.
+
+Runs ``PostgresStore.upsert_record`` (a one-document transaction per call)
+against ``PostgresStore.upsert_records`` (one transaction per batch, binary
+COPY for documents and sections) using an in-process stand-in for the
+database, so no server is needed. A second bulk pass replays the same corpus to show section rewrites
+being skipped when checksums are unchanged.
+
+    python scripts/utilities/benchmark_postgres_loader.py --documents 1000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.persistence.postgres_store import PostgresStore, section_checksum  # noqa: E402
+
+
+class StandInServer:
+    """Records what a client sends; answers the checksum lookup from memory."""
+
+    def __init__(self) -> None:
+        self.checksums: Dict[str, str] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.round_trips = 0
+        self.copy_bytes = 0
+
+
+class StandInCursor:
+    def __init__(self, server: StandInServer, connection: "StandInConnection") -> None:
+        self.server = server
+        self.connection = connection
+        self._rows: List[Any] = []
+
+    def _begin(self) -> None:
+        # psycopg2 sends BEGIN ahead of the first statement of a transaction.
+        if not self.connection.autocommit and not self.connection.in_transaction:
+            self.connection.in_transaction = True
+            self.server.statements += 1
+
+    def execute(self, sql: Any, params: Optional[Sequence[Any]] = None) -> None:
+        self._begin()
+        self.server.statements += 1
+        self.server.round_trips += 1
+        text = sql.decode("utf-8") if isinstance(sql, bytes) else sql
+        self._rows = []
+        if "SELECT document_id, sections_sha256" in text and params:
+            self._rows = [(doc_id, self.server.checksums[doc_id]) for doc_id in params[0] if doc_id in self.server.checksums]
+
+    def copy_expert(self, sql: str, stream: Any) -> None:
+        self._begin()
+        self.server.statements += 1
+        self.server.round_trips += 1
+        self.server.copy_bytes += len(stream.read())
+
+    def fetchall(self) -> List[Any]:
+        return list(self._rows)
+
+    def close(self) -> None:
+        pass
+
+
+class StandInConnection:
+    encoding = "UTF8"
+
+    def __init__(self, server: StandInServer) -> None:
+        self.server = server
+        self.closed = 0
+        self.autocommit = True
+        self.in_transaction = False
+
+    def set_isolation_level(self, level: int) -> None:
+        self.autocommit = True
+
+    def cursor(self) -> StandInCursor:
+        return StandInCursor(self.server, self)
+
+    def commit(self) -> None:
+        if self.in_transaction:
+            self.server.statements += 1
+            self.server.round_trips += 1
+        self.in_transaction = False
+
+    def rollback(self) -> None:
+        self.in_transaction = False
+
+
+class StandInEmbeddings:
+    dimension = 384
+
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        return [[float(len(text) % 7)] * self.dimension for text in texts]
+
+    def embed_one(self, text: str) -> Optional[List[float]]:
+        return self.embed([text])[0]
+
+
+def synthetic_records(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "document_id": f"doc-{idx:06d}",
+            "model_key": "benchmark",
+            "metadata": {"title": f"Document {idx}", "tags": ["adhd", "sensory"]},
+            "source": {"pdf_path": f"/corpus/{idx}.pdf", "checksum_sha256": f"{idx:064x}"},
+            "extraction": {
+                "background": f"Background for document {idx}.",
+                "methods": f"Methods for document {idx}.",
+                "findings": f"Findings for document {idx}.",
+                "limitations": f"Limitations for document {idx}.",
+            },
+        }
+        for idx in range(count)
+    ]
+
+
+def _report(label: str, server: StandInServer, documents: int, elapsed: float) -> None:
+    print(
+        f"{label:<24} statements/doc={server.statements / documents:6.2f} "
+        f"round-trips/doc={server.round_trips / documents:6.2f} "
+        f"copy-bytes={server.copy_bytes:>10} client-time={elapsed * 1000:8.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    os.environ["ENLITENS_ENABLE_POSTGRES"] = "1"
+    server = StandInServer()
+    store = PostgresStore(
+        embedding_provider=StandInEmbeddings(),  # type: ignore[arg-type]
+        connection_factory=lambda: StandInConnection(server),
+    )
+    if not store.available:
+        raise SystemExit("PostgresStore unavailable (is psycopg2 installed?)")
+    records = synthetic_records(args.documents)
+
+    server.reset()
+    started = time.perf_counter()
+    for record in records:
+        store.upsert_record(record)
+    _report("upsert_record loop", server, args.documents, time.perf_counter() - started)
+
+    server.reset()
+    started = time.perf_counter()
+    store.upsert_records(records, batch_size=args.batch_size)
+    _report("upsert_records (cold)", server, args.documents, time.perf_counter() - started)
+
+    for payload in map(store._build_payload, records):
+        server.checksums[payload.document_id] = section_checksum(payload.section_payloads)
+    server.reset()
+    started = time.perf_counter()
+    stats = store.upsert_records(records, batch_size=args.batch_size)
+    _report("upsert_records (warm)", server, args.documents, time.perf_counter() - started)
+    print(f"warm pass skipped section rewrites for {stats['documents_skipped_sections']} documents")
+
+
+if __name__ == "__main__":
+    main()
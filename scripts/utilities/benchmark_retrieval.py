@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for the retrieval and ingestion hot paths.
+
+Builds a deterministic synthetic corpus and times, per call:
+
+* ``chunk``            – ``DocumentChunker.chunk`` per document
+* ``upsert``           – ``QdrantVectorStore.upsert`` (in-memory store) per document
+* ``search``           – ``QdrantVectorStore.search`` (local fallback) per query
+* ``hybrid_retrieve``  – ``HybridRetriever.retrieve`` (dense + BM25, no reranker) per query
+* ``ingest_document``  – ``EmbeddingIngestionPipeline.ingest_document`` per document
+
+Embeddings come from ``HashingSentenceTransformer`` so nothing is downloaded
+and no GPU is needed. Each stage runs in its own forked process so the
+reported peak RSS belongs to that stage. Within that process the stage is run
+``--warmup`` times untimed (imports, allocator and cache warm-up), then
+``--repeats`` times; each reported metric is the median across repeats.
+Results are written as JSON and can be compared against a saved baseline:
+
+    python scripts/utilities/benchmark_retrieval.py --documents 200 --output bench.json
+    python scripts/utilities/benchmark_retrieval.py --documents 200 --baseline bench.json
+
+The comparison exits with status 1 when any stage's p50/p95 latency grows,
+or its throughput drops, by more than ``--threshold`` (default 15%). Latency
+changes smaller than ``--min-delta-ms`` (default 0.05 ms) are ignored so that
+sub-millisecond stages do not flag timer noise.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import platform
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore
+
+STAGES = ("chunk", "upsert", "search", "hybrid_retrieve", "ingest_document")
+
+_VOCABULARY = (
+    "adhd autism sensory executive function dopamine attention regulation burnout masking "
+    "interoception anxiety trauma nervous system prefrontal cortex working memory hyperfocus "
+    "accommodation diagnosis assessment therapy clinician neurodivergent strengths routine "
+    "sleep motivation reward cortisol inflammation school workplace parent adolescent adult "
+    "meta analysis randomized cohort sample participants findings limitations methods"
+).split()
+
+
+# ----------------------------------------------------------------------
+# Synthetic corpus
+# ----------------------------------------------------------------------
+def build_corpus(documents: int, paragraphs: int, queries: int, seed: int) -> Dict[str, Any]:
+    rng = random.Random(seed)
+
+    def sentence() -> str:
+        words = [rng.choice(_VOCABULARY) for _ in range(rng.randint(8, 22))]
+        return " ".join(words).capitalize() + "."
+
+    corpus = []
+    for idx in range(documents):
+        body = "\n\n".join(
+            " ".join(sentence() for _ in range(rng.randint(3, 7))) for _ in range(paragraphs)
+        )
+        corpus.append({"document_id": f"bench-{idx:05d}", "text": f"# Document {idx}\n\n{body}"})
+    query_texts = [" ".join(rng.choice(_VOCABULARY) for _ in range(rng.randint(3, 8))) for _ in range(queries)]
+    return {"documents": corpus, "queries": query_texts}
+
+
+# ----------------------------------------------------------------------
+# Stage runners (executed inside a worker process)
+# ----------------------------------------------------------------------
+def _timed(calls: List[Callable[[], Any]]) -> List[float]:
+    durations = []
+    for call in calls:
+        started = time.perf_counter()
+        call()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def _new_store():
+    from src.retrieval.vector_store import QdrantVectorStore
+
+    return QdrantVectorStore(collection_name="benchmark", embedding_model_name="hash", local_only=True)
+
+
+def _chunk_all(corpus: Dict[str, Any]) -> List[List[Dict[str, Any]]]:
+    from src.retrieval.chunker import DocumentChunker
+
+    chunker = DocumentChunker()
+    return [
+        [
+            {**chunk, "metadata": {**chunk["metadata"], "document_id": doc["document_id"]}}
+            for chunk in chunker.chunk(doc["text"], {}, document_id=doc["document_id"])
+        ]
+        for doc in corpus["documents"]
+    ]
+
+
+def _run_stage(stage: str, corpus: Dict[str, Any]) -> Tuple[List[float], int, str]:
+    """Return (per-call durations, items processed, item unit)."""
+    documents = corpus["documents"]
+    queries = corpus["queries"]
+
+    if stage == "chunk":
+        from src.retrieval.chunker import DocumentChunker
+
+        chunker = DocumentChunker()
+        durations = _timed(
+            [lambda doc=doc: chunker.chunk(doc["text"], {}, document_id=doc["document_id"]) for doc in documents]
+        )
+        return durations, sum(len(doc["text"]) for doc in documents), "chars"
+
+    if stage == "upsert":
+        chunk_sets = _chunk_all(corpus)
+        store = _new_store()
+        durations = _timed([lambda chunks=chunks: store.upsert(chunks) for chunks in chunk_sets])
+        return durations, sum(len(chunks) for chunks in chunk_sets), "chunks"
+
+    if stage in {"search", "hybrid_retrieve"}:
+        chunk_sets = _chunk_all(corpus)
+        store = _new_store()
+        for chunks in chunk_sets:
+            store.upsert(chunks)
+        if stage == "search":
+            durations = _timed([lambda query=query: store.search(query, limit=50) for query in queries])
+        else:
+            from src.retrieval.hybrid_retriever import HybridRetriever
+
+            retriever = HybridRetriever(store, enable_reranker=False)
+            retriever.index_chunks([chunk for chunks in chunk_sets for chunk in chunks])
+            durations = _timed([lambda query=query: retriever.retrieve(query) for query in queries])
+        return durations, len(queries), "queries"
+
+    if stage == "ingest_document":
+        from src.retrieval.embedding_ingestion import EmbeddingIngestionPipeline
+
+        pipeline = EmbeddingIngestionPipeline(vector_store=_new_store())
+        stats: List[Any] = []
+        durations = _timed(
+            [
+                lambda doc=doc: stats.append(pipeline.ingest_document(doc["document_id"], doc["text"]))
+                for doc in documents
+            ]
+        )
+        return durations, sum(stat.chunks_ingested for stat in stats), "chunks"
+
+    raise ValueError(f"Unknown stage: {stage}")
+
+
+def _peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def measure_stage(stage: str, corpus: Dict[str, Any], repeats: int = 1, warmup: int = 0) -> Dict[str, Any]:
+    """Time ``stage`` ``repeats`` times after ``warmup`` untimed runs; metrics are medians across repeats."""
+    import logging
+
+    logging.disable(logging.CRITICAL)
+    for _ in range(max(0, warmup)):
+        _run_stage(stage, corpus)
+
+    runs = []
+    for _ in range(max(1, repeats)):
+        durations, items, unit = _run_stage(stage, corpus)
+        total = sum(durations)
+        runs.append(
+            {
+                "p50_ms": _percentile(durations, 0.50) * 1000,
+                "p95_ms": _percentile(durations, 0.95) * 1000,
+                "mean_ms": statistics.fmean(durations) * 1000 if durations else 0.0,
+                "total_s": total,
+                "throughput": items / total if total else 0.0,
+            }
+        )
+
+    def median(metric: str) -> float:
+        return statistics.median(run[metric] for run in runs)
+
+    return {
+        "calls": len(durations),
+        "repeats": len(runs),
+        "p50_ms": round(median("p50_ms"), 3),
+        "p95_ms": round(median("p95_ms"), 3),
+        "mean_ms": round(median("mean_ms"), 3),
+        "total_s": round(median("total_s"), 4),
+        "throughput": round(median("throughput"), 2),
+        "throughput_unit": f"{unit}/s",
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+# ----------------------------------------------------------------------
+# Baseline comparison
+# ----------------------------------------------------------------------
+def compare_to_baseline(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float,
+    min_delta_ms: float = 0.0,
+) -> List[str]:
+    """Return human-readable regression messages (empty when within threshold).
+
+    A latency regression must exceed both ``threshold`` (relative) and
+    ``min_delta_ms`` (absolute).
+    """
+    regressions: List[str] = []
+    for stage, current in results["stages"].items():
+        previous = baseline.get("stages", {}).get(stage)
+        if not previous:
+            continue
+        for metric in ("p50_ms", "p95_ms"):
+            if (
+                previous[metric]
+                and current[metric] > previous[metric] * (1 + threshold)
+                and current[metric] - previous[metric] > min_delta_ms
+            ):
+                regressions.append(
+                    f"{stage}: {metric} {previous[metric]:.3f} -> {current[metric]:.3f} "
+                    f"(+{(current[metric] / previous[metric] - 1) * 100:.1f}%)"
+                )
+        if previous["throughput"] and current["throughput"] < previous["throughput"] * (1 - threshold):
+            regressions.append(
+                f"{stage}: throughput {previous['throughput']:.2f} -> {current['throughput']:.2f} "
+                f"{current['throughput_unit']} ({(current['throughput'] / previous['throughput'] - 1) * 100:.1f}%)"
+            )
+    if results.get("config") != baseline.get("config"):
+        regressions.insert(0, "warning: corpus configuration differs from the baseline; comparison is approximate")
+    return regressions
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    corpus = build_corpus(args.documents, args.paragraphs, args.queries, args.seed)
+    stages = args.stages or list(STAGES)
+    results: Dict[str, Any] = {
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "config": {
+            "documents": args.documents,
+            "paragraphs": args.paragraphs,
+            "queries": args.queries,
+            "seed": args.seed,
+            "repeats": args.repeats,
+            "warmup": args.warmup,
+        },
+        "environment": {"python": platform.python_version(), "platform": platform.platform()},
+        "stages": {},
+    }
+    context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+    for stage in stages:
+        if args.in_process:
+            results["stages"][stage] = measure_stage(stage, corpus, args.repeats, args.warmup)
+        else:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                results["stages"][stage] = pool.submit(measure_stage, stage, corpus, args.repeats, args.warmup).result()
+        summary = results["stages"][stage]
+        print(
+            f"{stage:<16} p50={summary['p50_ms']:9.3f}ms p95={summary['p95_ms']:9.3f}ms "
+            f"throughput={summary['throughput']:>12.2f} {summary['throughput_unit']:<10} "
+            f"peak_rss={summary['peak_rss_mb']}MB",
+            file=sys.stderr,
+        )
+    return results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=100)
+    parser.add_argument("--paragraphs", type=int, default=30, help="Paragraphs per synthetic document")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=13)
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=None)
+    parser.add_argument("--output", type=Path, default=None, help="Write JSON results here (default: stdout)")
+    parser.add_argument("--baseline", type=Path, default=None, help="Compare against a saved results file")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed fractional regression")
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=0.05, help="Ignore latency changes smaller than this (absolute floor)"
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per stage; metrics are their median")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per stage before timing")
+    parser.add_argument("--in-process", action="store_true", help="Run stages in this process (RSS is cumulative)")
+    args = parser.parse_args(argv)
+
+    results = run(args)
+    payload = json.dumps(results, indent=2)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(results, baseline, args.threshold, args.min_delta_ms)
+        failures = [message for message in regressions if not message.startswith("warning:")]
+        for message in regressions:
+            print(("⚠️ " if message.startswith("warning:") else "❌ REGRESSION ") + message, file=sys.stderr)
+        if failures:
+            return 1
+        print(f"✅ No regressions beyond {args.threshold:.0%} against {args.baseline}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
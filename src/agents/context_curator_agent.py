@@ -5,6 +5,7 @@ Coordinates the 3 pre-processing agents to create optimized context for the main
 
 import logging
 import os
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from src.agents.profile_matcher_agent import ProfileMatcherAgent
@@ -12,6 +13,7 @@ from src.agents.health_report_synthesizer_agent import HealthReportSynthesizerAg
 from src.agents.voice_guide_generator_agent import VoiceGuideGeneratorAgent
 from src.agents.context_verifier_agent import ContextVerificationAgent
 from src.agents.context_review_agent import ContextReviewAgent
+from src.utils.artifact_cache import ArtifactCache, hash_content
 
 try:  # Optional integrations
     from src.integrations.google_maps_context import GoogleMapsContextClient
@@ -25,6 +27,20 @@ except Exception:  # pragma: no cover - defensive import
 
 logger = logging.getLogger(__name__)
 
+# Expiry windows for persisted curation artifacts (seconds; None = never expires).
+ARTIFACT_TTLS: Dict[str, Optional[float]] = {
+    "voice_guide": 30 * 24 * 3600,
+    "health_brief": 7 * 24 * 3600,
+    "maps_lookup": 24 * 3600,
+    "wikimedia_lookup": 7 * 24 * 3600,
+}
+
+# Sentinel outputs from the synthesizer that must never be cached.
+_UNCACHEABLE_HEALTH_BRIEFS = {
+    "No local health context available.",
+    "Health context synthesis unavailable.",
+}
+
 
 class ContextCuratorAgent:
     """
@@ -38,7 +54,9 @@ class ContextCuratorAgent:
         self,
         personas_dir: str = "enlitens_client_profiles/profiles",
         transcripts_path: str = "enlitens_knowledge_base/transcripts.txt",
-        framework_path: str = "enlitens_knowledge_base/enlitens_interview_framework.txt"
+        framework_path: str = "enlitens_knowledge_base/enlitens_interview_framework.txt",
+        artifact_cache: Optional[ArtifactCache] = None,
+        artifact_cache_dir: Optional[str] = None,
     ):
         self.profile_matcher = ProfileMatcherAgent(personas_dir=personas_dir)
         self.health_synthesizer = HealthReportSynthesizerAgent()
@@ -61,6 +79,14 @@ class ContextCuratorAgent:
         
         # Cache voice guide (generated once, reused for all documents)
         self.voice_guide_cache: Optional[str] = None
+
+        # Persistent, content-addressed cache shared across documents and restarts
+        if artifact_cache is None:
+            cache_kwargs: Dict[str, Any] = {"ttl_seconds": dict(ARTIFACT_TTLS)}
+            if artifact_cache_dir:
+                cache_kwargs["root"] = Path(artifact_cache_dir)
+            artifact_cache = ArtifactCache(**cache_kwargs)
+        self.artifact_cache = artifact_cache
         
     async def curate_context(
         self,
@@ -159,7 +185,7 @@ class ContextCuratorAgent:
 
             # Step 2: Synthesize health report
             logger.info("🏥 Agent 2: Health Report Synthesizer - Creating targeted brief...")
-            health_brief = await self.health_synthesizer.synthesize_health_context(
+            health_brief = await self._get_health_brief(
                 health_report_text=health_report_text,
                 selected_personas=selected_personas,
                 llm_client=llm_client,
@@ -177,9 +203,7 @@ class ContextCuratorAgent:
 
             # Step 3: Generate voice guide (cached after first generation)
             if self.voice_guide_cache is None:
-                logger.info("🎙️ Agent 3: Voice Guide Generator - Creating Liz's style guide...")
-                self.voice_guide_cache = await self.voice_generator.generate_voice_guide(llm_client)
-                logger.info(f"✅ Voice guide generated (~{len(self.voice_guide_cache)//4} tokens)")
+                self.voice_guide_cache = await self._get_voice_guide(llm_client)
             else:
                 logger.info("✅ Using cached voice guide")
 
@@ -277,6 +301,82 @@ class ContextCuratorAgent:
         
         return curated_context
 
+    def invalidate_artifacts(self, namespace: Optional[str] = None) -> int:
+        """Drop persisted curation artifacts (one namespace or all) and return the count removed."""
+        if namespace in (None, "voice_guide"):
+            self.voice_guide_cache = None
+            self.voice_generator.voice_guide_cache = None
+        removed = self.artifact_cache.invalidate(namespace)
+        logger.info("🧹 Invalidated %d cached curation artifacts (%s)", removed, namespace or "all")
+        return removed
+
+    @staticmethod
+    def _model_fingerprint(llm_client: Any) -> str:
+        return str(getattr(llm_client, "model_name", None) or getattr(llm_client, "model", None) or "default")
+
+    @staticmethod
+    def _persona_ids(personas: List[Dict[str, Any]]) -> List[str]:
+        return sorted(
+            Path(str(persona.get("_file") or persona.get("meta", {}).get("persona_id") or "")).name
+            for persona in personas
+        )
+
+    async def _get_voice_guide(self, llm_client: Any) -> str:
+        """Return the voice guide from the artifact cache, generating it on a miss."""
+        key_parts = (
+            hash_content(self.voice_generator.load_transcripts()),
+            hash_content(self.voice_generator.load_framework()),
+            self._model_fingerprint(llm_client),
+        )
+        cached = self.artifact_cache.get("voice_guide", *key_parts)
+        if isinstance(cached, str) and cached:
+            logger.info("✅ Loaded voice guide from artifact cache (~%d tokens)", len(cached) // 4)
+            return cached
+
+        logger.info("🎙️ Agent 3: Voice Guide Generator - Creating Liz's style guide...")
+        voice_guide = await self.voice_generator.generate_voice_guide(llm_client)
+        logger.info(f"✅ Voice guide generated (~{len(voice_guide)//4} tokens)")
+        if voice_guide and voice_guide != self.voice_generator._get_fallback_guide():
+            self.artifact_cache.set("voice_guide", voice_guide, *key_parts)
+        return voice_guide
+
+    async def _get_health_brief(
+        self,
+        *,
+        health_report_text: str,
+        selected_personas: List[Dict[str, Any]],
+        llm_client: Any,
+        refinement_feedback: Optional[str],
+        language_profile: Optional[Dict[str, Any]],
+        alignment_profile: Optional[Dict[str, Any]],
+        health_digest: Optional[Dict[str, Any]],
+    ) -> str:
+        """Return a health brief keyed by report hash, persona set and feedback."""
+        key_parts = (
+            hash_content(health_report_text or ""),
+            self._persona_ids(selected_personas),
+            refinement_feedback or "",
+            hash_content(language_profile or {}, alignment_profile or {}, health_digest or {}),
+            self._model_fingerprint(llm_client),
+        )
+        cached = self.artifact_cache.get("health_brief", *key_parts)
+        if isinstance(cached, str) and cached:
+            logger.info("✅ Loaded health brief from artifact cache (~%d tokens)", len(cached) // 4)
+            return cached
+
+        health_brief = await self.health_synthesizer.synthesize_health_context(
+            health_report_text=health_report_text,
+            selected_personas=selected_personas,
+            llm_client=llm_client,
+            refinement_feedback=refinement_feedback,
+            language_profile=language_profile,
+            alignment_profile=alignment_profile,
+            health_digest=health_digest,
+        )
+        if health_brief and health_brief not in _UNCACHEABLE_HEALTH_BRIEFS:
+            self.artifact_cache.set("health_brief", health_brief, *key_parts)
+        return health_brief
+
     @staticmethod
     def _sanitize_language(block: str) -> str:
         banned_terms = {
@@ -383,17 +483,23 @@ class ContextCuratorAgent:
                     if not location:
                         continue
                     query = f"mental health support near {location}"
+                    cached = self.artifact_cache.get("maps_lookup", query, 8000)
+                    if isinstance(cached, list):
+                        results.extend(cached)
+                        continue
                     try:
                         response = await client.text_search(query=query, radius_meters=8000)
                         first = (response.get("results") or [])[:1]
-                        for item in first:
-                            results.append(
-                                {
-                                    "name": item.get("name", "Resource"),
-                                    "description": item.get("formatted_address", "Address unavailable"),
-                                    "location_query": location,
-                                }
-                            )
+                        found = [
+                            {
+                                "name": item.get("name", "Resource"),
+                                "description": item.get("formatted_address", "Address unavailable"),
+                                "location_query": location,
+                            }
+                            for item in first
+                        ]
+                        self.artifact_cache.set("maps_lookup", found, query, 8000)
+                        results.extend(found)
                     except Exception as exc:  # pragma: no cover - network
                         logger.debug("Google Maps enrichment failed for %s: %s", location, exc)
                         continue
@@ -415,10 +521,21 @@ class ContextCuratorAgent:
             return {}
 
         summaries: Dict[str, str] = {}
+        pending: List[str] = []
+        for name in unique_names:
+            cached = self.artifact_cache.get("wikimedia_lookup", name.replace(" ", "_"))
+            if isinstance(cached, str):
+                if cached:
+                    summaries[name] = cached
+            else:
+                pending.append(name)
+        if not pending:
+            return summaries
+
         try:
             async with WikimediaEnterpriseClient() as client:
                 await client.authenticate()
-                for name in unique_names:
+                for name in pending:
                     title = name.replace(" ", "_")
                     try:
                         payload = await client.get_article(title)
@@ -427,6 +544,7 @@ class ContextCuratorAgent:
                         continue
                     results = payload.get("results") or []
                     if not results:
+                        self.artifact_cache.set("wikimedia_lookup", "", title)
                         continue
                     article = results[0]
                     summary = (
@@ -434,8 +552,10 @@ class ContextCuratorAgent:
                         or article.get("paragraphs", [{}])[0].get("value")
                         or article.get("intro", "")
                     )
-                    if summary:
-                        summaries[name] = str(summary)[:500]
+                    summary_text = str(summary)[:500] if summary else ""
+                    self.artifact_cache.set("wikimedia_lookup", summary_text, title)
+                    if summary_text:
+                        summaries[name] = summary_text
         except Exception as exc:  # pragma: no cover - network
             logger.debug("Wikimedia client unavailable: %s", exc)
         return summaries     
@@ -5,10 +5,14 @@ This agent uses sophisticated prompt engineering, JSON repair, and schema enforc
 to generate high-quality, structured content for the Enlitens knowledge base.
 """
 
+import asyncio
 import logging
 import json
-from typing import Dict, List, Any, Optional
+import os
+import time
+from typing import Awaitable, Callable, Dict, List, Any, Optional, Tuple, Type
 from datetime import datetime
+from pydantic import BaseModel
 from src.synthesis.ollama_client import OllamaClient
 from src.models.enlitens_schemas import (
     EnlitensKnowledgeEntry, DocumentMetadata, ExtractedEntities,
@@ -25,11 +29,73 @@ class EnhancedCompleteEnlitensAgent:
     Enhanced Complete Enlitens Agent with advanced prompt engineering and schema enforcement.
     """
     
-    def __init__(self):
+    def __init__(self, max_concurrent_generations: Optional[int] = None):
         self.ollama_client = OllamaClient()
         self.extraction_tools = EnhancedExtractionTools()
+        # Upper bound on structured generations in flight for one document
+        self.max_concurrent_generations = max(
+            1,
+            max_concurrent_generations or int(os.getenv("ENLITENS_MAX_INFLIGHT_GENERATIONS", "4")),
+        )
+        self.last_section_timings: Dict[str, float] = {}
         logger.info("Enhanced Complete Enlitens Agent initialized")
 
+    def _content_sections(
+        self,
+    ) -> List[Tuple[str, Callable[[str, Dict[str, Any]], Awaitable[BaseModel]], Type[BaseModel]]]:
+        """Section name, extractor and empty fallback model, in output order."""
+        return [
+            ("rebellion_framework", self._extract_rebellion_framework, RebellionFramework),
+            ("marketing_content", self._extract_marketing_content, MarketingContent),
+            ("seo_content", self._extract_seo_content, SEOContent),
+            ("website_copy", self._extract_website_copy, WebsiteCopy),
+            ("blog_content", self._extract_blog_content, BlogContent),
+            ("social_media_content", self._extract_social_media_content, SocialMediaContent),
+            ("educational_content", self._extract_educational_content, EducationalContent),
+            ("clinical_content", self._extract_clinical_content, ClinicalContent),
+            ("research_content", self._extract_research_content, ResearchContent),
+            ("content_creation_ideas", self._extract_content_creation_ideas, ContentCreationIdeas),
+        ]
+
+    async def _generate_sections(self, text: str, content_insights: Dict[str, Any]) -> Dict[str, BaseModel]:
+        """
+        Run all section extractions as a bounded concurrent fan-out.
+
+        Sections share the document context but not each other's output, so they
+        are dispatched together under a semaphore. A failing section falls back to
+        its empty model without affecting the others, and results are keyed by
+        section name so the output order is deterministic.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_generations)
+        timings: Dict[str, float] = {}
+
+        async def _run(name, extractor, fallback_model):
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    return await extractor(text, content_insights)
+                except Exception as exc:
+                    logger.error("Section %s failed; using empty %s: %s", name, fallback_model.__name__, exc)
+                    return fallback_model()
+                finally:
+                    timings[name] = time.perf_counter() - started
+
+        sections = self._content_sections()
+        wall_start = time.perf_counter()
+        results = await asyncio.gather(*[_run(*section) for section in sections])
+        wall_clock = time.perf_counter() - wall_start
+
+        self.last_section_timings = {name: round(timings.get(name, 0.0), 3) for name, _, _ in sections}
+        sequential = sum(timings.values())
+        logger.info(
+            "Section generation finished in %.1fs wall-clock (%.1fs summed, concurrency=%d): %s",
+            wall_clock,
+            sequential,
+            self.max_concurrent_generations,
+            ", ".join(f"{name}={seconds:.1f}s" for name, seconds in self.last_section_timings.items()),
+        )
+        return {name: result for (name, _, _), result in zip(sections, results)}
+
     async def extract_complete_content(self, text: str, document_id: str, 
                                      client_insights: Optional[Dict[str, Any]] = None,
                                      founder_insights: Optional[Dict[str, Any]] = None) -> EnlitensKnowledgeEntry:
@@ -65,32 +131,14 @@ class EnhancedCompleteEnlitensAgent:
                     text, client_insights, founder_insights
                 )
             
-            # Extract all content types with enhanced prompts
-            rebellion_content = await self._extract_rebellion_framework(text, content_insights)
-            marketing_content = await self._extract_marketing_content(text, content_insights)
-            seo_content = await self._extract_seo_content(text, content_insights)
-            website_copy = await self._extract_website_copy(text, content_insights)
-            blog_content = await self._extract_blog_content(text, content_insights)
-            social_media_content = await self._extract_social_media_content(text, content_insights)
-            educational_content = await self._extract_educational_content(text, content_insights)
-            clinical_content = await self._extract_clinical_content(text, content_insights)
-            research_content = await self._extract_research_content(text, content_insights)
-            content_creation_ideas = await self._extract_content_creation_ideas(text, content_insights)
+            # Extract all content types with enhanced prompts (bounded concurrent fan-out)
+            sections = await self._generate_sections(text, content_insights)
             
             # Create complete knowledge entry
             knowledge_entry = EnlitensKnowledgeEntry(
                 metadata=metadata,
                 extracted_entities=entities,
-                rebellion_framework=rebellion_content,
-                marketing_content=marketing_content,
-                seo_content=seo_content,
-                website_copy=website_copy,
-                blog_content=blog_content,
-                social_media_content=social_media_content,
-                educational_content=educational_content,
-                clinical_content=clinical_content,
-                research_content=research_content,
-                content_creation_ideas=content_creation_ideas
+                **sections,
             )
             
             logger.info(f"Successfully extracted complete content for document: {document_id}")
@@ -182,10 +230,10 @@ Provide your analysis as a JSON object with the specified schema.
 
 CRITICAL: Each field must be a simple list of strings, not nested objects. For example:
 - "narrative_deconstruction": ["insight 1", "insight 2", "insight 3"]
-- NOT: "narrative_deconstruction": {"content": ["insight 1", "insight 2"]}
+- NOT: "narrative_deconstruction": {{"content": ["insight 1", "insight 2"]}}
 
 EXAMPLE OUTPUT FORMAT:
-{
+{{
   "narrative_deconstruction": ["Traditional therapy focuses on symptoms rather than neurobiology", "Research challenges the pathology model"],
   "sensory_profiling": ["Interoceptive awareness training", "Sensory processing insights"],
   "executive_function": ["Prefrontal cortex regulation", "Cognitive control strategies"],
@@ -193,7 +241,7 @@ EXAMPLE OUTPUT FORMAT:
   "strengths_synthesis": ["Neurodiversity as strength", "Individual differences as assets"],
   "rebellion_themes": ["Science over shame", "Neurobiological truth"],
   "aha_moments": ["Your brain isn't broken", "Neuroplasticity insights"]
-}
+}}
 
 Ensure all fields are present and properly formatted as simple lists.
 """
@@ -357,7 +405,7 @@ Provide your analysis as a JSON object with the specified schema.
 
 CRITICAL: Each field must be a simple list of strings, not nested objects. For example:
 - "headlines": ["headline 1", "headline 2", "headline 3"]
-- NOT: "headlines": {"content": ["headline 1", "headline 2"]}
+- NOT: "headlines": {{"content": ["headline 1", "headline 2"]}}
 
 Ensure all fields are present and properly formatted as simple lists.
 """
@@ -416,7 +464,7 @@ Provide your analysis as a JSON object with the specified schema.
 
 CRITICAL: Each field must be a simple list of strings, not nested objects. For example:
 - "headlines": ["headline 1", "headline 2", "headline 3"]
-- NOT: "headlines": {"content": ["headline 1", "headline 2"]}
+- NOT: "headlines": {{"content": ["headline 1", "headline 2"]}}
 
 Ensure all fields are present and properly formatted as simple lists.
 """
@@ -478,7 +526,7 @@ Provide your analysis as a JSON object with the specified schema.
 
 CRITICAL: Each field must be a simple list of strings, not nested objects. For example:
 - "headlines": ["headline 1", "headline 2", "headline 3"]
-- NOT: "headlines": {"content": ["headline 1", "headline 2"]}
+- NOT: "headlines": {{"content": ["headline 1", "headline 2"]}}
 
 Ensure all fields are present and properly formatted as simple lists.
 """
@@ -540,7 +588,7 @@ Provide your analysis as a JSON object with the specified schema.
 
 CRITICAL: Each field must be a simple list of strings, not nested objects. For example:
 - "headlines": ["headline 1", "headline 2", "headline 3"]
-- NOT: "headlines": {"content": ["headline 1", "headline 2"]}
+- NOT: "headlines": {{"content": ["headline 1", "headline 2"]}}
 
 Ensure all fields are present and properly formatted as simple lists.
 """
@@ -604,7 +652,7 @@ Provide your analysis as a JSON object with the specified schema.
 
 CRITICAL: Each field must be a simple list of strings, not nested objects. For example:
 - "headlines": ["headline 1", "headline 2", "headline 3"]
-- NOT: "headlines": {"content": ["headline 1", "headline 2"]}
+- NOT: "headlines": {{"content": ["headline 1", "headline 2"]}}
 
 Ensure all fields are present and properly formatted as simple lists.
 """
@@ -667,7 +715,7 @@ Provide your analysis as a JSON object with the specified schema.
 
 CRITICAL: Each field must be a simple list of strings, not nested objects. For example:
 - "headlines": ["headline 1", "headline 2", "headline 3"]
-- NOT: "headlines": {"content": ["headline 1", "headline 2"]}
+- NOT: "headlines": {{"content": ["headline 1", "headline 2"]}}
 
 Ensure all fields are present and properly formatted as simple lists.
 """
@@ -730,7 +778,7 @@ Provide your analysis as a JSON object with the specified schema.
 
 CRITICAL: Each field must be a simple list of strings, not nested objects. For example:
 - "headlines": ["headline 1", "headline 2", "headline 3"]
-- NOT: "headlines": {"content": ["headline 1", "headline 2"]}
+- NOT: "headlines": {{"content": ["headline 1", "headline 2"]}}
 
 Ensure all fields are present and properly formatted as simple lists.
 """
@@ -791,7 +839,7 @@ Provide your analysis as a JSON object with the specified schema.
 
 CRITICAL: Each field must be a simple list of strings, not nested objects. For example:
 - "headlines": ["headline 1", "headline 2", "headline 3"]
-- NOT: "headlines": {"content": ["headline 1", "headline 2"]}
+- NOT: "headlines": {{"content": ["headline 1", "headline 2"]}}
 
 Ensure all fields are present and properly formatted as simple lists.
 """
@@ -10,7 +10,10 @@ This team uses specialized biomedical models to extract entities from research p
 
 import logging
 import os
-from typing import Dict, List, Any, Optional, Callable
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Callable, Sequence, Tuple
 import asyncio
 
 import torch
@@ -20,6 +23,92 @@ from src.utils.gpu_memory_manager import get_gpu_manager
 
 logger = logging.getLogger(__name__)
 
+# (entity bucket, pipeline cache key, model name, label; None keeps the model's entity_group)
+NER_MODEL_SPECS: Tuple[Tuple[str, str, str, Optional[str]], ...] = (
+    ("diseases", "disease_detect", "OpenMed/OpenMed-NER-DiseaseDetect-SuperClinical-434M", "Disease"),
+    ("chemicals", "pharma_detect", "OpenMed/OpenMed-NER-PharmaDetect-SuperClinical-434M", "Chemical"),
+    ("anatomy", "anatomy_detect", "OpenMed/OpenMed-NER-AnatomyDetect-ElectraMed-560M", "Anatomy"),
+    ("genes", "genome_detect", "OpenMed/OpenMed-NER-GenomeDetect-SuperClinical-434M", "Gene"),
+    ("clinical", "clinical_distilbert", "nlpie/clinical-distilbert-i2b2-2010", None),
+)
+
+
+def split_into_windows(
+    text: str,
+    tokenizer: Any = None,
+    window_tokens: int = 384,
+    stride_tokens: int = 64,
+) -> List[Tuple[int, int]]:
+    """
+    Split ``text`` into overlapping ``(start, end)`` character windows.
+
+    Uses the pipeline tokenizer's offset mapping when available so every window
+    fits the model; otherwise approximates tokens as ~4 characters and snaps
+    window edges to whitespace.
+    """
+    if not text:
+        return []
+    step = max(1, window_tokens - stride_tokens)
+
+    offsets = None
+    if tokenizer is not None:
+        try:
+            encoded = tokenizer(text, return_offsets_mapping=True, add_special_tokens=False)
+            offsets = [tuple(pair) for pair in encoded["offset_mapping"]]
+        except Exception:
+            offsets = None
+
+    windows: List[Tuple[int, int]] = []
+    if offsets:
+        for first in range(0, len(offsets), step):
+            last = min(first + window_tokens, len(offsets)) - 1
+            windows.append((offsets[first][0], offsets[last][1]))
+            if last == len(offsets) - 1:
+                break
+        return windows
+
+    window_chars = window_tokens * 4
+    step_chars = step * 4
+    start = 0
+    while start < len(text):
+        end = min(start + window_chars, len(text))
+        if end < len(text):
+            boundary = text.rfind(" ", start + step_chars, end)
+            if boundary > start:
+                end = boundary
+        windows.append((start, end))
+        if end >= len(text):
+            break
+        next_start = max(start + 1, end - stride_tokens * 4)
+        space = text.find(" ", next_start, end)
+        start = space + 1 if space != -1 else next_start
+    return windows
+
+
+def merge_window_entities(entities: Sequence[Dict[str, Any]], text: str) -> List[Dict[str, Any]]:
+    """
+    Deduplicate entities found in overlapping windows.
+
+    Overlapping spans with the same label collapse to the longest span (ties go
+    to the higher confidence), so an entity cut at one window's edge is replaced
+    by its complete occurrence in the neighbouring window.
+    """
+    ordered = sorted(entities, key=lambda e: (e['label'], e['start'], -(e['end'] - e['start']), -e['confidence']))
+    merged: List[Dict[str, Any]] = []
+    for entity in ordered:
+        previous = merged[-1] if merged else None
+        if previous and previous['label'] == entity['label'] and entity['start'] < previous['end']:
+            previous_len = previous['end'] - previous['start']
+            entity_len = entity['end'] - entity['start']
+            if entity_len > previous_len or (entity_len == previous_len and entity['confidence'] > previous['confidence']):
+                merged[-1] = entity
+            continue
+        merged.append(entity)
+    for entity in merged:
+        entity['text'] = text[entity['start']:entity['end']]
+    merged.sort(key=lambda e: (e['start'], e['end']))
+    return merged
+
 
 class LazyPipelineLoader:
     """Lazy loader that caches Hugging Face pipelines with device awareness."""
@@ -31,6 +120,9 @@ class LazyPipelineLoader:
     ) -> None:
         self._pipeline_factory = pipeline_factory
         self._cache: Dict[str, Any] = {}
+        # Windowed NER asks for several models from worker threads at once;
+        # loads are serialised so from_pretrained never runs concurrently
+        self._load_lock = threading.Lock()
         if force_cpu is None:
             force_cpu = os.getenv("EXTRACTION_FORCE_CPU", "false").lower() in {"1", "true", "yes"}
         self._force_cpu = force_cpu
@@ -47,30 +139,34 @@ class LazyPipelineLoader:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
-        device = pipeline_kwargs.pop("device", None)
-        if device is None:
-            if self._force_cpu:
-                device = -1
-            else:
-                device = 0 if torch.cuda.is_available() else -1
+        with self._load_lock:
+            if cache_key in self._cache:
+                return self._cache[cache_key]
 
-        logger.info(
-            "ExtractionTeam: loading pipeline %s on %s",
-            model_name,
-            "CPU" if device == -1 else f"device {device}",
-        )
+            device = pipeline_kwargs.pop("device", None)
+            if device is None:
+                if self._force_cpu:
+                    device = -1
+                else:
+                    device = 0 if torch.cuda.is_available() else -1
 
-        try:
-            self._cache[cache_key] = self._pipeline_factory(
-                task,
-                model=model_name,
-                device=device,
-                **pipeline_kwargs,
+            logger.info(
+                "ExtractionTeam: loading pipeline %s on %s",
+                model_name,
+                "CPU" if device == -1 else f"device {device}",
             )
-        except Exception as e:
-            logger.error(f"Failed to load {model_name}: {str(e)[:200]}")
-            raise
-        return self._cache[cache_key]
+
+            try:
+                self._cache[cache_key] = self._pipeline_factory(
+                    task,
+                    model=model_name,
+                    device=device,
+                    **pipeline_kwargs,
+                )
+            except Exception as e:
+                logger.error(f"Failed to load {model_name}: {str(e)[:200]}")
+                raise
+            return self._cache[cache_key]
 
 
 class ExtractionTeam:
@@ -88,7 +184,19 @@ class ExtractionTeam:
         self,
         pipeline_factory: Callable[..., Any] = pipeline,
         force_cpu: Optional[bool] = None,
+        ner_mode: Optional[str] = None,
+        window_tokens: int = 384,
+        stride_tokens: int = 64,
+        ner_batch_size: int = 8,
     ):
+        # "sequential" keeps the legacy first-2000-chars, load/unload flow;
+        # "windowed" covers the full text with resident models run in parallel.
+        self.ner_mode = (ner_mode or os.getenv("EXTRACTION_NER_MODE", "sequential")).lower()
+        self.window_tokens = window_tokens
+        self.stride_tokens = stride_tokens
+        self.ner_batch_size = ner_batch_size
+        self._ner_executor: Optional[ThreadPoolExecutor] = None
+        self.last_throughput: Dict[str, float] = {}
         # FORCE CPU for NER models since vLLM uses all GPU memory
         self.pipeline_loader = LazyPipelineLoader(
             pipeline_factory=pipeline_factory,
@@ -127,6 +235,12 @@ class ExtractionTeam:
                 logger.warning("Extraction Team: No text content found")
                 return {}
             
+            if self.ner_mode == "windowed":
+                entities = await self._extract_entities_windowed(text_content)
+                entities['statistical'] = await self._extract_statistical_entities(text_content)
+                logger.info(f"✅ Extraction Team: Extracted {sum(len(v) for v in entities.values())} entities")
+                return entities
+
             # Extract entities using different models - ONE AT A TIME
             entities = {}
             
@@ -171,6 +285,76 @@ class ExtractionTeam:
             logger.error(f"❌ CRITICAL: Extraction Team entity extraction failed: {e}")
             raise RuntimeError(f"Entity extraction pipeline FAILED - this is a critical error: {e}")
     
+    def _run_windowed_model(self, spec: Tuple[str, str, str, Optional[str]], text: str) -> List[Dict[str, Any]]:
+        """Run one resident NER pipeline over every window of ``text`` in batches."""
+        bucket, cache_key, model_name, label = spec
+        if cache_key not in self.models:
+            self.models[cache_key] = self.pipeline_loader.get(
+                cache_key,
+                "token-classification",
+                model_name,
+                aggregation_strategy="simple",
+                torch_dtype="float16",
+            )
+        ner = self.models[cache_key]
+
+        started = time.perf_counter()
+        windows = split_into_windows(
+            text,
+            getattr(ner, "tokenizer", None),
+            window_tokens=self.window_tokens,
+            stride_tokens=self.stride_tokens,
+        )
+        outputs = ner([text[start:end] for start, end in windows], batch_size=self.ner_batch_size)
+
+        found: List[Dict[str, Any]] = []
+        for (window_start, _), window_entities in zip(windows, outputs):
+            for entity in window_entities or []:
+                found.append({
+                    'text': entity['word'],
+                    'label': label or entity.get('entity_group', 'Clinical'),
+                    'confidence': float(entity['score']),
+                    'start': window_start + int(entity['start']),
+                    'end': window_start + int(entity['end']),
+                })
+        merged = merge_window_entities(found, text)
+
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        self.last_throughput[bucket] = len(text) / elapsed
+        logger.info(
+            "✅ %s: %d entities from %d windows (%.0f chars/sec)",
+            cache_key,
+            len(merged),
+            len(windows),
+            self.last_throughput[bucket],
+        )
+        return merged
+
+    async def _extract_entities_windowed(self, text: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Run every NER model over the full text, one worker per resident model."""
+        if self._ner_executor is None:
+            self._ner_executor = ThreadPoolExecutor(
+                max_workers=len(NER_MODEL_SPECS),
+                thread_name_prefix="ner-worker",
+            )
+        loop = asyncio.get_running_loop()
+        logger.info(
+            "🔄 Windowed NER: %d models over %d chars (window=%d tokens, stride=%d)",
+            len(NER_MODEL_SPECS),
+            len(text),
+            self.window_tokens,
+            self.stride_tokens,
+        )
+        try:
+            results = await asyncio.gather(*[
+                loop.run_in_executor(self._ner_executor, self._run_windowed_model, spec, text)
+                for spec in NER_MODEL_SPECS
+            ])
+        except Exception as e:
+            logger.error(f"❌ CRITICAL: Windowed entity extraction failed: {e}")
+            raise RuntimeError(f"Required NER model failed during windowed extraction: {e}")
+        return {spec[0]: entities for spec, entities in zip(NER_MODEL_SPECS, results)}
+
     async def _unload_model(self, model_key: str):
         """Unload a model from memory and clear GPU cache."""
         try:
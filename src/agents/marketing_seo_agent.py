@@ -2,8 +2,10 @@
 Marketing SEO Agent - Generates marketing and SEO content.
 """
 
+import asyncio
 import json
 import logging
+import time
 from typing import Dict, Any, List, Optional
 
 from .base_agent import BaseAgent
@@ -176,17 +178,6 @@ Return ONLY valid JSON in this exact format:
             seo_model = self.settings.llm.model_for("marketing-seo") or self.model
             seo_client = self.ollama_client.clone_with_model(seo_model)
 
-            marketing_cache = self._cache_kwargs(context, suffix="marketing")
-            marketing_result = await marketing_client.generate_structured_response(
-                prompt=marketing_prompt,
-                response_model=MarketingContent,
-                temperature=0.45,
-                max_retries=3,
-                use_cot_prompt=False,
-                enforce_grammar=True,
-                **marketing_cache,
-            )
-
             seo_prompt = f"""
 Generate SEO-optimized content for Enlitens, a neuroscience-based therapy practice in St. Louis.
 
@@ -238,21 +229,56 @@ Return ONLY valid JSON in this exact format:
 }}
 """
 
-            seo_cache = self._cache_kwargs(context, suffix="seo")
-            seo_result = await seo_client.generate_structured_response(
-                prompt=seo_prompt,
-                response_model=SEOContent,
-                temperature=0.3,
-                max_retries=3,
-                use_cot_prompt=False,
-                enforce_grammar=True,
-                **seo_cache,
+            # SEO never reads the marketing output, so both generations run together
+            # and each falls back to its empty model on its own.
+            timings: Dict[str, float] = {}
+            failed: List[str] = []
+
+            async def _generate(name, client, prompt, response_model, temperature):
+                started = time.perf_counter()
+                try:
+                    result = await client.generate_structured_response(
+                        prompt=prompt,
+                        response_model=response_model,
+                        temperature=temperature,
+                        max_retries=3,
+                        use_cot_prompt=False,
+                        enforce_grammar=True,
+                        **self._cache_kwargs(context, suffix=name),
+                    )
+                except Exception as exc:
+                    logger.error("%s generation failed; using empty %s: %s", name, response_model.__name__, exc)
+                    failed.append(name)
+                    return None
+                finally:
+                    timings[name] = time.perf_counter() - started
+                if result is None:
+                    # The client returns None once its retries are exhausted
+                    logger.warning("%s generation returned no result; using empty %s", name, response_model.__name__)
+                    failed.append(name)
+                return result
+
+            wall_start = time.perf_counter()
+            marketing_result, seo_result = await asyncio.gather(
+                _generate("marketing", marketing_client, marketing_prompt, MarketingContent, 0.45),
+                _generate("seo", seo_client, seo_prompt, SEOContent, 0.3),
+            )
+            wall_clock = time.perf_counter() - wall_start
+
+            generation_timings = {name: round(seconds, 3) for name, seconds in timings.items()}
+            generation_timings["total"] = round(wall_clock, 3)
+            logger.info(
+                "Marketing/SEO generation finished in %.1fs wall-clock (marketing=%.1fs, seo=%.1fs)",
+                wall_clock,
+                timings.get("marketing", 0.0),
+                timings.get("seo", 0.0),
             )
 
             return {
                 "marketing_content": marketing_result.model_dump() if marketing_result else MarketingContent().model_dump(),
                 "seo_content": seo_result.model_dump() if seo_result else SEOContent().model_dump(),
-                "generation_quality": "high",
+                "generation_quality": "high" if not failed else ("partial" if len(failed) == 1 else "low"),
+                "generation_timings": generation_timings,
             }
 
         except Exception as e:
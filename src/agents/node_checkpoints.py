@@ -0,0 +1,113 @@
+"""
+Node Checkpoints
+Persists the state delta returned by each completed supervisor graph node so a
+document can resume from its last completed node after a crash or timeout.
+Entries are meant for resuming an interrupted run: the supervisor clears a
+document's checkpoints once its run completes, and entries older than
+``ENLITENS_SUPERVISOR_CHECKPOINT_TTL`` seconds (default one day) are ignored.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from src.utils.artifact_cache import ArtifactCache, hash_content
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = Path(os.getenv("ENLITENS_SUPERVISOR_CHECKPOINT_DIR", "cache/supervisor_checkpoints"))
+DEFAULT_CHECKPOINT_TTL = float(os.getenv("ENLITENS_SUPERVISOR_CHECKPOINT_TTL", str(24 * 3600)))
+_NAMESPACE_PREFIX = "node"
+
+
+def document_checksum(document_text: str) -> str:
+    return hash_content(document_text or "")
+
+
+def _encode(value: Any) -> Any:
+    """Make a state delta JSON-safe while keeping datetimes and sets round-trippable."""
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, (set, frozenset)):
+        return {"__set__": [_encode(item) for item in sorted(value, key=str)]}
+    if isinstance(value, dict):
+        return {str(key): _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if hasattr(value, "model_dump"):
+        return _encode(value.model_dump())
+    return str(value)
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        if set(value) == {"__datetime__"}:
+            return datetime.fromisoformat(value["__datetime__"])
+        if set(value) == {"__set__"}:
+            return {_decode(item) for item in value["__set__"]}
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+class NodeCheckpointStore:
+    """Checkpoint deltas keyed by document checksum and node name.
+
+    Each node gets its own cache namespace, so a single node can be invalidated
+    for every document (e.g. after a prompt change) without touching the rest.
+    The node fingerprint is stored with the delta; a checkpoint only replays
+    when the fingerprint still matches and it is younger than ``ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        enabled: bool = True,
+        ttl_seconds: Optional[float] = DEFAULT_CHECKPOINT_TTL,
+    ):
+        self.cache = ArtifactCache(root=Path(root or DEFAULT_CHECKPOINT_DIR), enabled=enabled)
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _namespace(node: str) -> str:
+        return f"{_NAMESPACE_PREFIX}_{node}"
+
+    def load(self, checksum: str, node: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        stored = self.cache.get(self._namespace(node), checksum)
+        if not isinstance(stored, dict) or stored.get("fingerprint") != fingerprint:
+            return None
+        if self.ttl_seconds is not None and time.time() - float(stored.get("saved_at", 0)) >= self.ttl_seconds:
+            return None
+        return _decode(stored.get("delta"))
+
+    def save(self, checksum: str, node: str, fingerprint: str, delta: Dict[str, Any]) -> None:
+        entry = {"fingerprint": fingerprint, "saved_at": time.time(), "delta": _encode(delta)}
+        try:
+            self.cache.set(self._namespace(node), entry, checksum)
+        except OSError as exc:
+            logger.warning("Could not checkpoint node %s: %s", node, exc)
+
+    def invalidate(self, nodes: Optional[Iterable[str]] = None, checksum: Optional[str] = None) -> int:
+        """Drop checkpoints for ``nodes`` (all when ``None``), optionally for one document only.
+
+        Returns the number of entries removed.
+        """
+        if nodes is None:
+            if checksum is None:
+                return self.cache.invalidate()
+            raise ValueError("Pass the node names to invalidate a single document")
+        removed = 0
+        for node in nodes:
+            if checksum is None:
+                removed += self.cache.invalidate(self._namespace(node))
+            else:
+                removed += self.cache.invalidate(self._namespace(node), checksum)
+        return removed
@@ -0,0 +1,261 @@
+"""
+Persona Index
+Keeps parsed personas and their normalized embeddings resident so persona
+matching can shortlist candidates with one vectorized similarity pass.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_DIR = Path(os.getenv("ENLITENS_PERSONA_INDEX_DIR", "cache/persona_index"))
+DEFAULT_EMBED_MODEL = os.getenv("ENLITENS_PERSONA_EMBED_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+
+# Sections that carry most of the matching signal are embedded first so that
+# encoders with short context windows still see them.
+_PRIORITY_SECTIONS = (
+    "meta",
+    "neurodivergence_mental_health",
+    "current_life_context",
+    "goals_barriers",
+    "executive_function_sensory",
+    "identity_demographics",
+    "developmental_story",
+)
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+
+def _flatten_strings(value: Any, out: List[str]) -> None:
+    if isinstance(value, str):
+        if value.strip():
+            out.append(value.strip())
+    elif isinstance(value, dict):
+        for item in value.values():
+            _flatten_strings(item, out)
+    elif isinstance(value, list):
+        for item in value:
+            _flatten_strings(item, out)
+
+
+def persona_embedding_text(persona: Dict[str, Any], max_chars: int = 4000) -> str:
+    """Flatten a persona into text, priority sections first."""
+    parts: List[str] = []
+    for section in _PRIORITY_SECTIONS:
+        _flatten_strings(persona.get(section), parts)
+    for key, value in persona.items():
+        if key in _PRIORITY_SECTIONS or key.startswith("_"):
+            continue
+        _flatten_strings(value, parts)
+    return " ".join(parts)[:max_chars]
+
+
+class HashedBagOfWordsEncoder:
+    """Lexical fallback encoder (hashing trick) used when sentence-transformers is unavailable."""
+
+    def __init__(self, dimension: int = 1024):
+        self.dimension = dimension
+
+    def encode(self, sentences: Sequence[str], normalize_embeddings: bool = True, **_: Any) -> np.ndarray:
+        matrix = np.zeros((len(sentences), self.dimension), dtype=np.float32)
+        for row, sentence in enumerate(sentences):
+            for token in _TOKEN_RE.findall((sentence or "").lower()):
+                if len(token) < 3:
+                    continue
+                bucket = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+                matrix[row, bucket % self.dimension] += 1.0
+        matrix = np.log1p(matrix)
+        if normalize_embeddings:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix /= norms
+        return matrix
+
+
+def _resolve_encoder(model_name: str) -> Tuple[Any, str]:
+    try:
+        from sentence_transformers import SentenceTransformer  # type: ignore
+
+        return SentenceTransformer(model_name, device="cpu"), model_name
+    except Exception as exc:  # pragma: no cover - optional heavy dependency
+        logger.warning("Persona index falling back to lexical hashing encoder (%s)", exc)
+        return HashedBagOfWordsEncoder(), "hashed-bow-1024"
+
+
+class PersonaIndex:
+    """
+    Persistent persona catalog with a precomputed, L2-normalized embedding matrix.
+
+    The index is refreshed whenever a persona file is added, removed or its
+    mtime changes; only changed files are re-parsed and re-embedded. Embeddings
+    are persisted under ``index_dir`` so restarts skip re-embedding the library.
+    """
+
+    def __init__(
+        self,
+        personas_dir: Path,
+        index_dir: Optional[Path] = None,
+        model_name: str = DEFAULT_EMBED_MODEL,
+        encoder: Any = None,
+        text_builder: Callable[[Dict[str, Any]], str] = persona_embedding_text,
+    ):
+        self.personas_dir = Path(personas_dir)
+        if index_dir is None:
+            dir_key = hashlib.sha1(str(self.personas_dir.resolve()).encode("utf-8")).hexdigest()[:12]
+            index_dir = DEFAULT_INDEX_DIR / dir_key
+        self.index_dir = Path(index_dir)
+        self.model_name = model_name
+        self.text_builder = text_builder
+        self._encoder = encoder
+        self._encoder_name = getattr(encoder, "model_name", None) or (type(encoder).__name__ if encoder else None)
+        self._lock = threading.Lock()
+
+        self._files: List[str] = []
+        self._mtimes: Dict[str, float] = {}
+        self._personas: List[Dict[str, Any]] = []
+        self._matrix: np.ndarray = np.zeros((0, 0), dtype=np.float32)
+        self._loaded_from_disk = False
+
+    # ------------------------------------------------------------------ encoder
+    def _get_encoder(self) -> Any:
+        if self._encoder is None:
+            self._encoder, self._encoder_name = _resolve_encoder(self.model_name)
+        return self._encoder
+
+    def _encode(self, texts: Sequence[str]) -> np.ndarray:
+        encoder = self._get_encoder()
+        vectors = encoder.encode(list(texts), normalize_embeddings=True, show_progress_bar=False)
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        return matrix
+
+    # -------------------------------------------------------------- persistence
+    @property
+    def _matrix_path(self) -> Path:
+        return self.index_dir / "persona_embeddings.npy"
+
+    @property
+    def _manifest_path(self) -> Path:
+        return self.index_dir / "persona_index.json"
+
+    def _load_from_disk(self) -> Dict[str, Tuple[float, np.ndarray]]:
+        """Return ``{file: (mtime, vector)}`` persisted by a previous run for this encoder."""
+        self._loaded_from_disk = True
+        self._get_encoder()
+        try:
+            manifest = json.loads(self._manifest_path.read_text(encoding="utf-8"))
+            matrix = np.load(self._matrix_path)
+        except (FileNotFoundError, ValueError, OSError, json.JSONDecodeError):
+            return {}
+        if manifest.get("encoder") != self._encoder_name or len(manifest.get("files", [])) != len(matrix):
+            return {}
+        return {
+            entry["file"]: (float(entry["mtime"]), matrix[row])
+            for row, entry in enumerate(manifest.get("files", []))
+        }
+
+    def _persist(self) -> None:
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            "model": self.model_name,
+            "encoder": self._encoder_name,
+            "files": [{"file": path, "mtime": self._mtimes[path]} for path in self._files],
+        }
+        tmp_matrix = self._matrix_path.with_suffix(".tmp.npy")
+        np.save(tmp_matrix, self._matrix)
+        os.replace(tmp_matrix, self._matrix_path)
+        tmp_manifest = self._manifest_path.with_suffix(".json.tmp")
+        tmp_manifest.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp_manifest, self._manifest_path)
+
+    # ------------------------------------------------------------------ refresh
+    def _scan(self) -> Dict[str, float]:
+        if not self.personas_dir.exists():
+            return {}
+        return {str(path): path.stat().st_mtime for path in sorted(self.personas_dir.glob("*.json"))}
+
+    def refresh(self) -> bool:
+        """Re-sync with the personas directory. Returns True when anything changed."""
+        with self._lock:
+            current = self._scan()
+            if current == self._mtimes and self._personas:
+                return False
+
+            previous_rows = {
+                path: (self._mtimes[path], self._matrix[row], self._personas[row])
+                for row, path in enumerate(self._files)
+            }
+            persisted = {} if self._loaded_from_disk else self._load_from_disk()
+
+            files: List[str] = []
+            personas: List[Dict[str, Any]] = []
+            vectors: List[Optional[np.ndarray]] = []
+            to_embed: List[int] = []
+            for path, mtime in current.items():
+                cached = previous_rows.get(path)
+                if cached and cached[0] == mtime:
+                    files.append(path)
+                    personas.append(cached[2])
+                    vectors.append(cached[1])
+                    continue
+                try:
+                    with open(path, "r") as handle:
+                        persona = json.load(handle)
+                except Exception as exc:
+                    logger.warning(f"Failed to load persona {path}: {exc}")
+                    continue
+                persona["_file"] = path
+                files.append(path)
+                personas.append(persona)
+                stored = persisted.get(path)
+                if stored and stored[0] == mtime:
+                    vectors.append(stored[1])
+                else:
+                    vectors.append(None)
+                    to_embed.append(len(vectors) - 1)
+
+            if to_embed:
+                logger.info("🧮 Embedding %d new/changed personas for the persona index", len(to_embed))
+                fresh = self._encode([self.text_builder(personas[row]) for row in to_embed])
+                for offset, row in enumerate(to_embed):
+                    vectors[row] = fresh[offset]
+
+            self._files = files
+            self._mtimes = {path: current[path] for path in files}
+            self._personas = personas
+            self._matrix = (
+                np.vstack(vectors).astype(np.float32) if vectors else np.zeros((0, 0), dtype=np.float32)
+            )
+            if to_embed or len(persisted) != len(files):
+                self._persist()
+            logger.info("✅ Persona index ready (%d personas, %d re-embedded)", len(personas), len(to_embed))
+            return True
+
+    # -------------------------------------------------------------------- query
+    def personas(self) -> List[Dict[str, Any]]:
+        self.refresh()
+        return list(self._personas)
+
+    def rank(self, query_text: str, top_n: Optional[int] = None) -> List[Tuple[Dict[str, Any], float]]:
+        """Return personas ordered by cosine similarity to ``query_text``."""
+        self.refresh()
+        if not self._personas or not query_text.strip():
+            return [(persona, 0.0) for persona in self._personas[:top_n]]
+        query = self._encode([query_text])[0]
+        scores = self._matrix @ query
+        count = len(scores) if top_n is None else min(top_n, len(scores))
+        if count < len(scores):
+            candidates = np.argpartition(-scores, count - 1)[:count]
+            order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        else:
+            order = np.argsort(-scores, kind="stable")
+        return [(self._personas[row], float(scores[row])) for row in order]
@@ -5,6 +5,7 @@ Selects the top 10 most relevant client personas for a given research paper.
 
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -14,18 +15,49 @@ from src.utils.llm_response_cleaner import (
     strip_reasoning_artifacts,
 )
 
+try:  # numpy / encoder stack is optional for lightweight environments
+    from src.agents.persona_index import PersonaIndex
+except Exception:  # pragma: no cover - defensive import
+    PersonaIndex = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
+def _for_annotation(persona: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy ``persona`` so ``meta.selection_meta`` can be annotated without touching the cached catalog."""
+    annotated = dict(persona)
+    meta = dict(annotated.get("meta") or {})
+    meta["selection_meta"] = dict(meta.get("selection_meta") or {})
+    annotated["meta"] = meta
+    return annotated
+
+
 class ProfileMatcherAgent:
     """Intelligent agent that selects the most relevant client personas for a research paper."""
     
-    def __init__(self, personas_dir: str = "enlitens_client_profiles/profiles"):
+    def __init__(
+        self,
+        personas_dir: str = "enlitens_client_profiles/profiles",
+        shortlist_size: Optional[int] = None,
+        use_index: bool = True,
+    ):
         self.personas_dir = Path(personas_dir)
         self.personas_cache: Optional[List[Dict[str, Any]]] = None
-        
+        self.shortlist_size = shortlist_size or int(os.getenv("ENLITENS_PERSONA_SHORTLIST", "30"))
+        self.persona_index = (
+            PersonaIndex(self.personas_dir) if use_index and PersonaIndex is not None else None
+        )
+
     def load_personas(self) -> List[Dict[str, Any]]:
         """Load all client personas with metadata."""
+        if self.persona_index is not None:
+            try:
+                self.personas_cache = self.persona_index.personas()
+                return self.personas_cache
+            except Exception as exc:
+                logger.warning("⚠️ Persona index unavailable, loading personas directly: %s", exc)
+                self.persona_index = None
+
         if self.personas_cache is not None:
             return self.personas_cache
             
@@ -128,6 +160,19 @@ class ProfileMatcherAgent:
         if not personas:
             raise RuntimeError("No personas available for matching.")
 
+        similarity_scores: Optional[Dict[str, float]] = None
+        shortlist = self._shortlist_personas(paper_text, entities, top_k)
+        if shortlist is not None:
+            personas = []
+            similarity_scores = {}
+            for persona, score in shortlist:
+                persona = _for_annotation(persona)
+                persona["meta"]["selection_meta"]["prerank_score"] = round(score, 4)
+                personas.append(persona)
+                similarity_scores[Path(persona.get("_file", "")).name] = score
+        else:
+            personas = [_for_annotation(persona) for persona in personas]
+
         personas_metadata = [self.extract_persona_metadata(p) for p in personas]
         attempt_policies = [
             {"max_personas": 30, "temperature": 0.40, "num_predict": 2000, "use_json_mode": False},
@@ -218,6 +263,7 @@ class ProfileMatcherAgent:
                             selected_ids=set(selected_ids),
                             entities=entities,
                             paper_text=paper_text,
+                            similarity_scores=similarity_scores,
                         )
                         for persona_id, score in scored_candidates:
                             persona = known_filenames.get(persona_id)
@@ -252,6 +298,36 @@ class ProfileMatcherAgent:
         failure_summary = "; ".join(failure_reasons) if failure_reasons else "unknown reasons"
         raise RuntimeError(f"Persona matcher failed after retries: {failure_summary}")
 
+    def _shortlist_personas(
+        self,
+        paper_text: str,
+        entities: Dict[str, List[str]],
+        top_k: int,
+    ) -> Optional[List[Tuple[Dict[str, Any], float]]]:
+        """Pre-rank the catalog against the paper with one vectorized similarity pass."""
+        if self.persona_index is None:
+            return None
+
+        entity_terms = [
+            str(item)
+            for items in entities.values()
+            for item in (items or [])[:10]
+            if isinstance(item, str) and item.strip()
+        ]
+        query_text = paper_text[:2000] + "\n" + ", ".join(entity_terms)
+        try:
+            ranked = self.persona_index.rank(query_text, top_n=max(self.shortlist_size, top_k))
+        except Exception as exc:
+            logger.warning("⚠️ Persona pre-ranking failed; sending full catalog to the LLM: %s", exc)
+            return None
+
+        logger.info(
+            "🧮 Pre-ranked personas by embedding similarity: shortlisted %d (top score %.3f)",
+            len(ranked),
+            ranked[0][1] if ranked else 0.0,
+        )
+        return ranked
+
     def _score_personas_for_fallback(
         self,
         *,
@@ -259,7 +335,18 @@ class ProfileMatcherAgent:
         selected_ids: set,
         entities: Dict[str, List[str]],
         paper_text: str,
+        similarity_scores: Optional[Dict[str, float]] = None,
     ) -> List[Tuple[str, float]]:
+        if similarity_scores:
+            # Shortlist scores are already ordered by embedding similarity.
+            ranked = [
+                (persona_id, score)
+                for persona_id, score in similarity_scores.items()
+                if persona_id not in selected_ids
+            ]
+            ranked.sort(key=lambda item: item[1], reverse=True)
+            return ranked
+
         entity_terms: List[str] = []
         for bucket in entities.values():
             for item in bucket:
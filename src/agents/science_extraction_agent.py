@@ -4,6 +4,7 @@ Science Extraction Agent - Extracts scientific findings and neuroscience content
 
 import logging
 import math
+import os
 from collections import Counter
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -25,6 +26,8 @@ class ScienceExtractionAgent(BaseAgent):
         self.ollama_client = None
         self.self_consistency_temperatures = [0.1, 0.2, 0.3]
         self.vote_threshold_ratio = 0.5
+        # "n": one request returning every sample; "sequential": one request per temperature
+        self.self_consistency_mode = os.getenv("ENLITENS_SELF_CONSISTENCY_MODE", "n").lower()
 
     async def initialize(self) -> bool:
         """Initialize the science extraction agent."""
@@ -191,6 +194,15 @@ Return as JSON with these EXACT field names:
         """Sample multiple generations to improve factual reliability."""
 
         schedule = temperatures or self.self_consistency_temperatures
+        if self.self_consistency_mode == "n" and len(schedule) > 1:
+            try:
+                return await self._sample_in_one_request(prompt, schedule)
+            except Exception as exc:
+                logger.info(
+                    "ScienceExtraction multi-sample request failed (%s); sampling one request per temperature",
+                    exc,
+                )
+
         samples: List[ResearchContent] = []
         for temperature in schedule:
             result = await self.ollama_client.generate_structured_response(
@@ -209,6 +221,28 @@ Return as JSON with these EXACT field names:
                 )
         return samples
 
+    async def _sample_in_one_request(self, prompt: str, schedule: List[float]) -> List[ResearchContent]:
+        """Draw ``len(schedule)`` samples from a single request sharing one prompt prefill.
+
+        The server applies one temperature to every choice, so the hottest
+        temperature of the schedule is used to keep the samples diverse.
+        """
+
+        results = await self.ollama_client.generate_structured_samples(
+            prompt=prompt,
+            response_model=ResearchContent,
+            n=len(schedule),
+            temperature=max(schedule),
+            max_retries=3,
+        )
+        samples: List[ResearchContent] = []
+        for index, result in enumerate(results):
+            if result:
+                samples.append(result)
+            else:
+                logger.debug("ScienceExtraction self-consistency sample %s failed", index)
+        return samples
+
     def _aggregate_samples(
         self, samples: List[ResearchContent]
     ) -> Tuple[Dict[str, List[str]], Dict[str, Any]]:
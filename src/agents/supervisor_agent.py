@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
 
 from langgraph.graph import StateGraph, END
 
+from src.utils.artifact_cache import hash_content
+
 from .base_agent import BaseAgent
 from .science_extraction_agent import ScienceExtractionAgent
 from .clinical_synthesis_agent import ClinicalSynthesisAgent
@@ -26,6 +29,7 @@ from .marketing_seo_agent import MarketingSEOAgent
 from .validation_agent import ValidationAgent
 from .educational_content_agent import EducationalContentAgent
 from .rebellion_framework_agent import RebellionFrameworkAgent
+from .node_checkpoints import NodeCheckpointStore, document_checksum
 from .workflow_state import WorkflowState, create_initial_state, record_attempt, as_dict
 
 logger = logging.getLogger(__name__)
@@ -34,7 +38,93 @@ logger = logging.getLogger(__name__)
 class SupervisorAgent(BaseAgent):
     """Supervisor agent that coordinates the multi-agent workflow with LangGraph."""
 
-    def __init__(self):
+    GRAPH_NODES: Dict[str, str] = {
+        "entry": "_entry_node",
+        "live_local_news": "_live_news_node",
+        "policy_monitor": "_policy_node",
+        "resource_intake": "_resource_node",
+        "event_finder": "_event_node",
+        "research_update": "_research_update_node",
+        "myth_scraper": "_myth_node",
+        "community_impact": "_community_node",
+        "symptom_trend_tracker": "_symptom_node",
+        "science_extraction": "_science_node",
+        "context_rag": "_context_node",
+        "clinical_synthesis": "_clinical_node",
+        "educational_content": "_education_node",
+        "rebellion_framework": "_rebellion_node",
+        "founder_voice": "_founder_node",
+        "marketing_seo": "_marketing_node",
+        "validation": "_validation_node",
+    }
+
+    GRAPH_EDGES: List[Tuple[str, str]] = [
+        ("entry", "live_local_news"),
+        ("live_local_news", "policy_monitor"),
+        ("policy_monitor", "resource_intake"),
+        ("resource_intake", "event_finder"),
+        ("event_finder", "research_update"),
+        ("research_update", "myth_scraper"),
+        ("myth_scraper", "community_impact"),
+        ("community_impact", "symptom_trend_tracker"),
+        ("symptom_trend_tracker", "science_extraction"),
+        ("symptom_trend_tracker", "context_rag"),
+        ("science_extraction", "clinical_synthesis"),
+        ("context_rag", "clinical_synthesis"),
+        ("clinical_synthesis", "educational_content"),
+        ("clinical_synthesis", "rebellion_framework"),
+        ("clinical_synthesis", "founder_voice"),
+        ("educational_content", "marketing_seo"),
+        ("rebellion_framework", "marketing_seo"),
+        ("founder_voice", "marketing_seo"),
+        ("educational_content", "validation"),
+        ("rebellion_framework", "validation"),
+        ("founder_voice", "validation"),
+        ("marketing_seo", "validation"),
+    ]
+
+    # State field each node writes its result to
+    RESULT_FIELDS: Dict[str, str] = {
+        "live_local_news": "live_news_result",
+        "policy_monitor": "policy_result",
+        "resource_intake": "resource_result",
+        "event_finder": "event_result",
+        "research_update": "research_update_result",
+        "myth_scraper": "myth_result",
+        "community_impact": "community_impact_result",
+        "symptom_trend_tracker": "symptom_trend_result",
+        "science_extraction": "science_result",
+        "context_rag": "context_result",
+        "clinical_synthesis": "clinical_result",
+        "educational_content": "educational_result",
+        "rebellion_framework": "rebellion_result",
+        "founder_voice": "founder_voice_result",
+        "marketing_seo": "marketing_result",
+        "validation": "validation_result",
+    }
+
+    # Run inputs (besides the document text) that node outputs depend on
+    CHECKPOINT_INPUT_KEYS: Tuple[str, ...] = (
+        "doc_type",
+        "client_insights",
+        "founder_insights",
+        "st_louis_context",
+        "regional_context",
+        "regional_digest_chunks",
+        "regional_prompt_block",
+        "language_profile",
+        "analytics_insights",
+        "language_watchouts",
+        "persona_summary",
+        "rag_seed_chunks",
+        "health_report_text",
+    )
+
+    def __init__(
+        self,
+        checkpoint_store: Optional[NodeCheckpointStore] = None,
+        enable_checkpoints: Optional[bool] = None,
+    ):
         super().__init__(
             name="EnlitensSupervisor",
             role="Multi-Agent System Orchestrator",
@@ -43,6 +133,14 @@ class SupervisorAgent(BaseAgent):
         self.processing_history: List[Dict[str, Any]] = []
         self.workflow_graph = None
 
+        if enable_checkpoints is None:
+            enable_checkpoints = os.getenv("ENLITENS_SUPERVISOR_CHECKPOINTS", "1").lower() in {"1", "true", "yes", "on"}
+        self.checkpoint_store: Optional[NodeCheckpointStore] = (
+            (checkpoint_store or NodeCheckpointStore()) if enable_checkpoints else None
+        )
+        # Bump a node's version (e.g. after editing its prompt) to bypass its checkpoints.
+        self.node_versions: Dict[str, str] = {}
+
         self.quality_thresholds = {
             "minimum_quality": 0.6,
             "good_quality": 0.8,
@@ -153,51 +251,124 @@ class SupervisorAgent(BaseAgent):
     def _build_graph(self):
         graph = StateGraph(WorkflowState)
 
-        graph.add_node("entry", self._entry_node)
-        graph.add_node("live_local_news", self._live_news_node)
-        graph.add_node("policy_monitor", self._policy_node)
-        graph.add_node("resource_intake", self._resource_node)
-        graph.add_node("event_finder", self._event_node)
-        graph.add_node("research_update", self._research_update_node)
-        graph.add_node("myth_scraper", self._myth_node)
-        graph.add_node("community_impact", self._community_node)
-        graph.add_node("symptom_trend_tracker", self._symptom_node)
-        graph.add_node("science_extraction", self._science_node)
-        graph.add_node("context_rag", self._context_node)
-        graph.add_node("clinical_synthesis", self._clinical_node)
-        graph.add_node("educational_content", self._education_node)
-        graph.add_node("rebellion_framework", self._rebellion_node)
-        graph.add_node("founder_voice", self._founder_node)
-        graph.add_node("marketing_seo", self._marketing_node)
-        graph.add_node("validation", self._validation_node)
+        for node_name, handler_name in self.GRAPH_NODES.items():
+            handler = getattr(self, handler_name)
+            if node_name != "entry":
+                handler = self._checkpointed(node_name, handler)
+            graph.add_node(node_name, handler)
 
         graph.set_entry_point("entry")
-        graph.add_edge("entry", "live_local_news")
-        graph.add_edge("live_local_news", "policy_monitor")
-        graph.add_edge("policy_monitor", "resource_intake")
-        graph.add_edge("resource_intake", "event_finder")
-        graph.add_edge("event_finder", "research_update")
-        graph.add_edge("research_update", "myth_scraper")
-        graph.add_edge("myth_scraper", "community_impact")
-        graph.add_edge("community_impact", "symptom_trend_tracker")
-        graph.add_edge("symptom_trend_tracker", "science_extraction")
-        graph.add_edge("symptom_trend_tracker", "context_rag")
-        graph.add_edge("science_extraction", "clinical_synthesis")
-        graph.add_edge("context_rag", "clinical_synthesis")
-        graph.add_edge("clinical_synthesis", "educational_content")
-        graph.add_edge("clinical_synthesis", "rebellion_framework")
-        graph.add_edge("clinical_synthesis", "founder_voice")
-        graph.add_edge("educational_content", "marketing_seo")
-        graph.add_edge("rebellion_framework", "marketing_seo")
-        graph.add_edge("founder_voice", "marketing_seo")
-        graph.add_edge("educational_content", "validation")
-        graph.add_edge("rebellion_framework", "validation")
-        graph.add_edge("founder_voice", "validation")
-        graph.add_edge("marketing_seo", "validation")
+        for source, target in self.GRAPH_EDGES:
+            graph.add_edge(source, target)
         graph.add_edge("validation", END)
 
         return graph.compile()
 
+    # ----- Checkpointing -------------------------------------------------------------------
+
+    def _upstream_nodes(self, node_name: str) -> List[str]:
+        parents: Dict[str, List[str]] = {}
+        for source, target in self.GRAPH_EDGES:
+            if source != "entry":
+                parents.setdefault(target, []).append(source)
+        ordered: List[str] = []
+        pending = list(parents.get(node_name, []))
+        while pending:
+            node = pending.pop()
+            if node not in ordered:
+                ordered.append(node)
+                pending.extend(parents.get(node, []))
+        return sorted(ordered)
+
+    def _node_fingerprint(self, node_name: str) -> str:
+        """Agent, model and version of the node and of every node upstream of it."""
+        parts = []
+        for node in [node_name, *self._upstream_nodes(node_name)]:
+            agent = self.agents.get(node)
+            parts.append(
+                (node, type(agent).__name__ if agent else None, getattr(agent, "model", None), self.node_versions.get(node, ""))
+            )
+        return hash_content(*parts)
+
+    def _run_fingerprint(self, node_name: str, state: WorkflowState) -> str:
+        """Node fingerprint plus this run's inputs and the upstream outputs present in state."""
+        return hash_content(
+            self._node_fingerprint(node_name),
+            {key: state.get(key) for key in self.CHECKPOINT_INPUT_KEYS},
+            {node: state.get(self.RESULT_FIELDS[node]) for node in self._upstream_nodes(node_name)},
+        )
+
+    def _checkpoint_delta(self, node_name: str, delta: Dict[str, Any]) -> Dict[str, Any]:
+        """The part of a node's delta it produced itself.
+
+        ``_merge_results`` returns full copies of ``intermediate_results`` and
+        ``completed_nodes``; replaying those would put stale upstream values
+        back on top of fresh ones through the merge reducers.
+        """
+        own = {key: value for key, value in delta.items() if key not in {"intermediate_results", "completed_nodes"}}
+        own["intermediate_results"] = dict(delta.get(self.RESULT_FIELDS[node_name]) or {})
+        own["completed_nodes"] = {node_name: "done"}
+        return own
+
+    def _checkpointed(self, node_name: str, handler: Callable[[WorkflowState], Any]):
+        """Wrap a node so completed deltas are persisted and replayed on resume."""
+
+        async def run(state: WorkflowState) -> Dict[str, Any]:
+            checksum = state.get("document_checksum")
+            if not self.checkpoint_store or not checksum:
+                return await handler(state)
+
+            fingerprint = self._run_fingerprint(node_name, state)
+            cached = self.checkpoint_store.load(checksum, node_name, fingerprint)
+            if cached is not None:
+                logger.info("♻️ Resuming %s from checkpoint for %s", node_name, state["document_id"])
+                if "end_timestamp" in cached:
+                    cached["end_timestamp"] = datetime.utcnow()
+                return cached
+
+            delta = await handler(state)
+            if (delta.get("completed_nodes") or {}).get(node_name) == "done":
+                self.checkpoint_store.save(checksum, node_name, fingerprint, self._checkpoint_delta(node_name, delta))
+            return delta
+
+        return run
+
+    def _downstream_nodes(self, nodes: List[str]) -> List[str]:
+        children: Dict[str, List[str]] = {}
+        for source, target in self.GRAPH_EDGES:
+            children.setdefault(source, []).append(target)
+        ordered = list(dict.fromkeys(nodes))
+        for node in ordered:
+            for child in children.get(node, []):
+                if child not in ordered:
+                    ordered.append(child)
+        return ordered
+
+    def invalidate_checkpoints(
+        self,
+        nodes: Optional[List[str]] = None,
+        document_text: Optional[str] = None,
+        include_downstream: bool = True,
+    ) -> int:
+        """
+        Drop stored node checkpoints, e.g. after a prompt or model change.
+
+        ``nodes=None`` clears every node. With ``include_downstream`` the nodes
+        that consume the invalidated outputs are cleared too; without it they
+        still re-run whenever the regenerated output differs, since their
+        fingerprints cover upstream outputs. Pass ``document_text`` to limit
+        the invalidation to one document.
+        """
+        if not self.checkpoint_store:
+            return 0
+        targets = list(self.GRAPH_NODES) if nodes is None else nodes
+        if include_downstream:
+            targets = self._downstream_nodes(targets)
+        checksum = document_checksum(document_text) if document_text is not None else None
+        removed = self.checkpoint_store.invalidate(targets, checksum=checksum)
+        logger.info("🧹 Invalidated %d checkpoint(s) for nodes: %s", removed, ", ".join(targets))
+        return removed
+
     async def process_document(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         logger.info("🎯 Supervisor starting document processing: %s", payload.get("document_id"))
         state = create_initial_state(
@@ -224,7 +395,15 @@ class SupervisorAgent(BaseAgent):
             if key in payload:
                 state[key] = payload[key]
 
+        state["document_checksum"] = payload.get("document_checksum") or document_checksum(payload["document_text"])
+
         final_state = await self.workflow_graph.ainvoke(state)
+        if self.checkpoint_store:
+            # Checkpoints only serve to resume this run; a later run starts fresh
+            self.checkpoint_store.invalidate(
+                [node for node in self.GRAPH_NODES if node != "entry"],
+                checksum=state["document_checksum"],
+            )
         return self._finalize_output(final_state)
 
     async def process(self, context: Dict[str, Any]) -> Dict[str, Any]:
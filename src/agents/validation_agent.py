@@ -5,14 +5,13 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime
-from difflib import SequenceMatcher
 from typing import Any, Dict, List, Optional
 
 from .base_agent import BaseAgent
 from src.synthesis.ollama_client import OllamaClient
+from src.utils.quote_locator import get_quote_locator
 from src.validation.chain_of_verification import ChainOfVerification
-from tools.web.scrape_url import ScrapeUrlRequest, scrape_url
-from tools.web.web_search_ddg import WebSearchRequest, ddg_text_search
+from src.validation.web_quote_verifier import WebQuoteVerifier
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +25,7 @@ class ValidationAgent(BaseAgent):
             role="Content Validation and Quality Assurance",
         )
         self.chain_of_verification = ChainOfVerification()
+        self.web_quote_verifier = WebQuoteVerifier()
         self.self_critique_thresholds = {
             "overall_quality": 0.75,
         }
@@ -76,7 +76,7 @@ class ValidationAgent(BaseAgent):
             quality_scores = self._calculate_quality_scores(complete_output)
             verification_report = self.chain_of_verification.run(complete_output)
             document_text = context.get("document_text") or complete_output.get("full_document_text", "")
-            citation_report = self._verify_citations(complete_output, document_text)
+            citation_report = await self._verify_citations(complete_output, document_text)
 
             quality_scores["fact_checking"] = self._score_fact_checking(citation_report)
             quality_scores["verification_chain"] = 1.0 if verification_report["overall_passed"] else 0.0
@@ -315,7 +315,7 @@ class ValidationAgent(BaseAgent):
                 return None
 
 
-    def _verify_citations(self, output: Dict[str, Any], source_text: str) -> Dict[str, Any]:
+    async def _verify_citations(self, output: Dict[str, Any], source_text: str) -> Dict[str, Any]:
         """Match citations against source text and optionally live web sources."""
         blog = self._ensure_mapping(output.get("blog_content"))
         statistics: List[Dict[str, Any]] = blog.get("statistics", []) if isinstance(blog, dict) else []
@@ -326,6 +326,7 @@ class ValidationAgent(BaseAgent):
         verified = 0
         missing_quotes: List[str] = []
         unresolved: List[Dict[str, Any]] = []
+        locator = get_quote_locator(source_text) if source_text else None
 
         for stat in statistics:
             citation = stat.get("citation") if isinstance(stat, dict) else None
@@ -338,19 +339,15 @@ class ValidationAgent(BaseAgent):
                 continue
 
             claim = stat.get("claim")
-            if quote and quote in source_text:
-                verified += 1
-                continue
-
-            if quote and source_text:
-                matcher = SequenceMatcher(None, quote.lower(), source_text.lower())
-                if matcher.quick_ratio() >= 0.8:
+            if locator is not None:
+                match = locator.locate(quote)
+                if match is not None and match.score >= 0.8:
                     verified += 1
                     continue
 
             unresolved.append({"claim": claim, "quote": quote})
 
-        resolved = self._check_quotes_on_web(unresolved)
+        resolved = await self._check_quotes_on_web(unresolved)
         verified += len(resolved)
 
         failures = [item for item in unresolved if item not in resolved]
@@ -363,32 +360,8 @@ class ValidationAgent(BaseAgent):
         }
 
 
-    def _check_quotes_on_web(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        verified: List[Dict[str, Any]] = []
-        for candidate in candidates[:3]:
-            quote = (candidate.get("quote") or "").strip()
-            if len(quote) < 25:
-                continue
-            query = f'"{quote[:120]}"'
-            try:
-                results = ddg_text_search(WebSearchRequest(query=query, max_results=2))
-            except Exception as exc:
-                logger.debug("Web search failed for citation quote: %s", exc)
-                continue
-
-            for res in results:
-                try:
-                    scraped = scrape_url(ScrapeUrlRequest(url=res.url))
-                except Exception as scrape_exc:
-                    logger.debug("Scrape failed for %s: %s", res.url, scrape_exc)
-                    continue
-                if not scraped:
-                    continue
-                body = scraped.text.lower()
-                if quote.lower() in body:
-                    verified.append(candidate)
-                    break
-        return verified
+    async def _check_quotes_on_web(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return await self.web_quote_verifier.verify(candidates)
 
     def _build_retry_metadata(
         self,
@@ -83,6 +83,7 @@ class WorkflowState(TypedDict, total=False):
     # Required fields
     document_id: str
     document_text: str
+    document_checksum: str
 
     # Optional input context
     doc_type: Optional[str]
@@ -37,19 +37,31 @@ def cmd_ingest(args: argparse.Namespace) -> None:
     vector_store = build_vector_store(args.vector_store, args)
     pipeline = EmbeddingIngestionPipeline(vector_store=vector_store)
 
-    stats = pipeline.ingest_entries(entries, rebuild=args.rebuild)
+    stats = pipeline.ingest_entries(entries, rebuild=args.rebuild, incremental=args.incremental)
     total_chunks = sum(stat.chunks_ingested for stat in stats)
     print(f"Ingested {len(stats)} documents ({total_chunks} chunks) into collection '{args.collection}'.")
+    print(
+        f"Embedded {sum(stat.chunks_embedded for stat in stats)} chunks, "
+        f"reused {sum(stat.chunks_unchanged for stat in stats)} unchanged, "
+        f"deleted {sum(stat.chunks_deleted for stat in stats)} stale."
+    )
 
 
 def cmd_refresh(args: argparse.Namespace) -> None:
     entries = load_knowledge_entries_from_path(args.knowledge_base)
     vector_store = build_vector_store(args.vector_store, args)
     maintenance = IndexMaintenance(EmbeddingIngestionPipeline(vector_store=vector_store))
-    report = maintenance.refresh(entries, schedule=args.schedule, rebuild=args.rebuild)
+    report = maintenance.refresh(
+        entries,
+        schedule=args.schedule,
+        rebuild=args.rebuild,
+        incremental=args.incremental,
+    )
     print(
         f"Refresh complete: {report.documents_processed} documents, "
-        f"{report.total_chunks} chunks (schedule={report.schedule})."
+        f"{report.total_chunks} chunks (schedule={report.schedule}); "
+        f"{report.chunks_embedded} embedded, {report.chunks_unchanged} unchanged, "
+        f"{report.chunks_deleted} deleted."
     )
 
 
@@ -152,12 +164,22 @@ def build_parser() -> argparse.ArgumentParser:
     ingest_parser = subparsers.add_parser("ingest", help="Ingest knowledge base entries")
     ingest_parser.add_argument("--knowledge-base", required=True)
     ingest_parser.add_argument("--rebuild", action="store_true")
+    ingest_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only embed new chunks and delete vanished ones",
+    )
     ingest_parser.set_defaults(func=cmd_ingest)
 
     refresh_parser = subparsers.add_parser("refresh", help="Run scheduled refresh")
     refresh_parser.add_argument("--knowledge-base", required=True)
     refresh_parser.add_argument("--schedule", choices=["nightly", "weekly"], default="nightly")
     refresh_parser.add_argument("--rebuild", action="store_true")
+    refresh_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only embed new chunks and delete vanished ones",
+    )
     refresh_parser.set_defaults(func=cmd_refresh)
 
     verify_parser = subparsers.add_parser("verify", help="Verify index integrity")
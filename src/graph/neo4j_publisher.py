@@ -11,7 +11,7 @@ from __future__ import annotations
 import logging
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -21,24 +21,53 @@ except ImportError:  # pragma: no cover - module may be absent in light envs
     GraphDatabase = None  # type: ignore
 
 
+DEFAULT_BATCH_SIZE = int(os.getenv("ENLITENS_NEO4J_BATCH_SIZE", "200"))
+
+
 def _safe_iter(values: Optional[Iterable[str]]) -> Iterable[str]:
     if not values:
         return []
     return [value for value in values if value]
 
 
+def _document_rows(record: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, str]], List[Dict[str, str]]]:
+    metadata = record.get("metadata") or {}
+    doc_id = record.get("document_id")
+    document = {
+        "document_id": doc_id,
+        "title": metadata.get("title"),
+        "processed_at": metadata.get("processed_at"),
+        "model_key": record.get("model_key"),
+        "checksum": (record.get("source") or {}).get("checksum_sha256"),
+    }
+    tags = [{"document_id": doc_id, "tag": tag} for tag in dict.fromkeys(_safe_iter(metadata.get("tags") or []))]
+    citations = [
+        {"document_id": doc_id, "doi": doi}
+        for doi in dict.fromkeys(_safe_iter((record.get("extraction") or {}).get("citations")))
+    ]
+    return document, tags, citations
+
+
 @dataclass
 class Neo4jPublisher:
     """
     Push document metadata into Neo4j so downstream agents can reason over
     document/tag/citation relationships.
+
+    Documents are written in one transaction per ``batch_size`` records, with
+    their tags and citations grouped into parameterised ``UNWIND`` statements.
     """
 
     uri: Optional[str] = None
     user: Optional[str] = None
     password: Optional[str] = None
+    batch_size: int = DEFAULT_BATCH_SIZE
+    driver: Optional[Any] = None
 
     def __post_init__(self) -> None:
+        if self.driver is not None:
+            return
+
         env_enabled = os.getenv("ENLITENS_ENABLE_NEO4J", "0").lower() in {"1", "true", "yes", "on"}
         if not env_enabled:
             logger.info("Neo4j publisher disabled (set ENLITENS_ENABLE_NEO4J=1 to enable).")
@@ -70,44 +99,65 @@ class Neo4jPublisher:
     # Public API
     # ------------------------------------------------------------------
     def publish_document(self, record: Dict[str, Any]) -> None:
-        if not self.driver:
-            return
+        self.publish_documents([record])
+
+    def publish_documents(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Publish ``records`` in batched transactions; returns the number of transactions committed.
 
-        metadata = record.get("metadata") or {}
-        doc_id = record.get("document_id")
-        title = metadata.get("title")
-        processed_at = metadata.get("processed_at")
-        tags = _safe_iter(metadata.get("tags") or [])
-        citations = _safe_iter((record.get("extraction") or {}).get("citations"))
+        Records without a ``document_id`` are skipped. If a batch fails, its
+        records are retried one per transaction so a single bad record only
+        loses itself.
+        """
+        if not self.driver:
+            return 0
 
+        transactions = 0
+        batch: List[Dict[str, Any]] = []
         session = self.driver.session()
         try:
-            session.execute_write(
-                _upsert_document,
-                document_id=doc_id,
-                title=title,
-                processed_at=processed_at,
-                model_key=record.get("model_key"),
-                checksum=(record.get("source") or {}).get("checksum_sha256"),
-            )
-
-            for tag in tags:
-                session.execute_write(
-                    _link_tag,
-                    document_id=doc_id,
-                    tag=tag,
-                )
-
-            for doi in citations:
-                session.execute_write(
-                    _link_citation,
-                    document_id=doc_id,
-                    doi=doi,
-                )
-        except Exception as exc:  # pragma: no cover - graph error
-            logger.error("Neo4j publish failed for %s: %s", doc_id, exc)
+            for record in records:
+                if not record.get("document_id"):
+                    logger.warning("Skipping Neo4j publish for a record without document_id")
+                    continue
+                batch.append(record)
+                if len(batch) >= max(1, self.batch_size):
+                    transactions += self._publish_batch(session, batch)
+                    batch = []
+            if batch:
+                transactions += self._publish_batch(session, batch)
         finally:
             session.close()
+        return transactions
+
+    def _publish_batch(self, session: Any, records: List[Dict[str, Any]]) -> int:
+        if self._write(session, records):
+            return 1
+        if len(records) == 1:
+            return 0
+        logger.info("Retrying %d document(s) one transaction at a time", len(records))
+        return sum(self._write(session, [record]) for record in records)
+
+    def _write(self, session: Any, records: List[Dict[str, Any]]) -> bool:
+        documents: List[Dict[str, Any]] = []
+        tags: List[Dict[str, str]] = []
+        citations: List[Dict[str, str]] = []
+        for record in records:
+            document, document_tags, document_citations = _document_rows(record)
+            documents.append(document)
+            tags.extend(document_tags)
+            citations.extend(document_citations)
+
+        try:
+            session.execute_write(_publish_rows, documents=documents, tags=tags, citations=citations)
+        except Exception as exc:
+            logger.error(
+                "Neo4j publish failed for %d document(s) starting at %s: %s",
+                len(documents),
+                documents[0]["document_id"],
+                exc,
+            )
+            return False
+        return True
 
     def close(self) -> None:
         if self.driver:
@@ -117,44 +167,35 @@ class Neo4jPublisher:
 # ----------------------------------------------------------------------
 # Cypher helpers
 # ----------------------------------------------------------------------
-def _upsert_document(tx, *, document_id: str, title: Optional[str], processed_at: Optional[str], model_key: Optional[str], checksum: Optional[str]):
-    tx.run(
-        """
-        MERGE (d:Document {document_id: $document_id})
-        SET d.title = $title,
-            d.processed_at = $processed_at,
-            d.model_key = $model_key,
-            d.checksum_sha256 = $checksum
-        """,
-        document_id=document_id,
-        title=title,
-        processed_at=processed_at,
-        model_key=model_key,
-        checksum=checksum,
-    )
-
-
-def _link_tag(tx, *, document_id: str, tag: str):
+def _publish_rows(tx, *, documents: List[Dict[str, Any]], tags: List[Dict[str, str]], citations: List[Dict[str, str]]):
     tx.run(
         """
-        MERGE (t:Tag {name: $tag})
-        MERGE (d:Document {document_id: $document_id})
-        MERGE (d)-[:HAS_TAG]->(t)
+        UNWIND $rows AS row
+        MERGE (d:Document {document_id: row.document_id})
+        SET d.title = row.title,
+            d.processed_at = row.processed_at,
+            d.model_key = row.model_key,
+            d.checksum_sha256 = row.checksum
         """,
-        document_id=document_id,
-        tag=tag,
+        rows=documents,
     )
-
-
-def _link_citation(tx, *, document_id: str, doi: str):
-    tx.run(
-        """
-        MERGE (c:Citation {doi: $doi})
-        MERGE (d:Document {document_id: $document_id})
-        MERGE (d)-[:CITES]->(c)
-        """,
-        document_id=document_id,
-        doi=doi,
-    )
-
-
+    if tags:
+        tx.run(
+            """
+            UNWIND $rows AS row
+            MERGE (t:Tag {name: row.tag})
+            MERGE (d:Document {document_id: row.document_id})
+            MERGE (d)-[:HAS_TAG]->(t)
+            """,
+            rows=tags,
+        )
+    if citations:
+        tx.run(
+            """
+            UNWIND $rows AS row
+            MERGE (c:Citation {doi: row.doi})
+            MERGE (d:Document {document_id: row.document_id})
+            MERGE (d)-[:CITES]->(c)
+            """,
+            rows=citations,
+        )
@@ -0,0 +1,233 @@
+"""
+Inverted Index for the Knowledge Base
+
+Maps tokens to ``(paper_id, field)`` postings with token positions so
+``KnowledgeBaseManager`` can answer searches without walking every paper:
+
+- substring queries use the postings to pick candidate fields, then confirm
+  them with the original case-insensitive substring test (same results as a
+  full scan)
+- phrase queries match consecutive whole tokens using positions
+- candidates are ranked with BM25 over the query tokens
+"""
+
+import json
+import logging
+import math
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+_TOKEN_RE = re.compile(r"\w+")
+# Position gap between separate strings of one field so phrases never span them.
+_STRING_GAP = 1000
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+
+def _posting_key(paper_id: Any, field: str) -> str:
+    return f"{paper_id}\t{field}"
+
+
+def _split_key(key: str) -> Tuple[str, str]:
+    paper_id, field = key.split("\t", 1)
+    return paper_id, field
+
+
+def _iter_strings(content: Any) -> Iterable[str]:
+    """Yield string leaves in the same traversal order as the substring search."""
+    if isinstance(content, str):
+        yield content
+    elif isinstance(content, list):
+        for item in content:
+            yield from _iter_strings(item)
+    elif isinstance(content, dict):
+        for value in content.values():
+            yield from _iter_strings(value)
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class InvertedIndex:
+    """Token → ``{posting_key: [positions]}`` index persisted as JSON."""
+
+    def __init__(self, index_path: Path):
+        self.index_path = Path(index_path)
+        self.postings: Dict[str, Dict[str, List[int]]] = {}
+        self.field_lengths: Dict[str, int] = {}
+        # Running sum of field_lengths so BM25 never re-totals it per candidate
+        self.total_length = 0
+        self.paper_ids: List[str] = []
+        self.kb_last_updated: Optional[str] = None
+
+    # ------------------------------------------------------------------ build
+    def add_paper(self, paper: Dict[str, Any]) -> None:
+        paper_id = str(paper["id"])
+        for field, content in (paper.get("data") or {}).items():
+            key = _posting_key(paper_id, field)
+            position = 0
+            length = 0
+            for text in _iter_strings(content):
+                for token in tokenize(text):
+                    self.postings.setdefault(token, {}).setdefault(key, []).append(position)
+                    position += 1
+                    length += 1
+                position += _STRING_GAP
+            self.total_length += length - self.field_lengths.get(key, 0)
+            self.field_lengths[key] = length
+        self.paper_ids.append(paper_id)
+
+    def remove_paper(self, paper: Dict[str, Any]) -> None:
+        paper_id = str(paper["id"])
+        for field, content in (paper.get("data") or {}).items():
+            key = _posting_key(paper_id, field)
+            for token in {token for text in _iter_strings(content) for token in tokenize(text)}:
+                postings = self.postings.get(token)
+                if postings is None:
+                    continue
+                postings.pop(key, None)
+                if not postings:
+                    del self.postings[token]
+            self.total_length -= self.field_lengths.pop(key, 0)
+        if paper_id in self.paper_ids:
+            self.paper_ids.remove(paper_id)
+
+    def rebuild(self, papers: Iterable[Dict[str, Any]], kb_last_updated: Optional[str] = None) -> None:
+        self.postings = {}
+        self.field_lengths = {}
+        self.total_length = 0
+        self.paper_ids = []
+        for paper in papers:
+            self.add_paper(paper)
+        self.kb_last_updated = kb_last_updated
+
+    # ------------------------------------------------------------ persistence
+    def load(self) -> bool:
+        """Load the persisted index. Returns False when missing or unreadable."""
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return False
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable knowledge base index {self.index_path}: {e}")
+            return False
+        if payload.get("version") != INDEX_VERSION:
+            return False
+        self.postings = payload.get("postings", {})
+        self.field_lengths = payload.get("field_lengths", {})
+        self.total_length = sum(self.field_lengths.values())
+        self.paper_ids = payload.get("paper_ids", [])
+        self.kb_last_updated = payload.get("kb_last_updated")
+        return True
+
+    def save(self) -> None:
+        payload = {
+            "version": INDEX_VERSION,
+            "kb_last_updated": self.kb_last_updated,
+            "paper_ids": self.paper_ids,
+            "field_lengths": self.field_lengths,
+            "postings": self.postings,
+        }
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(self.index_path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.index_path)
+
+    def is_current(self, papers: List[Dict[str, Any]], kb_last_updated: Optional[str]) -> bool:
+        return self.kb_last_updated == kb_last_updated and self.paper_ids == [str(p["id"]) for p in papers]
+
+    # ------------------------------------------------------------------ query
+    def _vocabulary_matches(self, token: str, left_open: bool, right_open: bool) -> List[str]:
+        if not left_open and not right_open:
+            return [token] if token in self.postings else []
+        if left_open and right_open:
+            return [term for term in self.postings if token in term]
+        if right_open:
+            return [term for term in self.postings if term.startswith(token)]
+        return [term for term in self.postings if term.endswith(token)]
+
+    def substring_candidates(
+        self, query: str, fields: Optional[Set[str]] = None
+    ) -> Optional[Dict[str, Dict[str, int]]]:
+        """
+        Return ``{posting_key: {query_token: tf}}`` for fields that may contain ``query``.
+
+        Returns ``None`` when the query has no word characters and cannot be
+        answered from the index. Tokens at the edges of the query may be
+        partial words, so they match by suffix/prefix/infix; inner tokens must
+        match exactly.
+        """
+        query = query.lower()
+        matches = list(_TOKEN_RE.finditer(query))
+        if not matches:
+            return None
+
+        candidates: Optional[Dict[str, Dict[str, int]]] = None
+        for match in matches:
+            token = match.group()
+            terms = self._vocabulary_matches(token, match.start() == 0, match.end() == len(query))
+            token_hits: Dict[str, int] = {}
+            for term in terms:
+                for key, positions in self.postings[term].items():
+                    if fields is not None and _split_key(key)[1] not in fields:
+                        continue
+                    token_hits[key] = token_hits.get(key, 0) + len(positions)
+            if candidates is None:
+                candidates = {key: {token: tf} for key, tf in token_hits.items()}
+            else:
+                candidates = {
+                    key: {**hits, token: token_hits[key]} for key, hits in candidates.items() if key in token_hits
+                }
+            if not candidates:
+                return {}
+        return candidates or {}
+
+    def phrase_matches(self, phrase: str, fields: Optional[Set[str]] = None) -> Dict[str, Dict[str, int]]:
+        """Return posting keys containing the whole-token sequence ``phrase``."""
+        tokens = tokenize(phrase)
+        if not tokens or any(token not in self.postings for token in tokens):
+            return {}
+        results: Dict[str, Dict[str, int]] = {}
+        first = self.postings[tokens[0]]
+        for key, starts in first.items():
+            if fields is not None and _split_key(key)[1] not in fields:
+                continue
+            position_sets = [set(self.postings[token].get(key, ())) for token in tokens[1:]]
+            if any(not positions for positions in position_sets):
+                continue
+            hits = sum(
+                1
+                for start in starts
+                if all(start + offset + 1 in positions for offset, positions in enumerate(position_sets))
+            )
+            if hits:
+                results[key] = {token: hits for token in tokens}
+        return results
+
+    def bm25_scores(
+        self, candidates: Dict[str, Dict[str, int]], document_frequency: Dict[str, int]
+    ) -> Dict[str, float]:
+        """Score every ``{posting_key: {token: tf}}`` candidate with BM25 over the query tokens."""
+        total_fields = max(len(self.field_lengths), 1)
+        average_length = (self.total_length / total_fields) or 1.0
+        idf = {
+            token: math.log(1 + (total_fields - df + 0.5) / (df + 0.5)) for token, df in document_frequency.items()
+        }
+        # Per-field saturation term k1 * (1 - b + b * length / avgdl) split into constant and slope
+        base = _BM25_K1 * (1 - _BM25_B)
+        slope = _BM25_K1 * _BM25_B / average_length
+        field_lengths = self.field_lengths
+        scores: Dict[str, float] = {}
+        for key, token_tfs in candidates.items():
+            norm = base + slope * field_lengths.get(key, 0)
+            scores[key] = sum(
+                idf[token] * tf * (_BM25_K1 + 1) / (tf + norm) for token, tf in token_tfs.items()
+            )
+        return scores
@@ -18,6 +18,8 @@ import logging
 from datetime import datetime
 import shutil
 
+from .inverted_index import InvertedIndex, tokenize
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,11 +36,34 @@ class KnowledgeBaseManager:
     """
     
     def __init__(self, knowledge_base_path: str = "./knowledge_base.json", 
-                 processed_files_path: str = "./processed_files.json"):
+                 processed_files_path: str = "./processed_files.json",
+                 index_path: Optional[str] = None):
         self.knowledge_base_path = Path(knowledge_base_path)
         self.processed_files_path = Path(processed_files_path)
         self.processed_files = self._load_processed_files()
         self.knowledge_base = self._load_knowledge_base()
+        self.index = InvertedIndex(
+            Path(index_path) if index_path else self.knowledge_base_path.with_suffix(".index.json")
+        )
+        self._load_or_rebuild_index()
+
+    def _load_or_rebuild_index(self):
+        """Load the persisted search index, rebuilding it if it is stale"""
+        papers = self.knowledge_base['papers']
+        last_updated = self.knowledge_base['metadata'].get('last_updated')
+        if self.index.load() and self.index.is_current(papers, last_updated):
+            return
+        logger.info(f"Building knowledge base search index for {len(papers)} papers")
+        self.index.rebuild(papers, last_updated)
+        self._save_index()
+
+    def _save_index(self):
+        """Save the search index"""
+        self.index.kb_last_updated = self.knowledge_base['metadata'].get('last_updated')
+        try:
+            self.index.save()
+        except Exception as e:
+            logger.error(f"Failed to save knowledge base index: {e}")
         
     def _load_processed_files(self) -> Dict[str, Any]:
         """Load the processed files registry"""
@@ -132,9 +157,9 @@ class KnowledgeBaseManager:
                 logger.info(f"File already processed: {file_path}")
                 return True
             
-            # Add paper to knowledge base
+            # Add paper to knowledge base (max + 1 so ids stay unique after deduplication)
             paper_entry = {
-                'id': len(self.knowledge_base['papers']) + 1,
+                'id': max((paper['id'] for paper in self.knowledge_base['papers']), default=0) + 1,
                 'file_path': file_path,
                 'file_hash': file_hash,
                 'processed_timestamp': datetime.now().isoformat(),
@@ -144,6 +169,7 @@ class KnowledgeBaseManager:
             self.knowledge_base['papers'].append(paper_entry)
             self.knowledge_base['metadata']['total_papers'] = len(self.knowledge_base['papers'])
             self.knowledge_base['metadata']['last_updated'] = datetime.now().isoformat()
+            self.index.add_paper(paper_entry)
             
             # Mark as processed
             self.processed_files[file_hash] = {
@@ -152,9 +178,10 @@ class KnowledgeBaseManager:
                 'paper_id': paper_entry['id']
             }
             
-            # Save both files
+            # Save both files and the search index
             self._save_knowledge_base()
             self._save_processed_files()
+            self._save_index()
             
             logger.info(f"Added paper to knowledge base: {file_path}")
             return True
@@ -234,8 +261,82 @@ class KnowledgeBaseManager:
             return False
     
     def search_knowledge_base(self, query: str, 
+                           content_types: Optional[List[str]] = None,
+                           phrase: bool = False,
+                           limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Search the knowledge base using the inverted index.
+
+        By default a paper field matches when it contains ``query`` as a
+        case-insensitive substring. With ``phrase=True`` (or a query wrapped in
+        double quotes) the query must appear as consecutive whole words.
+        ``content_types`` restricts which fields are searched. Results are
+        ranked by BM25 score, best first.
+        """
+        stripped = query.strip()
+        if len(stripped) > 1 and stripped.startswith('"') and stripped.endswith('"'):
+            phrase = True
+            query = stripped[1:-1]
+        fields = set(content_types) if content_types else None
+
+        if phrase:
+            candidates = self.index.phrase_matches(query, fields)
+            confirmed = set(candidates)
+        else:
+            candidates = self.index.substring_candidates(query, fields)
+            if candidates is None:
+                # No word characters to look up; fall back to a full scan
+                return self._scan_knowledge_base(query, content_types)[:limit]
+            query_lower = query.lower()
+            if tokenize(query_lower) == [query_lower]:
+                # A single-token query is a substring of every indexed term it matched
+                confirmed = set(candidates)
+            else:
+                confirmed = self._confirm_candidates(candidates, query_lower)
+
+        document_frequency: Dict[str, int] = {}
+        for key in confirmed:
+            for token in candidates[key]:
+                document_frequency[token] = document_frequency.get(token, 0) + 1
+
+        field_scores = self.index.bm25_scores({key: candidates[key] for key in confirmed}, document_frequency)
+        scores: Dict[str, float] = {}
+        matches: Dict[str, List[str]] = {}
+        for key, score in field_scores.items():
+            paper_id, field = key.split("\t", 1)
+            scores[paper_id] = scores.get(paper_id, 0.0) + score
+            matches.setdefault(paper_id, []).append(field)
+
+        results = []
+        for paper in self.knowledge_base['papers']:
+            paper_id = str(paper['id'])
+            if paper_id not in matches:
+                continue
+            field_order = list(paper['data'].keys())
+            results.append({
+                'paper_id': paper['id'],
+                'file_path': paper['file_path'],
+                'matches': sorted(matches[paper_id], key=field_order.index),
+                'score': round(scores[paper_id], 4),
+                'data': paper['data']
+            })
+        results.sort(key=lambda result: result['score'], reverse=True)
+        return results[:limit]
+
+    def _confirm_candidates(self, candidates: Dict[str, Dict[str, int]], query_lower: str) -> Set[str]:
+        """Keep the candidate fields that really contain ``query_lower`` as a substring"""
+        papers_by_id = {str(paper['id']): paper for paper in self.knowledge_base['papers']}
+        confirmed = set()
+        for key in candidates:
+            paper_id, field = key.split("\t", 1)
+            paper = papers_by_id.get(paper_id)
+            if paper and self._search_in_content(paper['data'].get(field), query_lower):
+                confirmed.add(key)
+        return confirmed
+
+    def _scan_knowledge_base(self, query: str, 
                            content_types: Optional[List[str]] = None) -> List[Dict[str, Any]]:
-        """Search the knowledge base"""
+        """Search the knowledge base by walking every paper (substring semantics)"""
         results = []
         query_lower = query.lower()
         
@@ -261,6 +362,7 @@ class KnowledgeBaseManager:
                     'paper_id': paper['id'],
                     'file_path': paper['file_path'],
                     'matches': matches,
+                    'score': 0.0,
                     'data': paper_data
                 })
         
@@ -311,14 +413,16 @@ class KnowledgeBaseManager:
                 unique_papers.append(paper)
             else:
                 duplicates_removed['papers'] += 1
+                self.index.remove_paper(paper)
         
         # Update knowledge base
         self.knowledge_base['papers'] = unique_papers
         self.knowledge_base['metadata']['total_papers'] = len(unique_papers)
         self.knowledge_base['metadata']['last_updated'] = datetime.now().isoformat()
         
-        # Save updated knowledge base
+        # Save updated knowledge base and search index
         self._save_knowledge_base()
+        self._save_index()
         
         return duplicates_removed
     
@@ -375,6 +479,7 @@ class KnowledgeBaseManager:
             # Reload data
             self.processed_files = self._load_processed_files()
             self.knowledge_base = self._load_knowledge_base()
+            self._load_or_rebuild_index()
             
             logger.info(f"Restored knowledge base from: {backup_path}")
             return True
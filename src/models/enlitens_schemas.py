@@ -79,14 +79,10 @@ class VerifiedStatistic(BaseModel):
         context = info.context
         if context and 'source_text' in context:
             source = context['source_text']
-            # Check if quote appears in source
+            # Check if quote appears in source, allowing minor variations per sentence
             if v.quote not in source:
-                # Try fuzzy match (allow minor variations)
-                import difflib
-                # Split source into sentences
-                sentences = source.split('. ')
-                best_match = difflib.get_close_matches(v.quote, sentences, n=1, cutoff=0.8)
-                if not best_match:
+                from src.utils.quote_locator import get_quote_locator
+                if not get_quote_locator(source).contains(v.quote, cutoff=0.8):
                     raise ValueError(
                         f"HALLUCINATION DETECTED: Citation not found in source text. "
                         f"Quote: '{v.quote[:100]}...'"
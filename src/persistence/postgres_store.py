@@ -4,48 +4,114 @@ PostgreSQL persistence for processed knowledge entries.
 """
 from __future__ import annotations
 
+import hashlib
+import io
 import json
 import logging
 import os
+import struct
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np
 
 try:  # Optional dependency
     import psycopg2
     from psycopg2 import OperationalError
-    from psycopg2.extras import Json
-    from psycopg2.extensions import AsIs, ISOLATION_LEVEL_AUTOCOMMIT, register_adapter
+    from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 except ImportError:  # pragma: no cover - psycopg2 may not be installed in lightweight envs
     psycopg2 = None  # type: ignore
     OperationalError = Exception  # type: ignore
-    Json = None  # type: ignore
-    AsIs = None  # type: ignore
     ISOLATION_LEVEL_AUTOCOMMIT = None  # type: ignore
-    register_adapter = None  # type: ignore
 
 from .embedding_provider import EmbeddingProvider, get_embedding_provider
 
 logger = logging.getLogger(__name__)
 
 
-class VectorParam(list):
-    """Wrapper to adapt Python lists to pgvector literals."""
+if TYPE_CHECKING:
+    from psycopg2.extensions import connection as PsycopgConnection  # pragma: no cover
+else:
+    PsycopgConnection = Any
 
 
-def _adapt_vector(vector: "VectorParam") -> AsIs:
-    literal = "[" + ",".join(f"{float(x):.6f}" for x in vector) + "]"
-    return AsIs(f"'{literal}'")
+DEFAULT_BATCH_SIZE = int(os.getenv("ENLITENS_POSTGRES_BATCH_SIZE", "500"))
 
+# Columns of ``documents`` in load order. Batches are COPYed into a temp table
+# of text/boolean/vector columns and upserted from there with casts.
+_DOCUMENT_COLUMNS = (
+    "document_id", "title", "primary_topic", "model_key", "processed_at", "source_pdf",
+    "checksum_sha256", "tags", "metadata", "docling", "extraction", "enrichment",
+    "knowledge_entry", "gemini_validated", "embedding", "sections_sha256",
+)
+_DOCUMENT_CASTS = {
+    "processed_at": "::timestamptz",
+    "tags": "::jsonb",
+    "metadata": "::jsonb",
+    "docling": "::jsonb",
+    "extraction": "::jsonb",
+    "enrichment": "::jsonb",
+    "knowledge_entry": "::jsonb",
+}
 
-if register_adapter and AsIs:
-    register_adapter(VectorParam, _adapt_vector)
+# Binary COPY framing (see the PostgreSQL COPY docs): signature, flags, extension length.
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_COPY_TRAILER = struct.pack(">h", -1)
+
+
+def _copy_field(value: Optional[bytes]) -> bytes:
+    if value is None:
+        return struct.pack(">i", -1)
+    return struct.pack(">i", len(value)) + value
+
+
+def _vector_binary(vector: Optional[Sequence[float]]) -> Optional[bytes]:
+    """Encode a vector in pgvector's binary wire format (dim, unused, float4 big-endian)."""
+    if vector is None or len(vector) == 0:
+        return None
+    values = np.asarray(vector, dtype=">f4")
+    return struct.pack(">HH", len(values), 0) + values.tobytes()
 
-if TYPE_CHECKING:
-    from psycopg2.extensions import connection as PsycopgConnection  # pragma: no cover
-else:
-    PsycopgConnection = Any
+
+def _copy_value(value: Any) -> bytes:
+    """Encode one field: ``None`` → NULL, ``bool`` → boolean, ``str`` → text, anything else → vector."""
+    if value is None:
+        return _copy_field(None)
+    if isinstance(value, bool):
+        return _copy_field(b"\x01" if value else b"\x00")
+    if isinstance(value, str):
+        return _copy_field(value.encode("utf-8"))
+    return _copy_field(_vector_binary(value))
+
+
+def encode_copy(rows: Iterable[Sequence[Any]]) -> bytes:
+    """Serialise rows of text/boolean/vector fields for ``COPY ... FROM STDIN WITH (FORMAT BINARY)``."""
+    buffer = io.BytesIO()
+    buffer.write(_COPY_HEADER)
+    for row in rows:
+        buffer.write(struct.pack(">h", len(row)))
+        for value in row:
+            buffer.write(_copy_value(value))
+    buffer.write(_COPY_TRAILER)
+    return buffer.getvalue()
+
+
+def encode_sections_copy(rows: Iterable[Tuple[str, str, str, str, Optional[Sequence[float]]]]) -> bytes:
+    """Serialise section rows for ``COPY sections ... FROM STDIN WITH (FORMAT BINARY)``."""
+    return encode_copy(rows)
+
+
+def section_checksum(sections: Sequence[Tuple[str, str]]) -> str:
+    """Stable digest of a document's ``(section_name, content)`` pairs."""
+    hasher = hashlib.sha256()
+    for name, content in sections:
+        hasher.update(name.encode("utf-8"))
+        hasher.update(b"\x00")
+        hasher.update(content.encode("utf-8"))
+        hasher.update(b"\x01")
+    return hasher.hexdigest()
 
 
 def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
@@ -114,8 +180,10 @@ class PostgresStore:
         *,
         dsn: Optional[str] = None,
         embedding_provider: Optional[EmbeddingProvider] = None,
+        connection_factory: Optional[Callable[[], Any]] = None,
     ) -> None:
         self.dsn = dsn or os.getenv("DATABASE_URL", "postgresql://localhost/enlitens")
+        self.connection_factory = connection_factory
         self.embedding_provider = embedding_provider or get_embedding_provider()
         self._conn: Optional[Any] = None
         self.available = True
@@ -152,7 +220,7 @@ class PostgresStore:
             return self._conn
 
         logger.debug("Connecting to Postgres at %s", self.dsn)
-        conn = psycopg2.connect(self.dsn)
+        conn = self.connection_factory() if self.connection_factory else psycopg2.connect(self.dsn)
         if ISOLATION_LEVEL_AUTOCOMMIT is not None:
             conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
         self._conn = conn
@@ -172,6 +240,26 @@ class PostgresStore:
         else:
             cur.close()
 
+    @contextmanager
+    def transaction(self):
+        """Yield a cursor whose statements commit (or roll back) together."""
+        if not self.available:
+            raise RuntimeError("PostgresStore is not available.")
+        conn = self._connect()
+        previous_autocommit = conn.autocommit
+        conn.autocommit = False
+        cur = conn.cursor()
+        try:
+            yield cur
+        except Exception:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+        finally:
+            cur.close()
+            conn.autocommit = previous_autocommit
+
     # ------------------------------------------------------------------
     # Schema
     # ------------------------------------------------------------------
@@ -202,6 +290,7 @@ class PostgresStore:
                 )
                 """
             )
+            cur.execute("ALTER TABLE documents ADD COLUMN IF NOT EXISTS sections_sha256 TEXT")
             cur.execute(
                 f"""
                 CREATE TABLE IF NOT EXISTS sections (
@@ -213,6 +302,7 @@ class PostgresStore:
                 )
                 """
             )
+            cur.execute("ALTER TABLE sections ADD COLUMN IF NOT EXISTS content_sha256 TEXT")
             cur.execute(
                 "CREATE INDEX IF NOT EXISTS idx_sections_document ON sections(document_id, section_name)"
             )
@@ -221,100 +311,151 @@ class PostgresStore:
     # Public API
     # ------------------------------------------------------------------
     def upsert_record(self, record: Dict[str, Any]) -> None:
+        """Upsert one record; a single-document ``upsert_records`` batch."""
+        self.upsert_records([record])
+
+    def upsert_records(self, records: Iterable[Dict[str, Any]], *, batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, int]:
+        """
+        Load many records with one transaction per ``batch_size`` documents.
+
+        Documents (embeddings included) are binary-``COPY``ed into a temp table
+        and upserted from it in one statement. Only documents whose section
+        checksum changed are re-embedded and have their sections rewritten
+        (one ``DELETE`` plus a binary ``COPY``); unchanged documents keep their
+        stored embedding. Returns load counters.
+        """
+        stats = {"documents": 0, "sections_written": 0, "documents_skipped_sections": 0, "batches": 0}
         if not self.available:
-            return
-
-        payload = self._build_payload(record)
-        section_texts = [text for _, text in payload.section_payloads]
-        section_embeddings: List[List[float]] = []
-        if section_texts:
-            section_embeddings = self.embedding_provider.embed(section_texts)
-
-        document_embedding: Optional[List[float]] = None
-        if payload.document_text:
-            embedded = self.embedding_provider.embed_one(payload.document_text)
-            if embedded:
-                document_embedding = embedded
-
-        with self.cursor() as cur:
+            return stats
+
+        batch: List[Dict[str, Any]] = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= max(1, batch_size):
+                self._upsert_batch(batch, stats)
+                batch = []
+        if batch:
+            self._upsert_batch(batch, stats)
+        return stats
+
+    def _upsert_batch(self, records: List[Dict[str, Any]], stats: Dict[str, int]) -> None:
+        # Later duplicates win, matching repeated upsert_record calls.
+        payloads = list({payload.document_id: payload for payload in map(self._build_payload, records)}.values())
+        checksums = {payload.document_id: section_checksum(payload.section_payloads) for payload in payloads}
+
+        with self.transaction() as cur:
             cur.execute(
-                """
-                INSERT INTO documents (
-                    document_id,
-                    title,
-                    primary_topic,
-                    model_key,
-                    processed_at,
-                    source_pdf,
-                    checksum_sha256,
-                    tags,
-                    metadata,
-                    docling,
-                    extraction,
-                    enrichment,
-                    knowledge_entry,
-                    gemini_validated,
-                    embedding
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (document_id) DO UPDATE SET
-                    title = EXCLUDED.title,
-                    primary_topic = EXCLUDED.primary_topic,
-                    model_key = EXCLUDED.model_key,
-                    processed_at = EXCLUDED.processed_at,
-                    source_pdf = EXCLUDED.source_pdf,
-                    checksum_sha256 = EXCLUDED.checksum_sha256,
-                    tags = EXCLUDED.tags,
-                    metadata = EXCLUDED.metadata,
-                    docling = EXCLUDED.docling,
-                    extraction = EXCLUDED.extraction,
-                    enrichment = EXCLUDED.enrichment,
-                    knowledge_entry = EXCLUDED.knowledge_entry,
-                    gemini_validated = EXCLUDED.gemini_validated,
-                    embedding = EXCLUDED.embedding
-                """,
-                (
-                    payload.document_id,
-                    payload.title,
-                    payload.primary_topic,
-                    payload.model_key,
-                    payload.processed_at,
-                    payload.source_pdf,
-                    payload.checksum,
-                    Json(list(payload.tags)) if Json else None,
-                    Json(payload.metadata) if Json else json.dumps(payload.metadata),
-                    Json(payload.docling) if Json else json.dumps(payload.docling),
-                    Json(payload.extraction) if Json else json.dumps(payload.extraction),
-                    Json(payload.enrichment) if Json else json.dumps(payload.enrichment),
-                    Json(payload.knowledge_entry) if (Json and payload.knowledge_entry is not None) else (
-                        json.dumps(payload.knowledge_entry) if payload.knowledge_entry is not None else None
-                    ),
-                    payload.gemini_validated,
-                    VectorParam(document_embedding) if (document_embedding and register_adapter) else None,
+                "SELECT document_id, sections_sha256 FROM documents WHERE document_id = ANY(%s)",
+                ([payload.document_id for payload in payloads],),
+            )
+            existing = {row[0]: row[1] for row in cur.fetchall()}
+            changed = [payload for payload in payloads if existing.get(payload.document_id) != checksums[payload.document_id]]
+
+            # One embedding call covers the changed documents and their sections
+            document_texts = [(payload.document_id, payload.document_text) for payload in changed if payload.document_text]
+            section_rows = [
+                (payload.document_id, name, content)
+                for payload in changed
+                for name, content in payload.section_payloads
+            ]
+            texts = [text for _, text in document_texts] + [content for _, _, content in section_rows]
+            embedded = self.embedding_provider.embed(texts) if texts else []
+            embedded = list(embedded) + [None] * (len(texts) - len(embedded))
+            document_embeddings = {
+                document_id: vector or None for (document_id, _), vector in zip(document_texts, embedded)
+            }
+            section_embeddings = embedded[len(document_texts):]
+
+            self._ensure_stage(cur)
+            cur.copy_expert(
+                f"COPY documents_stage ({', '.join(_DOCUMENT_COLUMNS)}) FROM STDIN WITH (FORMAT BINARY)",
+                io.BytesIO(
+                    encode_copy(
+                        self._document_row(payload, document_embeddings.get(payload.document_id), checksums[payload.document_id])
+                        for payload in payloads
+                    )
                 ),
             )
+            updates = ",\n                    ".join(
+                f"{column} = EXCLUDED.{column}"
+                for column in _DOCUMENT_COLUMNS
+                if column not in {"document_id", "embedding"}
+            )
+            cur.execute(
+                f"""
+                INSERT INTO documents ({', '.join(_DOCUMENT_COLUMNS)})
+                SELECT {', '.join(column + _DOCUMENT_CASTS.get(column, '') for column in _DOCUMENT_COLUMNS)}
+                FROM documents_stage
+                ON CONFLICT (document_id) DO UPDATE SET
+                    {updates},
+                    embedding = CASE
+                        WHEN documents.sections_sha256 IS NOT DISTINCT FROM EXCLUDED.sections_sha256
+                        THEN documents.embedding
+                        ELSE EXCLUDED.embedding
+                    END
+                """
+            )
 
-            cur.execute("DELETE FROM sections WHERE document_id = %s", (payload.document_id,))
-            if payload.section_payloads:
-                section_rows = []
-                for (section_name, content), embedding in zip(
-                    payload.section_payloads,
-                    section_embeddings or [None] * len(payload.section_payloads),
-                ):
-                    section_rows.append(
-                        (
-                            payload.document_id,
-                            section_name,
-                            content,
-                            VectorParam(embedding) if (embedding and register_adapter) else None,
-                        )
-                    )
-                cur.executemany(
-                    """
-                    INSERT INTO sections (document_id, section_name, content, embedding)
-                    VALUES (%s, %s, %s, %s)
-                    """,
-                    section_rows,
+            if changed:
+                cur.execute(
+                    "DELETE FROM sections WHERE document_id = ANY(%s)",
+                    ([payload.document_id for payload in changed],),
                 )
+                if section_rows:
+                    copy_rows = [
+                        (document_id, name, content, hashlib.sha256(content.encode("utf-8")).hexdigest(), embedding)
+                        for (document_id, name, content), embedding in zip(section_rows, section_embeddings)
+                    ]
+                    cur.copy_expert(
+                        "COPY sections (document_id, section_name, content, content_sha256, embedding) "
+                        "FROM STDIN WITH (FORMAT BINARY)",
+                        io.BytesIO(encode_sections_copy(copy_rows)),
+                    )
+                stats["sections_written"] += len(section_rows)
+
+        stats["documents"] += len(payloads)
+        stats["documents_skipped_sections"] += len(payloads) - len(changed)
+        stats["batches"] += 1
+
+    def _ensure_stage(self, cur: Any) -> None:
+        """Create the per-session staging table for document COPYs (emptied on commit)."""
+        columns = []
+        for column in _DOCUMENT_COLUMNS:
+            if column == "gemini_validated":
+                columns.append(f"{column} BOOLEAN")
+            elif column == "embedding":
+                columns.append(f"{column} VECTOR({self.embedding_provider.dimension})")
+            else:
+                columns.append(f"{column} TEXT")
+        cur.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS documents_stage ({', '.join(columns)}) ON COMMIT DELETE ROWS"
+        )
+
+    @staticmethod
+    def _document_row(
+        payload: DocumentPersistencePayload,
+        embedding: Optional[Sequence[float]],
+        sections_sha256: str,
+    ) -> Tuple[Any, ...]:
+        """Staging row in ``_DOCUMENT_COLUMNS`` order; JSON and timestamps travel as text."""
+        return (
+            payload.document_id,
+            payload.title,
+            payload.primary_topic,
+            payload.model_key,
+            payload.processed_at.isoformat() if payload.processed_at else None,
+            payload.source_pdf,
+            payload.checksum,
+            json.dumps(list(payload.tags)),
+            json.dumps(payload.metadata),
+            json.dumps(payload.docling),
+            json.dumps(payload.extraction),
+            json.dumps(payload.enrichment),
+            json.dumps(payload.knowledge_entry) if payload.knowledge_entry is not None else None,
+            payload.gemini_validated,
+            embedding,
+            sections_sha256,
+        )
 
     # ------------------------------------------------------------------
     # Internal helpers
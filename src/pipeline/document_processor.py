@@ -146,6 +146,7 @@ class DocumentProcessor:
             chunks = self.chunker.chunk(
                 extraction_result.get('full_text', ''),
                 extraction_result.get('metadata', {}),
+                document_id=document_id,
             )
             extraction_result['chunks'] = chunks
             self.vector_store.upsert(chunks)
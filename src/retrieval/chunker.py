@@ -1,14 +1,56 @@
 """Structural and semantic chunking utilities."""
 from __future__ import annotations
 
+import hashlib
 import logging
 import math
+import re
+import unicodedata
 import uuid
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_chunk_text(text: str) -> str:
+    """Normalise text so cosmetic whitespace/Unicode differences map to the same chunk id."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text or "")).strip()
+
+
+def content_chunk_id(document_id: str, text: str, scope: str = "", occurrence: int = 0) -> str:
+    """
+    Deterministic chunk id derived from the document id and normalised content.
+
+    ``scope`` separates identical text in different parts of a document (e.g.
+    agent fields) and ``occurrence`` disambiguates exact repeats within one
+    scope. The id is UUID-formatted so vector stores can use it as-is.
+    """
+    hasher = hashlib.sha256()
+    for part in (document_id or "", scope, normalize_chunk_text(text), str(occurrence)):
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\x00")
+    return str(uuid.UUID(hex=hasher.hexdigest()[:32]))
+
+
+def assign_content_ids(chunks: List[Dict[str, Any]], document_id: str, scope_keys: Sequence[str] = ()) -> None:
+    """Set ``chunk_id`` on each chunk in place, numbering repeated texts in order.
+
+    ``scope_keys`` name chunk metadata fields that become part of the id scope.
+    """
+    seen: Dict[str, int] = {}
+    for chunk in chunks:
+        metadata = chunk.get("metadata") or {}
+        scope = "::".join(str(metadata.get(key, "")) for key in scope_keys)
+        base = content_chunk_id(document_id, chunk.get("text", ""), scope)
+        occurrence = seen.get(base, 0)
+        seen[base] = occurrence + 1
+        chunk["chunk_id"] = base if occurrence == 0 else content_chunk_id(
+            document_id, chunk.get("text", ""), scope, occurrence
+        )
+
 
 @dataclass
 class Chunk:
@@ -35,7 +77,13 @@ class DocumentChunker:
         self.chunk_size_tokens = chunk_size_tokens
         self.chunk_overlap_tokens = max(1, int(chunk_size_tokens * chunk_overlap_ratio))
 
-    def chunk(self, markdown_text: str, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def chunk(
+        self,
+        markdown_text: str,
+        metadata: Dict[str, Any],
+        document_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Chunk ``markdown_text``; chunk ids are derived from ``document_id`` and content."""
         if not markdown_text.strip():
             return []
 
@@ -47,6 +95,7 @@ class DocumentChunker:
         sections = metadata.get("sections", [])
         doi = metadata.get("doi", "")
         source_path = metadata.get("source_path")
+        document_key = document_id or metadata.get("document_id") or doi or source_path or ""
 
         chunks: List[Dict[str, Any]] = []
         idx = 0
@@ -70,7 +119,7 @@ class DocumentChunker:
             chunk_sections = self._resolve_sections(sections, chunk_pages)
 
             chunk = Chunk(
-                chunk_id=uuid.uuid4().hex,
+                chunk_id="",
                 text=chunk_text,
                 token_count=token_total,
                 start_char=chunk_start,
@@ -92,6 +141,7 @@ class DocumentChunker:
             if idx <= start_idx:
                 idx = start_idx + 1
 
+        assign_content_ids(chunks, document_key)
         logger.debug("Generated %d chunks", len(chunks))
         return chunks
 
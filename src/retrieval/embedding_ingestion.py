@@ -12,7 +12,7 @@ from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from src.models.enlitens_schemas import EnlitensKnowledgeEntry
 
-from .chunker import DocumentChunker
+from .chunker import DocumentChunker, assign_content_ids
 from .vector_store import BaseVectorStore, QdrantVectorStore
 
 logger = logging.getLogger(__name__)
@@ -27,6 +27,9 @@ class IngestionStats:
     full_text_chunks: int
     agent_chunks: int
     metadata: Dict[str, Any] = field(default_factory=dict)
+    chunks_embedded: int = 0
+    chunks_unchanged: int = 0
+    chunks_deleted: int = 0
 
 
 @dataclass
@@ -70,7 +73,7 @@ class EmbeddingIngestionPipeline:
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
-    def ingest_entry(self, entry: EnlitensKnowledgeEntry) -> IngestionStats:
+    def ingest_entry(self, entry: EnlitensKnowledgeEntry, incremental: bool = False) -> IngestionStats:
         """Ingest a processed knowledge entry into the vector store."""
 
         document_id = entry.metadata.document_id
@@ -83,6 +86,7 @@ class EmbeddingIngestionPipeline:
             full_text=full_text,
             agent_outputs=agent_outputs,
             metadata=metadata,
+            incremental=incremental,
         )
 
     def ingest_document(
@@ -92,8 +96,16 @@ class EmbeddingIngestionPipeline:
         agent_outputs: Optional[Dict[str, Any]] = None,
         metadata: Optional[Dict[str, Any]] = None,
         rebuild: bool = False,
+        incremental: bool = False,
     ) -> IngestionStats:
-        """Ingest a document and optional agent outputs into the vector store."""
+        """
+        Ingest a document and optional agent outputs into the vector store.
+
+        Chunk ids are derived from the document id and chunk content. With
+        ``incremental`` the new chunk set is diffed against the ids already in
+        the store: only unseen chunks are embedded and upserted, and chunks
+        that no longer exist are deleted.
+        """
 
         if rebuild:
             logger.info("Refreshing vector index for %s", document_id)
@@ -119,8 +131,18 @@ class EmbeddingIngestionPipeline:
                 metadata=metadata or {},
             )
 
+        to_upsert = chunks
+        stale_ids: List[str] = []
+        if incremental and not rebuild:
+            existing_ids = self.vector_store.list_chunk_ids(document_id)
+            current_ids = {chunk["chunk_id"] for chunk in chunks}
+            to_upsert = [chunk for chunk in chunks if chunk["chunk_id"] not in existing_ids]
+            stale_ids = sorted(existing_ids - current_ids)
+
         try:
-            self.vector_store.upsert(chunks)
+            self.vector_store.upsert(to_upsert)
+            if stale_ids:
+                self.vector_store.delete_chunks(stale_ids)
         except Exception as exc:
             logger.error("Embedding ingestion failed for %s: %s", document_id, exc)
             raise
@@ -128,11 +150,14 @@ class EmbeddingIngestionPipeline:
         full_text_chunks = sum(1 for chunk in chunks if chunk["metadata"].get("source_type") == "full_document_text")
         agent_chunks = len(chunks) - full_text_chunks
         logger.info(
-            "Ingested %d chunks for %s (%d full text, %d agent outputs)",
+            "Ingested %d chunks for %s (%d full text, %d agent outputs; %d embedded, %d unchanged, %d deleted)",
             len(chunks),
             document_id,
             full_text_chunks,
             agent_chunks,
+            len(to_upsert),
+            len(chunks) - len(to_upsert),
+            len(stale_ids),
         )
 
         return IngestionStats(
@@ -141,13 +166,25 @@ class EmbeddingIngestionPipeline:
             full_text_chunks=full_text_chunks,
             agent_chunks=agent_chunks,
             metadata=metadata or {},
+            chunks_embedded=len(to_upsert),
+            chunks_unchanged=len(chunks) - len(to_upsert),
+            chunks_deleted=len(stale_ids),
         )
 
-    def ingest_entries(self, entries: Iterable[EnlitensKnowledgeEntry], rebuild: bool = False) -> List[IngestionStats]:
+    def ingest_entries(
+        self,
+        entries: Iterable[EnlitensKnowledgeEntry],
+        rebuild: bool = False,
+        incremental: bool = False,
+    ) -> List[IngestionStats]:
         stats: List[IngestionStats] = []
         for entry in entries:
             try:
-                stats.append(self.ingest_entry(entry) if not rebuild else self.ingest_entry_with_rebuild(entry))
+                stats.append(
+                    self.ingest_entry(entry, incremental=incremental)
+                    if not rebuild
+                    else self.ingest_entry_with_rebuild(entry)
+                )
             except Exception as exc:
                 logger.error("Failed to ingest entry %s: %s", entry.metadata.document_id, exc)
         return stats
@@ -262,12 +299,12 @@ class EmbeddingIngestionPipeline:
         }
         chunk_metadata.update(self._select_metadata_fields(metadata))
 
-        doc_chunks = self.chunker.chunk(full_text, metadata)
+        doc_chunks = self.chunker.chunk(full_text, metadata, document_id=document_id)
         normalized: List[Dict[str, Any]] = []
         for idx, chunk in enumerate(doc_chunks):
             normalized.append(
                 {
-                    "chunk_id": f"{document_id}::full::{idx}",
+                    "chunk_id": chunk["chunk_id"],
                     "text": chunk.get("text", ""),
                     "metadata": {
                         **chunk_metadata,
@@ -297,7 +334,6 @@ class EmbeddingIngestionPipeline:
                     continue
 
                 field_path = segment.get("field_path", "value")
-                chunk_id_prefix = f"{document_id}::agent::{agent_name}::{field_path}".replace(" ", "_")
 
                 # Use the chunker for longer segments to ensure consistent token limits
                 if self._estimate_tokens(text) > self.agent_chunk_token_threshold:
@@ -305,7 +341,7 @@ class EmbeddingIngestionPipeline:
                     for sub_idx, sub_chunk in enumerate(sub_chunks):
                         chunks.append(
                             {
-                                "chunk_id": f"{chunk_id_prefix}::{sub_idx}",
+                                "chunk_id": "",
                                 "text": sub_chunk.get("text", ""),
                                 "metadata": {
                                     **base_metadata,
@@ -320,7 +356,7 @@ class EmbeddingIngestionPipeline:
                 else:
                     chunks.append(
                         {
-                            "chunk_id": f"{chunk_id_prefix}::{segment_idx}",
+                            "chunk_id": "",
                             "text": text,
                             "metadata": {
                                 **base_metadata,
@@ -332,6 +368,7 @@ class EmbeddingIngestionPipeline:
                             },
                         }
                     )
+        assign_content_ids(chunks, document_id, scope_keys=("source_type", "agent", "field_path"))
         return chunks
 
     def _flatten_agent_payload(self, agent_name: str, value: Any, path: Optional[List[str]] = None) -> List[Dict[str, Any]]:
@@ -5,9 +5,13 @@ import logging
 from typing import Any, Dict, List
 
 from rank_bm25 import BM25Okapi
-from sentence_transformers import CrossEncoder
 
-from .vector_store import QdrantVectorStore
+try:  # cross-encoder reranking is optional in lightweight environments
+    from sentence_transformers import CrossEncoder
+except Exception:  # pragma: no cover - used in environments without torch
+    CrossEncoder = None  # type: ignore
+
+from .vector_store import QdrantVectorStore, SearchResult
 
 logger = logging.getLogger(__name__)
 
@@ -21,16 +25,18 @@ class HybridRetriever:
         dense_limit: int = 50,
         rerank_limit: int = 50,
         final_k: int = 5,
+        enable_reranker: bool = True,
     ) -> None:
         self.vector_store = vector_store
         self.dense_limit = dense_limit
         self.rerank_limit = rerank_limit
         self.final_k = final_k
+        self.enable_reranker = enable_reranker
 
         self.chunk_lookup: Dict[str, Dict[str, Any]] = {}
         self.corpus_tokens: List[List[str]] = []
         self.bm25: BM25Okapi | None = None
-        self.reranker: CrossEncoder | None = None
+        self.reranker: Any = None
 
     def index_chunks(self, chunks: List[Dict[str, Any]]) -> None:
         if not chunks:
@@ -87,7 +93,7 @@ class HybridRetriever:
 
     def _reciprocal_rank_fusion(
         self,
-        dense: List[Dict[str, Any]],
+        dense: List[Any],
         sparse: List[Dict[str, Any]],
         constant_k: int = 60,
     ) -> List[Dict[str, Any]]:
@@ -95,7 +101,7 @@ class HybridRetriever:
         rank_positions: Dict[str, Dict[str, int]] = {}
 
         for rank, result in enumerate(dense, start=1):
-            chunk_id = str(result["chunk_id"])
+            chunk_id = str(result.chunk_id if isinstance(result, SearchResult) else result["chunk_id"])
             scores[chunk_id] = scores.get(chunk_id, 0.0) + 1.0 / (constant_k + rank)
             rank_positions.setdefault(chunk_id, {})["dense"] = rank
 
@@ -138,7 +144,9 @@ class HybridRetriever:
         reranked.sort(key=lambda item: item["score"], reverse=True)
         return reranked
 
-    def _ensure_reranker(self) -> CrossEncoder | None:
+    def _ensure_reranker(self) -> Any:
+        if not self.enable_reranker or CrossEncoder is None:
+            return None
         if self.reranker is None:
             try:
                 self.reranker = CrossEncoder("BAAI/bge-reranker-v2-m3", device="cpu")
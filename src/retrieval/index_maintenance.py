@@ -22,6 +22,9 @@ class RefreshReport:
     documents_processed: int
     total_chunks: int
     ingest_stats: List[IngestionStats]
+    chunks_embedded: int = 0
+    chunks_unchanged: int = 0
+    chunks_deleted: int = 0
 
 
 class IndexMaintenance:
@@ -35,12 +38,13 @@ class IndexMaintenance:
         entries: Sequence[EnlitensKnowledgeEntry],
         schedule: MaintenanceSchedule = "nightly",
         rebuild: bool = False,
+        incremental: bool = False,
     ) -> RefreshReport:
         start_time = datetime.utcnow()
         stats = [
             self.pipeline.ingest_entry_with_rebuild(entry)
             if rebuild
-            else self.pipeline.ingest_entry(entry)
+            else self.pipeline.ingest_entry(entry, incremental=incremental)
             for entry in entries
         ]
         end_time = datetime.utcnow()
@@ -52,6 +56,9 @@ class IndexMaintenance:
             documents_processed=len(stats),
             total_chunks=sum(stat.chunks_ingested for stat in stats),
             ingest_stats=stats,
+            chunks_embedded=sum(stat.chunks_embedded for stat in stats),
+            chunks_unchanged=sum(stat.chunks_unchanged for stat in stats),
+            chunks_deleted=sum(stat.chunks_deleted for stat in stats),
         )
 
     def run_integrity_check(
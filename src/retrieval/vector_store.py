@@ -8,7 +8,7 @@ import os
 import uuid
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 import numpy as np
 
@@ -177,6 +177,12 @@ class BaseVectorStore:
     def delete_by_document(self, document_id: str) -> None:  # pragma: no cover - interface
         raise NotImplementedError
 
+    def list_chunk_ids(self, document_id: str) -> Set[str]:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    def delete_chunks(self, chunk_ids: Iterable[str]) -> None:  # pragma: no cover - interface
+        raise NotImplementedError
+
 
 class QdrantVectorStore(BaseVectorStore):
     """Persist chunks and metadata while supporting dense retrieval."""
@@ -191,6 +197,7 @@ class QdrantVectorStore(BaseVectorStore):
         prefer_grpc: bool = False,
         embedding_model_name: Optional[str] = None,
         embedding_device: Optional[str] = None,
+        local_only: bool = False,
     ) -> None:
         self.collection_name = collection_name
         self.embedding_model = _resolve_embedding_model(embedding_model_name, embedding_device)
@@ -199,6 +206,10 @@ class QdrantVectorStore(BaseVectorStore):
         self.client: Optional[QdrantClient] = None
         self.local_store: Dict[str, Dict[str, Any]] = {}
 
+        if local_only:
+            logger.info("Using in-memory vector store for collection '%s'", collection_name)
+            return
+
         # Check environment variables
         env_url = os.getenv("QDRANT_URL")
         env_host = os.getenv("QDRANT_HOST")
@@ -422,6 +433,51 @@ class QdrantVectorStore(BaseVectorStore):
         for key in keys_to_remove:
             self.local_store.pop(key, None)
 
+    def list_chunk_ids(self, document_id: str) -> Set[str]:
+        if self.client is not None:
+            try:
+                chunk_ids: Set[str] = set()
+                offset = None
+                while True:
+                    points, offset = self.client.scroll(
+                        collection_name=self.collection_name,
+                        scroll_filter=_build_filter_condition({"document_id": document_id}),
+                        limit=1024,
+                        offset=offset,
+                        with_payload=["chunk_id"],
+                        with_vectors=False,
+                    )
+                    for point in points:
+                        chunk_ids.add(str((point.payload or {}).get("chunk_id") or point.id))
+                    if offset is None:
+                        return chunk_ids
+            except Exception as exc:
+                logger.warning("Failed to list chunk ids for %s from Qdrant: %s", document_id, exc)
+
+        return {
+            key
+            for key, entry in self.local_store.items()
+            if entry["chunk"].get("metadata", {}).get("document_id") == document_id
+        }
+
+    def delete_chunks(self, chunk_ids: Iterable[str]) -> None:
+        chunk_ids = list(chunk_ids)
+        if not chunk_ids:
+            return
+        if self.client is not None:
+            try:
+                self.client.delete(
+                    collection_name=self.collection_name,
+                    points_selector=qmodels.PointIdsList(
+                        points=[self._normalize_point_id(chunk_id) for chunk_id in chunk_ids]
+                    ),
+                )
+            except Exception as exc:
+                logger.warning("Failed to delete %d chunks from Qdrant: %s", len(chunk_ids), exc)
+
+        for chunk_id in chunk_ids:
+            self.local_store.pop(chunk_id, None)
+
     def get_all_chunks(self) -> List[Dict[str, Any]]:
         return [entry["chunk"] for entry in self.local_store.values()]
 
@@ -553,6 +609,15 @@ class ChromaVectorStore(BaseVectorStore):
     def delete_by_document(self, document_id: str) -> None:
         self.collection.delete(where={"document_id": document_id})
 
+    def list_chunk_ids(self, document_id: str) -> Set[str]:
+        results = self.collection.get(where={"document_id": document_id}, include=[])
+        return {str(chunk_id) for chunk_id in results.get("ids", []) or []}
+
+    def delete_chunks(self, chunk_ids: Iterable[str]) -> None:
+        chunk_ids = [str(chunk_id) for chunk_id in chunk_ids]
+        if chunk_ids:
+            self.collection.delete(ids=chunk_ids)
+
 
 def _metadata_matches(chunk: Dict[str, Any], metadata_filter: Dict[str, Any]) -> bool:
     metadata = {**chunk.get("metadata", {}), **{k: v for k, v in chunk.items() if k != "metadata"}}
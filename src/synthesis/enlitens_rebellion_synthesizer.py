@@ -10,13 +10,18 @@ This synthesizer translates research into the voice of the rebellion:
 """
 
 import logging
+import os
 from typing import Dict, List, Any, Optional
 import asyncio
 import json
 from datetime import datetime
 
+from .step_executor import StepExecutor, SynthesisStep
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_SYNTHESIS_CONCURRENCY = int(os.getenv("ENLITENS_SYNTHESIS_CONCURRENCY", "4"))
+
 
 class EnlitensRebellionSynthesizer:
     """
@@ -30,13 +35,40 @@ class EnlitensRebellionSynthesizer:
     - Organizes content for the 5 Enlitens modules
     """
     
-    def __init__(self):
+    MODULE_KEYS = (
+        'module_1_narrative',
+        'module_2_sensory',
+        'module_3_executive',
+        'module_4_social',
+        'module_5_strengths',
+        'rebellion_themes',
+    )
+
+    def __init__(self, max_concurrency: int = DEFAULT_SYNTHESIS_CONCURRENCY):
         self.rebellion_voice = {
             'tone': 'direct, authentic, rebellious',
             'language': 'profanity when appropriate, clinical when needed',
             'focus': 'neurobiological truth, strengths, system critique',
             'purpose': 'empowerment, validation, insight'
         }
+        self.executor = StepExecutor(self._synthesis_steps(), max_concurrency=max_concurrency)
+        self.last_timings: Dict[str, Any] = {}
+
+    def _synthesis_steps(self) -> List[SynthesisStep]:
+        """Declare each output key with the slice of the input it reads."""
+        return [
+            SynthesisStep('enlitens_takeaway', self._create_enlitens_takeaway,
+                          ('title', 'abstract', 'rebellion_content'), fallback=str),
+            SynthesisStep('module_1_narrative', self._synthesize_module_1, ('module_1_narrative',)),
+            SynthesisStep('module_2_sensory', self._synthesize_module_2, ('module_2_sensory',)),
+            SynthesisStep('module_3_executive', self._synthesize_module_3, ('module_3_executive',)),
+            SynthesisStep('module_4_social', self._synthesize_module_4, ('module_4_social',)),
+            SynthesisStep('module_5_strengths', self._synthesize_module_5, ('module_5_strengths',)),
+            SynthesisStep('rebellion_themes', self._synthesize_rebellion_themes, ('rebellion_themes',)),
+            SynthesisStep('aha_moments', self._synthesize_aha_moments, ('aha_moments',), fallback=list),
+            SynthesisStep('clinical_applications', self._synthesize_clinical_applications, ('rebellion_content',)),
+            SynthesisStep('system_critique', self._synthesize_system_critique, ('rebellion_content',)),
+        ]
     
     async def synthesize_rebellion_content(self, extraction_result: Dict[str, Any], 
                                         rebellion_content: Dict[str, Any]) -> Dict[str, Any]:
@@ -57,21 +89,23 @@ class EnlitensRebellionSynthesizer:
             title = extraction_result.get('source_metadata', {}).get('title', 'Unknown Title')
             abstract = extraction_result.get('source_metadata', {}).get('abstract', '')
             
-            # Synthesize for each module
-            synthesis_result = {
-                'enlitens_takeaway': await self._create_enlitens_takeaway(title, abstract, rebellion_content),
-                'module_1_narrative': await self._synthesize_module_1(rebellion_content.get('module_1_narrative', {})),
-                'module_2_sensory': await self._synthesize_module_2(rebellion_content.get('module_2_sensory', {})),
-                'module_3_executive': await self._synthesize_module_3(rebellion_content.get('module_3_executive', {})),
-                'module_4_social': await self._synthesize_module_4(rebellion_content.get('module_4_social', {})),
-                'module_5_strengths': await self._synthesize_module_5(rebellion_content.get('module_5_strengths', {})),
-                'rebellion_themes': await self._synthesize_rebellion_themes(rebellion_content.get('rebellion_themes', {})),
-                'aha_moments': await self._synthesize_aha_moments(rebellion_content.get('aha_moments', [])),
-                'clinical_applications': await self._synthesize_clinical_applications(rebellion_content),
-                'system_critique': await self._synthesize_system_critique(rebellion_content)
+            # Independent steps run concurrently; a failed step degrades only its key
+            sources = {
+                'title': title,
+                'abstract': abstract,
+                'rebellion_content': rebellion_content,
+                'aha_moments': rebellion_content.get('aha_moments', []),
             }
-            
-            logger.info("Enlitens Rebellion Synthesizer: Completed synthesis")
+            for key in self.MODULE_KEYS:
+                sources[key] = rebellion_content.get(key, {})
+            synthesis_result, self.last_timings = await self.executor.run(sources)
+
+            logger.info(
+                "Enlitens Rebellion Synthesizer: Completed synthesis in %.2fs (critical path %s, %.2fs)",
+                self.last_timings['total_seconds'],
+                " -> ".join(self.last_timings['critical_path']),
+                self.last_timings['critical_path_seconds'],
+            )
             return synthesis_result
             
         except Exception as e:
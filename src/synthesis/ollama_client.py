@@ -19,7 +19,9 @@ from .prompts import (
     TEMPERATURE_CREATIVE,
     get_full_system_prompt,
 )
+from .schema_stream_guard import StreamingSchemaGuard
 from src.utils.prompt_cache import PromptCache
+from src.utils.quote_locator import get_quote_locator
 from src.utils.kv_cache_compressor import KVCacheCompressor
 from src.utils.settings import get_settings
 
@@ -30,6 +32,10 @@ VLLM_DEFAULT_MODEL = "/home/antons-gs/enlitens-ai/models/llama-3.1-8b-instruct"
 MONITORING_MODEL = "/home/antons-gs/enlitens-ai/models/llama-3.1-8b-instruct"
 
 
+class SchemaViolationError(ValueError):
+    """A streamed structured response was cancelled because it left the schema."""
+
+
 class VLLMClient:
     """Async client for Ollama/vLLM style servers with prompt caching support."""
 
@@ -47,6 +53,8 @@ class VLLMClient:
         headers: Optional[Dict[str, str]] = None,
         max_retries: int = 3,
         transport: Optional[httpx.AsyncBaseTransport] = None,
+        enable_continuation: Optional[bool] = None,
+        enable_stream_guard: Optional[bool] = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.default_model = default_model
@@ -80,6 +88,25 @@ class VLLMClient:
         self._effective_cap_tokens: Optional[int] = None
         self._logged_cap_info = False
         self._default_completion_request = 24576
+        # Resume truncated completions from the partial text instead of regenerating them
+        self.enable_continuation = (
+            enable_continuation
+            if enable_continuation is not None
+            else os.environ.get("VLLM_TRUNCATION_CONTINUATION", "1").lower() not in {"0", "false", "no"}
+        )
+        self.truncation_stats: Dict[str, int] = {
+            "truncations": 0,
+            "continuations": 0,
+            "restarts": 0,
+            "tokens_saved": 0,
+        }
+        # Stream structured responses and cancel them as soon as they leave the schema
+        self.enable_stream_guard = (
+            enable_stream_guard
+            if enable_stream_guard is not None
+            else os.environ.get("VLLM_STREAM_SCHEMA_GUARD", "1").lower() not in {"0", "false", "no"}
+        )
+        self.stream_guard_stats: Dict[str, int] = {"aborts": 0, "tokens_saved": 0}
 
     def clone_with_model(self, model: str) -> "VLLMClient":
         """Create a lightweight clone that reuses the underlying HTTP client."""
@@ -94,6 +121,10 @@ class VLLMClient:
         clone.headers = dict(self.headers)
         clone.max_retries = self.max_retries
         clone.kv_compressor = self.kv_compressor
+        clone.enable_continuation = self.enable_continuation
+        clone.truncation_stats = self.truncation_stats
+        clone.enable_stream_guard = self.enable_stream_guard
+        clone.stream_guard_stats = self.stream_guard_stats
         return clone
 
     def _resolve_model(self, model: Optional[str]) -> str:
@@ -247,8 +278,20 @@ class VLLMClient:
         top_p: Optional[float] = 0.9,
         grammar: Optional[str] = None,
         response_format: Optional[str] = None,
+        n: int = 1,
+        assistant_prefix: Optional[str] = None,
+        schema_guard: Optional[StreamingSchemaGuard] = None,
     ) -> Dict[str, Any]:
-        """Generate a completion from the serving endpoint."""
+        """Generate a completion from the serving endpoint.
+
+        With ``n > 1`` the server samples ``n`` completions from a single
+        prefill of the prompt; all of them are returned under ``choices``.
+        ``assistant_prefix`` asks the server to continue that partial assistant
+        message (vLLM ``continue_final_message``); only the new text is returned.
+        With ``schema_guard`` the completion is streamed through the guard and
+        the request is cancelled at the first schema violation; the partial
+        text is returned with ``aborted`` set to the reason.
+        """
 
         model_name = self._resolve_model(model)
 
@@ -256,6 +299,8 @@ class VLLMClient:
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
+        if assistant_prefix:
+            messages.append({"role": "assistant", "content": assistant_prefix})
 
         requested_tokens = num_predict or self._default_completion_request
         prompt_tokens_estimate = int(num_ctx) if num_ctx is not None else self._estimate_tokens_from_messages(messages)
@@ -272,6 +317,11 @@ class VLLMClient:
 
         if top_p is not None:
             payload["top_p"] = top_p
+        if n > 1:
+            payload["n"] = n
+        if assistant_prefix:
+            payload["continue_final_message"] = True
+            payload["add_generation_prompt"] = False
         if response_format:
             payload["response_format"] = {"type": response_format}
         
@@ -290,8 +340,11 @@ class VLLMClient:
             compression_meta = self.kv_compressor.before_request(prompt)
 
         try:
-            response = await self._request_with_retry("POST", "/chat/completions", json=payload)
-            data = response.json()
+            if schema_guard is not None and n == 1:
+                data = await self._stream_chat_completion(payload, schema_guard)
+            else:
+                response = await self._request_with_retry("POST", "/chat/completions", json=payload)
+                data = response.json()
         except httpx.HTTPStatusError as exc:
             # Intermittent 404s can happen depending on how the server exposes the OpenAI routes.
             # If we hit a 404, retry by toggling the /v1 prefix heuristically.
@@ -305,6 +358,8 @@ class VLLMClient:
                 else:
                     candidates.append(f"{base}/v1/chat/completions")
                 data = None
+                payload["stream"] = False
+                payload.pop("stream_options", None)
                 for url in candidates:
                     try:
                         fb = await httpx.AsyncClient(
@@ -326,15 +381,100 @@ class VLLMClient:
                     self.kv_compressor.after_request(compression_meta)
                 except Exception as exc:  # pragma: no cover - defensive
                     logger.debug("KV compressor logging failed: %s", exc)
-        choice = data.get("choices", [{}])[0]
-        message = choice.get("message", {})
-        finish_reason = choice.get("finish_reason")
+        choices = [
+            {
+                "response": (choice.get("message") or {}).get("content", "") or "",
+                "done": choice.get("finish_reason") != "length",
+            }
+            for choice in sorted(data.get("choices") or [{}], key=lambda item: item.get("index", 0))
+        ]
+        completion_tokens = (data.get("usage") or {}).get("completion_tokens")
+        if not isinstance(completion_tokens, int):
+            completion_tokens = int(sum(len(choice["response"]) for choice in choices) / self._chars_per_token)
         return {
-            "response": message.get("content", ""),
+            "response": choices[0]["response"],
             "raw": data,
-            "done": finish_reason != "length",
+            "done": choices[0]["done"],
+            "choices": choices,
+            "completion_tokens": completion_tokens,
+            "aborted": data.get("aborted"),
         }
 
+    async def _stream_chat_completion(
+        self, payload: Dict[str, Any], guard: StreamingSchemaGuard
+    ) -> Dict[str, Any]:
+        """Stream a chat completion through ``guard`` and return it in non-streaming shape.
+
+        Leaving the stream early closes the connection, which makes vLLM abort
+        the request and free its slot. Servers that ignore ``stream`` and answer
+        with a plain JSON body are handled too.
+        """
+
+        payload = {**payload, "stream": True, "stream_options": {"include_usage": True}}
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(self.max_retries),
+            wait=wait_exponential(multiplier=0.5, min=0.5, max=10),
+            retry=retry_if_exception(self._should_retry_exception),
+            reraise=True,
+        ):
+            with attempt:
+                async with self.client.stream("POST", "/chat/completions", json=payload) as response:
+                    if response.status_code >= 400:
+                        await response.aread()
+                        response.raise_for_status()
+                    if not response.headers.get("content-type", "").startswith("text/event-stream"):
+                        await response.aread()
+                        return response.json()
+
+                    parts: List[str] = []
+                    deltas = 0
+                    finish_reason: Optional[str] = None
+                    usage: Optional[Dict[str, Any]] = None
+                    violation: Optional[str] = None
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        body = line[5:].strip()
+                        if body == "[DONE]":
+                            break
+                        chunk = json.loads(body)
+                        usage = chunk.get("usage") or usage
+                        for choice in chunk.get("choices") or []:
+                            content = (choice.get("delta") or {}).get("content") or ""
+                            if content:
+                                parts.append(content)
+                                deltas += 1
+                                violation = guard.feed(content)
+                            finish_reason = choice.get("finish_reason") or finish_reason
+                        if violation:
+                            break
+
+                text = "".join(parts)
+                completion_tokens = (usage or {}).get("completion_tokens") or deltas
+                if violation:
+                    saved = max(0, int(payload.get("max_tokens") or 0) - completion_tokens)
+                    self.stream_guard_stats["aborts"] += 1
+                    self.stream_guard_stats["tokens_saved"] += saved
+                    logger.warning(
+                        "✋ Cancelled structured response after %s tokens (%s); ~%s tokens left for the retry",
+                        completion_tokens,
+                        violation,
+                        saved,
+                    )
+                    finish_reason = "abort"
+                return {
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": text},
+                            "finish_reason": finish_reason,
+                        }
+                    ],
+                    "usage": {"completion_tokens": completion_tokens},
+                    "aborted": violation,
+                }
+        raise RuntimeError("Retry loop exited unexpectedly")
+
     async def generate_text(
         self,
         prompt: str,
@@ -438,118 +578,13 @@ class VLLMClient:
                     top_p=0.9,
                     grammar=grammar,
                     use_response_format=use_response_format,
+                    schema_model=response_model if self.enable_stream_guard else None,
                 )
                 if truncated:
                     raise ValueError("LLM response truncated after dynamic retries")
 
-                parsed = self._parse_structured_payload(text)
-                parsed = self._coerce_to_model_schema(parsed, response_model)
-                # Some models occasionally return a single-item list wrapping the object
-                if not isinstance(parsed, dict) and isinstance(parsed, list) and parsed and isinstance(parsed[0], dict):
-                    logger.info("Unwrapped single-item list to match schema")
-                    parsed = parsed[0]
-                if not isinstance(parsed, dict):
-                    raise ValueError(f"Expected dict after coercion, got {type(parsed).__name__}")
-
-                # Lightweight sanitation before validation to reduce avoidable failures
-                try:
-                    def _stringify_sequence(items: List[Any]) -> List[str]:
-                        stringified: List[str] = []
-                        for item in items:
-                            if isinstance(item, str):
-                                stringified.append(item)
-                            elif isinstance(item, dict):
-                                parts = []
-                                for k, v in item.items():
-                                    if v is None:
-                                        continue
-                                    parts.append(f"{k}: {v}")
-                                stringified.append(" | ".join(parts) if parts else str(item))
-                            elif isinstance(item, list):
-                                parts = [str(elem) for elem in item if elem is not None]
-                                stringified.append(" | ".join(parts) if parts else str(item))
-                            else:
-                                stringified.append(str(item))
-                        return stringified
-
-                    if response_model.__name__ == "BlogContent":
-                        stats = parsed.get("statistics")
-                        source = (validation_context or {}).get("source_text", "")
-                        if isinstance(stats, list) and source:
-                            import difflib
-                            sentences = source.split('. ')
-                            def _ok(item: Any) -> bool:
-                                try:
-                                    quote = str((item or {}).get("quote", "")).strip()
-                                    if not quote:
-                                        return False
-                                    if quote in source:
-                                        return True
-                                    best = difflib.get_close_matches(quote, sentences, n=1, cutoff=0.8)
-                                    return bool(best)
-                                except Exception:
-                                    return False
-                            before = len(stats)
-                            parsed["statistics"] = [it for it in stats if _ok(it)]
-                            after = len(parsed["statistics"])
-                            if before and after < before:
-                                logger.info("Filtered %s invalid statistics prior to validation", before - after)
-                        string_fields = [
-                            "article_ideas",
-                            "blog_outlines",
-                            "talking_points",
-                            "expert_quotes",
-                            "case_studies",
-                            "how_to_guides",
-                            "myth_busting",
-                        ]
-                        for key in string_fields:
-                            if key in parsed and isinstance(parsed[key], list):
-                                parsed[key] = _stringify_sequence(parsed[key])
-                    elif response_model.__name__ == "RebellionFramework":
-                        # Flatten nested lists the model sometimes returns
-                        def _flatten(items: Any) -> List[str]:
-                            result: List[str] = []
-                            if isinstance(items, list):
-                                for it in items:
-                                    if isinstance(it, list):
-                                        result.append(" ".join([str(x) for x in it]))
-                                    else:
-                                        result.append(str(it))
-                            return result
-                        for key in ("narrative_deconstruction","sensory_profiling","executive_function","social_processing","strengths_synthesis","rebellion_themes","aha_moments"):
-                            if key in parsed and isinstance(parsed[key], list) and any(isinstance(x, list) for x in parsed[key]):
-                                parsed[key] = _flatten(parsed[key])
-                    else:
-                        if isinstance(parsed, dict):
-                            for key, value in list(parsed.items()):
-                                if isinstance(value, list) and any(not isinstance(it, str) for it in value):
-                                    parsed[key] = _stringify_sequence(value)
-                except Exception:
-                    # Best-effort sanitation; fall through to validation
-                    pass
-
-                if validation_context:
-                    validated = response_model.model_validate(parsed, context=validation_context)
-                else:
-                    validated = response_model.model_validate(parsed)
-
+                validated = self._validate_structured_text(text, response_model, validation_context)
                 data_dict = validated.model_dump()
-                list_values = [value for value in data_dict.values() if isinstance(value, list)]
-                if list_values:
-                    empty = sum(1 for value in list_values if not value)
-                    filled = len(list_values) - empty
-                    
-                    # VERY lenient: Accept if ANY field has content
-                    # (For complex schemas with 7-8 list fields, partial completion is acceptable)
-                    if filled == 0:
-                        raise ValueError(
-                            f"No content generated: all {len(list_values)} lists are empty"
-                        )
-                    
-                    # Log warning if less than 50% filled, but don't reject
-                    if filled < len(list_values) // 2:
-                        logger.info(f"⚠️ Partial completion: {filled}/{len(list_values)} lists filled (acceptable)")
 
                 if self.enable_prefix_caching:
                     self.prompt_cache.set(cache_namespace, cache_chunk, full_prompt, data_dict)
@@ -637,6 +672,74 @@ class VLLMClient:
 
         return None
 
+    async def generate_structured_samples(
+        self,
+        prompt: str,
+        response_model: Type[BaseModel],
+        *,
+        n: int,
+        model: Optional[str] = None,
+        temperature: float = TEMPERATURE_FACTUAL,
+        max_retries: int = 3,
+        base_num_predict: int = 24576,
+        max_num_predict: int = 32768,
+        use_cot_prompt: bool = True,
+        validation_context: Optional[Dict[str, Any]] = None,
+    ) -> List[Optional[BaseModel]]:
+        """Draw ``n`` structured samples of one prompt using the ``n`` request parameter.
+
+        The prompt is sent (and prefilled) once per round. Each choice is parsed
+        and validated on its own; choices that fail are re-requested together in
+        the next round, up to ``max_retries`` rounds. Slots that never validate
+        are returned as ``None``. HTTP errors propagate so callers can fall back
+        to one request per sample on servers without ``n`` support.
+        """
+
+        system_prompt = (
+            get_full_system_prompt("factual" if temperature <= 0.4 else "creative")
+            if use_cot_prompt
+            else None
+        )
+        prompt_tokens = self._estimate_text_tokens(system_prompt, prompt)
+        cap_tokens = await self._get_effective_cap_tokens()
+        num_predict = self._apply_completion_cap(base_num_predict, prompt_tokens, cap_tokens)
+        max_num_predict = max(num_predict, self._apply_completion_cap(max_num_predict, prompt_tokens, cap_tokens))
+
+        samples: List[Optional[BaseModel]] = [None] * n
+        use_response_format = True
+        for attempt in range(1, max_retries + 1):
+            pending = [index for index, sample in enumerate(samples) if sample is None]
+            if not pending:
+                break
+            payload = await self.generate_response(
+                prompt,
+                model=self._resolve_model(model),
+                temperature=temperature,
+                num_predict=num_predict,
+                system_prompt=system_prompt,
+                top_p=0.9,
+                response_format="json_object" if use_response_format else None,
+                n=len(pending),
+            )
+            truncated = False
+            for index, choice in zip(pending, payload.get("choices", [])):
+                if not choice.get("done", True):
+                    truncated = True
+                    logger.debug("Sample %s truncated at %s tokens (round %s)", index, num_predict, attempt)
+                    continue
+                try:
+                    samples[index] = self._validate_structured_text(
+                        choice.get("response", ""), response_model, validation_context
+                    )
+                except Exception as exc:
+                    logger.debug("Sample %s failed validation (round %s): %s", index, attempt, exc)
+            if truncated:
+                num_predict = min(max_num_predict, max(num_predict + 512, int(num_predict * 1.5)))
+            # Mirror generate_structured_response: relax the JSON constraint after a failed round
+            use_response_format = False
+
+        return samples
+
     async def _generate_text_with_dynamic_predict(
         self,
         *,
@@ -649,6 +752,7 @@ class VLLMClient:
         top_p: float,
         grammar: Optional[str],
         use_response_format: bool,
+        schema_model: Optional[Type[BaseModel]] = None,
     ) -> Tuple[str, bool]:
         prompt_tokens = self._estimate_text_tokens(system_prompt, prompt)
         cap_tokens = await self._get_effective_cap_tokens()
@@ -657,30 +761,205 @@ class VLLMClient:
         if max_clamped < base_clamped:
             max_clamped = base_clamped
         current = base_clamped
+        partial = ""
+        partial_tokens = 0
+        saved_tokens = 0
         while True:
-            payload = await self.generate_response(
-                prompt,
-                model=model,
-                temperature=temperature,
-                num_predict=current,
-                system_prompt=system_prompt,
-                top_p=top_p,
-                grammar=grammar,
-                # Encourage JSON object responses to reduce top-level list outputs
-                response_format="json_object" if use_response_format else None,
-            )
-            text = payload.get("response", "")
+            guard = StreamingSchemaGuard(schema_model) if schema_model is not None else None
+            if partial:
+                if guard is not None:
+                    guard.feed(partial)
+                try:
+                    payload = await self.generate_response(
+                        prompt,
+                        model=model,
+                        temperature=temperature,
+                        num_predict=max(1, current - partial_tokens),
+                        system_prompt=system_prompt,
+                        top_p=top_p,
+                        grammar=grammar,
+                        assistant_prefix=partial,
+                        schema_guard=guard,
+                    )
+                except httpx.HTTPStatusError as exc:
+                    if exc.response.status_code not in {400, 422}:
+                        raise
+                    logger.warning(
+                        "Server rejected continuation (HTTP %s); restarting truncated responses instead",
+                        exc.response.status_code,
+                    )
+                    self.enable_continuation = False
+                    self.truncation_stats["restarts"] += 1
+                    partial, partial_tokens = "", 0
+                    continue
+                text = partial + payload.get("response", "")
+                generated = partial_tokens + payload.get("completion_tokens", 0)
+                self.truncation_stats["continuations"] += 1
+                # A restart would have regenerated everything produced so far
+                saved_tokens += partial_tokens
+                self.truncation_stats["tokens_saved"] += partial_tokens
+            else:
+                payload = await self.generate_response(
+                    prompt,
+                    model=model,
+                    temperature=temperature,
+                    num_predict=current,
+                    system_prompt=system_prompt,
+                    top_p=top_p,
+                    grammar=grammar,
+                    # Encourage JSON object responses to reduce top-level list outputs
+                    response_format="json_object" if use_response_format else None,
+                    schema_guard=guard,
+                )
+                text = payload.get("response", "")
+                generated = payload.get("completion_tokens", 0)
+            if payload.get("aborted"):
+                raise SchemaViolationError(f"Response left the schema: {payload['aborted']}")
             if payload.get("done", True):
+                if partial:
+                    logger.info(
+                        "♻️ Completed truncated response by continuation (%s tokens total, ~%s tokens not regenerated)",
+                        generated,
+                        saved_tokens,
+                    )
                 return text, False
-            if current >= max_clamped:
+            self.truncation_stats["truncations"] += 1
+            continuing = self.enable_continuation and bool(text)
+            # When continuing, the budget is spent on tokens actually generated so far
+            used = generated if continuing else current
+            if used >= max_clamped or (partial and len(text) == len(partial)):
                 return text, True
-            previous = current
-            current = min(max_clamped, max(current + 512, int(current * 1.5)))
-            logger.warning(
-                "LLM response truncated at %s tokens; retrying with %s",
-                previous,
-                current,
-            )
+            previous = used
+            current = min(max_clamped, max(used + 512, int(used * 1.5)))
+            if continuing:
+                partial, partial_tokens = text, generated
+                logger.warning(
+                    "LLM response truncated at %s tokens; continuing from partial output up to %s",
+                    previous,
+                    current,
+                )
+            else:
+                self.truncation_stats["restarts"] += 1
+                logger.warning(
+                    "LLM response truncated at %s tokens; retrying with %s",
+                    previous,
+                    current,
+                )
+
+    def _validate_structured_text(
+        self,
+        text: str,
+        response_model: Type[BaseModel],
+        validation_context: Optional[Dict[str, Any]] = None,
+    ) -> BaseModel:
+        """Parse, sanitise and validate one completion; raises when it is unusable."""
+
+        parsed = self._parse_structured_payload(text)
+        parsed = self._coerce_to_model_schema(parsed, response_model)
+        # Some models occasionally return a single-item list wrapping the object
+        if not isinstance(parsed, dict) and isinstance(parsed, list) and parsed and isinstance(parsed[0], dict):
+            logger.info("Unwrapped single-item list to match schema")
+            parsed = parsed[0]
+        if not isinstance(parsed, dict):
+            raise ValueError(f"Expected dict after coercion, got {type(parsed).__name__}")
+
+        # Lightweight sanitation before validation to reduce avoidable failures
+        try:
+            def _stringify_sequence(items: List[Any]) -> List[str]:
+                stringified: List[str] = []
+                for item in items:
+                    if isinstance(item, str):
+                        stringified.append(item)
+                    elif isinstance(item, dict):
+                        parts = []
+                        for k, v in item.items():
+                            if v is None:
+                                continue
+                            parts.append(f"{k}: {v}")
+                        stringified.append(" | ".join(parts) if parts else str(item))
+                    elif isinstance(item, list):
+                        parts = [str(elem) for elem in item if elem is not None]
+                        stringified.append(" | ".join(parts) if parts else str(item))
+                    else:
+                        stringified.append(str(item))
+                return stringified
+
+            if response_model.__name__ == "BlogContent":
+                stats = parsed.get("statistics")
+                source = (validation_context or {}).get("source_text", "")
+                if isinstance(stats, list) and source:
+                    locator = get_quote_locator(source)
+                    def _ok(item: Any) -> bool:
+                        try:
+                            quote = str((item or {}).get("quote", "")).strip()
+                            if not quote:
+                                return False
+                            return locator.contains(quote, cutoff=0.8)
+                        except Exception:
+                            return False
+                    before = len(stats)
+                    parsed["statistics"] = [it for it in stats if _ok(it)]
+                    after = len(parsed["statistics"])
+                    if before and after < before:
+                        logger.info("Filtered %s invalid statistics prior to validation", before - after)
+                string_fields = [
+                    "article_ideas",
+                    "blog_outlines",
+                    "talking_points",
+                    "expert_quotes",
+                    "case_studies",
+                    "how_to_guides",
+                    "myth_busting",
+                ]
+                for key in string_fields:
+                    if key in parsed and isinstance(parsed[key], list):
+                        parsed[key] = _stringify_sequence(parsed[key])
+            elif response_model.__name__ == "RebellionFramework":
+                # Flatten nested lists the model sometimes returns
+                def _flatten(items: Any) -> List[str]:
+                    result: List[str] = []
+                    if isinstance(items, list):
+                        for it in items:
+                            if isinstance(it, list):
+                                result.append(" ".join([str(x) for x in it]))
+                            else:
+                                result.append(str(it))
+                    return result
+                for key in ("narrative_deconstruction","sensory_profiling","executive_function","social_processing","strengths_synthesis","rebellion_themes","aha_moments"):
+                    if key in parsed and isinstance(parsed[key], list) and any(isinstance(x, list) for x in parsed[key]):
+                        parsed[key] = _flatten(parsed[key])
+            else:
+                if isinstance(parsed, dict):
+                    for key, value in list(parsed.items()):
+                        if isinstance(value, list) and any(not isinstance(it, str) for it in value):
+                            parsed[key] = _stringify_sequence(value)
+        except Exception:
+            # Best-effort sanitation; fall through to validation
+            pass
+
+        if validation_context:
+            validated = response_model.model_validate(parsed, context=validation_context)
+        else:
+            validated = response_model.model_validate(parsed)
+
+        data_dict = validated.model_dump()
+        list_values = [value for value in data_dict.values() if isinstance(value, list)]
+        if list_values:
+            empty = sum(1 for value in list_values if not value)
+            filled = len(list_values) - empty
+
+            # VERY lenient: Accept if ANY field has content
+            # (For complex schemas with 7-8 list fields, partial completion is acceptable)
+            if filled == 0:
+                raise ValueError(
+                    f"No content generated: all {len(list_values)} lists are empty"
+                )
+
+            # Log warning if less than 50% filled, but don't reject
+            if filled < len(list_values) // 2:
+                logger.info(f"⚠️ Partial completion: {filled}/{len(list_values)} lists filled (acceptable)")
+
+        return validated
 
     def _parse_structured_payload(self, response_text: str) -> Any:
         try:
@@ -797,6 +1076,8 @@ class OpenAIClient(VLLMClient):
             raise ValueError("OpenAI API key is required when using the OpenAI provider")
 
         headers = dict(kwargs.pop("headers", {}))
+        # OpenAI's API has no continue_final_message; restart truncated responses
+        kwargs.setdefault("enable_continuation", False)
         headers.setdefault("Authorization", f"Bearer {api_key}")
         headers.setdefault("Content-Type", "application/json")
 
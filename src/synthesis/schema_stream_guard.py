@@ -0,0 +1,252 @@
+"""Incremental top-level JSON checks for streamed structured responses.
+
+``StreamingSchemaGuard`` is fed completion text as it streams in and reports
+the first point at which the output can no longer validate against the
+response model, so the request can be cancelled instead of running to
+``max_tokens``. Only violations that the client-side repair/coercion in
+``VLLMClient`` and the model's own validation cannot recover from are reported:
+
+- prose before the opening brace (a leading Markdown code fence is allowed)
+- with ``extra="forbid"``, an unknown top-level key whose value is not an
+  object (objects may be wrappers that ``_coerce_to_model_schema`` unwraps)
+- a top-level value whose JSON type the field can never accept. ``null`` is
+  accepted for fields with defaults, and fields with ``before``/``wrap``/
+  ``plain`` validators (or models with such a model validator) are not
+  type-checked, since those validators may coerce anything
+
+Anything the guard does not understand (top-level arrays, malformed JSON)
+switches it off rather than aborting.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Set, Type
+
+from pydantic import BaseModel
+
+_NUMBER_START = set("-0123456789")
+_WHITESPACE = set(" \t\r\n")
+_SCHEMA_TYPES = {
+    "array": {"array"},
+    "object": {"object"},
+    "string": {"string"},
+    # Lax validation accepts numeric and boolean strings
+    "integer": {"number", "string"},
+    "number": {"number", "string"},
+    "boolean": {"boolean", "string"},
+    "null": {"null"},
+}
+
+
+def _json_type(char: str) -> Optional[str]:
+    if char == "[":
+        return "array"
+    if char == "{":
+        return "object"
+    if char == '"':
+        return "string"
+    if char in _NUMBER_START:
+        return "number"
+    if char in "tf":
+        return "boolean"
+    if char == "n":
+        return "null"
+    return None
+
+
+def _accepted_types(schema: Dict[str, Any]) -> Optional[Set[str]]:
+    """JSON value types a property schema can accept, or ``None`` when unknown."""
+    if "$ref" in schema:
+        return {"object"}
+    options = schema.get("anyOf") or schema.get("oneOf")
+    if options:
+        accepted: Set[str] = set()
+        for option in options:
+            option_types = _accepted_types(option)
+            if option_types is None:
+                return None
+            accepted |= option_types
+        return accepted
+    schema_type = schema.get("type")
+    if isinstance(schema_type, list):
+        return set().union(*(_SCHEMA_TYPES.get(item, {item}) for item in schema_type))
+    if isinstance(schema_type, str):
+        return set(_SCHEMA_TYPES.get(schema_type, {schema_type}))
+    return None
+
+
+_COERCING_MODES = {"before", "wrap", "plain"}
+
+
+def _coerced_fields(response_model: Type[BaseModel]) -> Optional[Set[str]]:
+    """Fields whose input a validator may rewrite; ``None`` means all of them."""
+    decorators = response_model.__pydantic_decorators__
+    if any(item.info.mode in _COERCING_MODES for item in decorators.model_validators.values()):
+        return None
+    fields: Set[str] = set()
+    for item in decorators.field_validators.values():
+        if item.info.mode in _COERCING_MODES:
+            if "*" in item.info.fields:
+                return None
+            fields.update(item.info.fields)
+    return fields
+
+
+class StreamingSchemaGuard:
+    """Character-level scanner of the top-level JSON object of a completion."""
+
+    def __init__(self, response_model: Type[BaseModel]):
+        schema = response_model.model_json_schema()
+        self.field_types: Dict[str, Optional[Set[str]]] = {}
+        for name, prop in (schema.get("properties") or {}).items():
+            self.field_types[name] = _accepted_types(prop)
+        coerced = _coerced_fields(response_model)
+        for name, field in response_model.model_fields.items():
+            keys = {name, field.alias or name}
+            if coerced is None or name in coerced:
+                accepted = None
+            else:
+                accepted = self.field_types.get(field.alias or name)
+                if accepted is not None and not field.is_required():
+                    accepted = accepted | {"null"}
+            for key in keys:
+                self.field_types[key] = accepted
+        # pydantic ignores unknown keys unless the model forbids them
+        self.allow_extra = response_model.model_config.get("extra") != "forbid"
+
+        self.violation: Optional[str] = None
+        self.active = True
+        self.chars_seen = 0
+        self._state = "start"
+        self._key = ""
+        self._escape = False
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, text: str) -> Optional[str]:
+        """Consume more output; returns the violation once one is found."""
+        for char in text:
+            if not self.active or self.violation:
+                break
+            self.chars_seen += 1
+            self._step(char)
+        return self.violation
+
+    # ----------------------------------------------------------------- states
+    def _fail(self, reason: str) -> None:
+        self.violation = reason
+
+    def _step(self, char: str) -> None:
+        state = self._state
+        if state == "start":
+            if char in _WHITESPACE:
+                return
+            if char == "{":
+                self._state = "key_or_end"
+            elif char == "`":
+                self._state = "fence"
+            elif char == "[":
+                self.active = False  # single-item list wrappers are unwrapped later
+            else:
+                self._fail(f"text before the JSON object (starts with {char!r})")
+        elif state == "fence":
+            if char == "\n":
+                self._state = "start"
+        elif state == "key_or_end":
+            if char in _WHITESPACE:
+                return
+            if char == '"':
+                self._state, self._key, self._escape = "key", "", False
+            else:
+                # "}" closes the object; anything else is malformed. Stop either way.
+                self.active = False
+        elif state == "key":
+            if self._escape:
+                self._key += char
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._state = "colon"
+            else:
+                self._key += char
+        elif state == "colon":
+            if char in _WHITESPACE:
+                return
+            if char == ":":
+                self._state = "value_start"
+            else:
+                self.active = False
+        elif state == "value_start":
+            if char in _WHITESPACE:
+                return
+            self._check_value(char)
+            if self.violation or not self.active:
+                return
+            self._start_value(char)
+        elif state == "value":
+            self._scan_value(char)
+        elif state == "after_value":
+            if char in _WHITESPACE:
+                return
+            if char == ",":
+                self._state = "key_or_end"
+            else:
+                # "}" ends the object; anything else is malformed. Stop either way.
+                self.active = False
+
+    def _check_value(self, char: str) -> None:
+        value_type = _json_type(char)
+        if value_type is None:
+            self.active = False
+            return
+        if self._key not in self.field_types:
+            if self.allow_extra:
+                return
+            if value_type == "object":
+                self.active = False  # possibly a wrapper around the real payload
+                return
+            self._fail(f"unknown top-level key {self._key!r}")
+            return
+        accepted = self.field_types[self._key]
+        if accepted is not None and value_type not in accepted:
+            self._fail(f"field {self._key!r} expects {'/'.join(sorted(accepted))}, got {value_type}")
+
+    def _start_value(self, char: str) -> None:
+        self._state = "value"
+        self._escape = False
+        if char in "[{":
+            self._depth, self._in_string = 1, False
+        elif char == '"':
+            self._depth, self._in_string = 0, True
+        else:
+            self._depth, self._in_string = 0, False
+
+    def _scan_value(self, char: str) -> None:
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                if self._depth == 0:
+                    self._state = "after_value"
+            return
+        if self._depth == 0:
+            # Inside a scalar: it ends at the next delimiter
+            if char == ",":
+                self._state = "key_or_end"
+            elif char == "}":
+                self.active = False
+            elif char in _WHITESPACE:
+                self._state = "after_value"
+            return
+        if char == '"':
+            self._in_string = True
+        elif char in "[{":
+            self._depth += 1
+        elif char in "]}":
+            self._depth -= 1
+            if self._depth == 0:
+                self._state = "after_value"
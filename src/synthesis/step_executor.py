@@ -0,0 +1,134 @@
+"""Dependency-aware concurrent executor for synthesis steps.
+
+Each ``SynthesisStep`` names the source values it reads (``inputs``, handed
+to ``StepExecutor.run``) and the steps whose outputs it consumes (``after``).
+Steps start as soon as their dependencies are done, under one shared
+concurrency cap. A failing step yields its fallback value, for its own key
+and for any dependents, without touching the others.
+The timing report marks the critical path: the chain of dependencies that
+ends at the last step to finish.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SynthesisStep:
+    """One output key and the coroutine producing it.
+
+    ``run`` is called with the ``inputs`` source values followed by the
+    outputs of the ``after`` steps, in declaration order.
+    """
+
+    key: str
+    run: Callable[..., Awaitable[Any]]
+    inputs: Tuple[str, ...] = ()
+    after: Tuple[str, ...] = ()
+    fallback: Callable[[], Any] = dict
+
+
+class StepExecutor:
+    """Run a fixed set of ``SynthesisStep``s as a DAG with bounded concurrency."""
+
+    def __init__(self, steps: Sequence[SynthesisStep], max_concurrency: int = 4):
+        self.steps = list(steps)
+        self.max_concurrency = max(1, max_concurrency)
+        keys = [step.key for step in self.steps]
+        if len(set(keys)) != len(keys):
+            raise ValueError("Duplicate synthesis step keys")
+        unknown = {name for step in self.steps for name in step.after} - set(keys)
+        if unknown:
+            raise ValueError(f"Unknown synthesis step dependencies: {sorted(unknown)}")
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        by_key = {step.key: step for step in self.steps}
+        visiting, done = set(), set()
+
+        def visit(key: str) -> None:
+            if key in done:
+                return
+            if key in visiting:
+                raise ValueError(f"Synthesis steps form a cycle through {key!r}")
+            visiting.add(key)
+            for dependency in by_key[key].after:
+                visit(dependency)
+            visiting.discard(key)
+            done.add(key)
+
+        for key in by_key:
+            visit(key)
+
+    async def run(self, sources: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Return ``(outputs, timing_report)``; outputs keep the declared step order."""
+        missing = {name for step in self.steps for name in step.inputs if name not in sources}
+        if missing:
+            raise ValueError(f"Missing synthesis inputs: {sorted(missing)}")
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        futures: Dict[str, asyncio.Future] = {
+            step.key: asyncio.get_running_loop().create_future() for step in self.steps
+        }
+        timings: Dict[str, Dict[str, Any]] = {}
+        wall_start = time.perf_counter()
+
+        async def _run(step: SynthesisStep) -> None:
+            values = [sources[name] for name in step.inputs]
+            for name in step.after:
+                values.append(await futures[name])
+            ready = time.perf_counter()
+            async with semaphore:
+                started = time.perf_counter()
+                status = "ok"
+                try:
+                    result = await step.run(*values)
+                except Exception as exc:
+                    logger.error("Synthesis step %s failed; using fallback: %s", step.key, exc)
+                    result = step.fallback()
+                    status = "failed"
+                finished = time.perf_counter()
+            timings[step.key] = {
+                "ready": ready - wall_start,
+                "started": started - wall_start,
+                "finished": finished - wall_start,
+                "seconds": finished - started,
+                "status": status,
+            }
+            futures[step.key].set_result(result)
+
+        await asyncio.gather(*[_run(step) for step in self.steps])
+        outputs = {step.key: futures[step.key].result() for step in self.steps}
+        return outputs, self._report(timings, time.perf_counter() - wall_start)
+
+    def _report(self, timings: Dict[str, Dict[str, Any]], wall_clock: float) -> Dict[str, Any]:
+        by_key = {step.key: step for step in self.steps}
+        path: List[str] = []
+        if timings:
+            key = max(timings, key=lambda name: timings[name]["finished"])
+            while key is not None:
+                path.append(key)
+                dependencies = by_key[key].after
+                key = max(dependencies, key=lambda name: timings[name]["finished"]) if dependencies else None
+            path.reverse()
+        return {
+            "total_seconds": round(wall_clock, 4),
+            "summed_seconds": round(sum(entry["seconds"] for entry in timings.values()), 4),
+            "critical_path": path,
+            "critical_path_seconds": round(sum(timings[key]["seconds"] for key in path), 4),
+            "steps": {
+                key: {
+                    name: round(value, 4) if isinstance(value, float) else value
+                    for name, value in timings[key].items()
+                }
+                for key in by_key
+                if key in timings
+            },
+        }
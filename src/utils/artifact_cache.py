@@ -0,0 +1,133 @@
+"""Content-addressed on-disk cache for curated context artifacts."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARTIFACT_CACHE_DIR = Path(os.getenv("ENLITENS_ARTIFACT_CACHE_DIR", "cache/context_artifacts"))
+
+
+def hash_content(*parts: Any) -> str:
+    """Return a stable SHA-256 digest for arbitrary JSON-serialisable ``parts``."""
+
+    hasher = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, bytes):
+            payload = part
+        elif isinstance(part, str):
+            payload = part.encode("utf-8")
+        else:
+            payload = json.dumps(part, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+        hasher.update(len(payload).to_bytes(8, "big"))
+        hasher.update(payload)
+    return hasher.hexdigest()
+
+
+@dataclass
+class ArtifactCache:
+    """Thread-safe JSON artifact cache keyed by content hash with per-namespace TTLs.
+
+    Entries live at ``<root>/<namespace>/<sha256>.json`` so a namespace can be
+    invalidated by deleting its directory. ``ttl_seconds`` maps namespace names
+    to expiry windows; ``None`` (or a missing namespace) means entries never
+    expire.
+    """
+
+    root: Path = DEFAULT_ARTIFACT_CACHE_DIR
+    ttl_seconds: Dict[str, Optional[float]] = field(default_factory=dict)
+    enabled: bool = True
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+    _stats: Dict[str, int] = field(default_factory=lambda: {"hits": 0, "misses": 0, "writes": 0})
+
+    def __post_init__(self) -> None:
+        self.root = Path(self.root)
+
+    def _entry_path(self, namespace: str, key: str) -> Path:
+        return self.root / namespace / f"{key}.json"
+
+    def get(self, namespace: str, *key_parts: Any) -> Any | None:
+        """Return the cached value for ``key_parts`` or ``None`` when missing/expired."""
+
+        if not self.enabled:
+            return None
+        key = hash_content(*key_parts)
+        path = self._entry_path(namespace, key)
+        with self._lock:
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                self._stats["misses"] += 1
+                return None
+            except (OSError, json.JSONDecodeError) as exc:
+                logger.warning("Discarding unreadable artifact cache entry %s: %s", path, exc)
+                path.unlink(missing_ok=True)
+                self._stats["misses"] += 1
+                return None
+
+            ttl = self.ttl_seconds.get(namespace)
+            if ttl is not None and time.time() - float(entry.get("created_at", 0)) >= ttl:
+                path.unlink(missing_ok=True)
+                self._stats["misses"] += 1
+                return None
+
+            self._stats["hits"] += 1
+            return entry.get("value")
+
+    def set(self, namespace: str, value: Any, *key_parts: Any) -> str:
+        """Persist ``value`` under ``key_parts`` atomically and return the content key."""
+
+        key = hash_content(*key_parts)
+        if not self.enabled:
+            return key
+        path = self._entry_path(namespace, key)
+        entry = {"namespace": namespace, "created_at": time.time(), "value": value}
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)
+            self._stats["writes"] += 1
+        return key
+
+    def invalidate(self, namespace: Optional[str] = None, *key_parts: Any) -> int:
+        """Drop one entry, a whole namespace, or (``namespace=None``) everything.
+
+        Returns the number of entries removed.
+        """
+
+        with self._lock:
+            if namespace is not None and key_parts:
+                path = self._entry_path(namespace, hash_content(*key_parts))
+                if path.exists():
+                    path.unlink()
+                    return 1
+                return 0
+
+            if namespace is not None:
+                targets = [self.root / namespace]
+            elif self.root.exists():
+                targets = [child for child in self.root.iterdir() if child.is_dir()]
+            else:
+                targets = []
+            removed = 0
+            for directory in targets:
+                if not directory.exists():
+                    continue
+                for entry_path in directory.glob("*.json"):
+                    entry_path.unlink(missing_ok=True)
+                    removed += 1
+            return removed
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
@@ -1,20 +1,318 @@
 #!/usr/bin/env python3
 """
 Utility helpers for safely appending records to JSON Lines ledgers.
+
+``JsonlLedger`` keeps the ledger (and optional mirror) open in append mode so
+each record costs one line write per file. fsync is group-committed: a
+background timer syncs dirty writes ``fsync_interval`` seconds after the first
+unsynced append (0 = every append), and flush/close always sync.
+A sidecar offset index (``<ledger>.idx``) maps record ids to byte offsets for
+random access and resume checks without parsing the ledger; ``repair`` rebuilds
+it and trims a torn trailing line after a crash. Appends hold an exclusive
+``flock`` on the ledger and take their offset from the file's real end, so
+several writers (threads or processes) can share one ledger; records appended
+by other writers are picked up from the index before each append.
 """
 from __future__ import annotations
 
+import atexit
 import json
+import logging
 import os
 import shutil
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+try:  # Optional on non-POSIX platforms
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FSYNC_INTERVAL = float(os.getenv("ENLITENS_LEDGER_FSYNC_INTERVAL", "1.0"))
 
 
 def _ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+class JsonlLedger:
+    """Append-only JSONL writer with mirror, group-commit fsync and an offset index."""
+
+    def __init__(
+        self,
+        ledger_path: Path,
+        *,
+        mirror_path: Optional[Path] = None,
+        index_path: Optional[Path] = None,
+        id_field: str = "document_id",
+        fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+        sort_keys: bool = True,
+    ) -> None:
+        self.ledger_path = Path(ledger_path)
+        self.mirror_path = Path(mirror_path) if mirror_path else None
+        self.index_path = Path(index_path) if index_path else self.ledger_path.with_name(self.ledger_path.name + ".idx")
+        self.id_field = id_field
+        self.fsync_interval = max(0.0, fsync_interval)
+        self.sort_keys = sort_keys
+
+        self._lock = threading.Lock()
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+        self._end = 0
+        self._index_size = 0
+        self._last_sync = time.monotonic()
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+
+        _ensure_parent(self.ledger_path)
+        self._load_index()
+        if self._ledger_size() != self._end:
+            self.repair()
+        self._sync_mirror()
+
+        self._ledger = open(self.ledger_path, "ab")
+        self._index = open(self.index_path, "ab")
+        self._mirror = open(self.mirror_path, "ab") if self.mirror_path else None
+
+    # ------------------------------------------------------------------ state
+    def _ledger_size(self) -> int:
+        try:
+            return self.ledger_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _load_index(self) -> None:
+        self._offsets.clear()
+        self._end = 0
+        self._index_size = 0
+        if self.index_path.exists():
+            self._read_index_from(0)
+
+    def _read_index_from(self, position: int) -> None:
+        """Merge index entries from byte ``position`` onwards into memory."""
+        with open(self.index_path, "rb") as handle:
+            handle.seek(position)
+            for raw in handle:
+                try:
+                    entry = json.loads(raw.decode("utf-8"))
+                    offset, length = int(entry["offset"]), int(entry["length"])
+                except (UnicodeDecodeError, ValueError, KeyError, TypeError):
+                    # Torn index tail: force a rebuild via the size check
+                    self._end = -1
+                    return
+                if entry.get("id") is not None:
+                    self._offsets[str(entry["id"])] = (offset, length)
+                self._end = max(self._end, offset + length)
+                self._index_size += len(raw)
+
+    def _sync_mirror(self) -> None:
+        """Bring the mirror in line with the ledger once, before appending to both."""
+        if not self.mirror_path:
+            return
+        _ensure_parent(self.mirror_path)
+        mirror_size = self.mirror_path.stat().st_size if self.mirror_path.exists() else -1
+        if mirror_size != self._ledger_size():
+            if self.ledger_path.exists():
+                shutil.copy2(self.ledger_path, self.mirror_path)
+            else:
+                self.mirror_path.write_bytes(b"")
+
+    # ---------------------------------------------------------------- writing
+    def append(self, record: Dict[str, Any]) -> int:
+        """Append ``record`` and return its byte offset in the ledger."""
+        line = (json.dumps(record, ensure_ascii=False, sort_keys=self.sort_keys) + "\n").encode("utf-8")
+        record_id = record.get(self.id_field)
+        with self._lock:
+            if fcntl is not None:
+                fcntl.flock(self._ledger.fileno(), fcntl.LOCK_EX)
+            try:
+                offset = os.fstat(self._ledger.fileno()).st_size
+                if offset != self._end:
+                    # Another writer appended since our last look
+                    self._read_index_from(self._index_size)
+                self._ledger.write(line)
+                self._ledger.flush()
+                if self._mirror:
+                    self._mirror.write(line)
+                    self._mirror.flush()
+                index_line = (
+                    json.dumps({"id": record_id, "offset": offset, "length": len(line)}, ensure_ascii=False) + "\n"
+                ).encode("utf-8")
+                self._index.write(index_line)
+                self._index.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._ledger.fileno(), fcntl.LOCK_UN)
+
+            self._end = offset + len(line)
+            self._index_size += len(index_line)
+            if record_id is not None:
+                self._offsets[str(record_id)] = (offset, len(line))
+            self._dirty = True
+            if time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._fsync_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.fsync_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return offset
+
+    def _fsync_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for handle in (self._ledger, self._mirror, self._index):
+            if handle is not None and not handle.closed:
+                handle.flush()
+                os.fsync(handle.fileno())
+        self._last_sync = time.monotonic()
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Force any group-committed writes to stable storage."""
+        with self._lock:
+            if self._dirty:
+                self._fsync_locked()
+            elif self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._dirty:
+                self._fsync_locked()
+            for handle in (self._ledger, self._mirror, self._index):
+                if handle is not None and not handle.closed:
+                    handle.close()
+
+    def __enter__(self) -> "JsonlLedger":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # ---------------------------------------------------------------- reading
+    def __contains__(self, record_id: object) -> bool:
+        return str(record_id) in self._offsets
+
+    def contains(self, record_id: str) -> bool:
+        return record_id in self
+
+    def offset_of(self, record_id: str) -> Optional[int]:
+        entry = self._offsets.get(str(record_id))
+        return entry[0] if entry else None
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def read(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """Return the latest record stored under ``record_id`` using one seek."""
+        entry = self._offsets.get(str(record_id))
+        if entry is None:
+            return None
+        offset, length = entry
+        with self._lock:
+            if not self._ledger.closed:
+                self._ledger.flush()
+        with open(self.ledger_path, "rb") as handle:
+            handle.seek(offset)
+            return json.loads(handle.read(length).decode("utf-8"))
+
+    # ----------------------------------------------------------------- repair
+    def repair(self) -> Dict[str, int]:
+        """
+        Rebuild the offset index from the ledger, trimming a torn trailing line.
+
+        Returns counts of indexed records and truncated bytes.
+        """
+        offsets: Dict[str, Tuple[int, int]] = {}
+        entries = []
+        valid_end = 0
+        truncated = 0
+        if self.ledger_path.exists():
+            with open(self.ledger_path, "rb") as handle:
+                offset = 0
+                for raw in handle:
+                    if not raw.endswith(b"\n"):
+                        break
+                    try:
+                        record = json.loads(raw.decode("utf-8"))
+                    except (UnicodeDecodeError, json.JSONDecodeError):
+                        break
+                    record_id = record.get(self.id_field) if isinstance(record, dict) else None
+                    entries.append({"id": record_id, "offset": offset, "length": len(raw)})
+                    if record_id is not None:
+                        offsets[str(record_id)] = (offset, len(raw))
+                    offset += len(raw)
+                valid_end = offset
+            truncated = self._ledger_size() - valid_end
+            if truncated:
+                logger.warning(
+                    "Ledger %s has a torn tail; truncating %d bytes at offset %d",
+                    self.ledger_path,
+                    truncated,
+                    valid_end,
+                )
+                with open(self.ledger_path, "r+b") as handle:
+                    handle.truncate(valid_end)
+                    handle.flush()
+                    os.fsync(handle.fileno())
+
+        tmp_index = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_index, "w", encoding="utf-8") as handle:
+            for entry in entries:
+                handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_index, self.index_path)
+
+        self._offsets = offsets
+        self._end = valid_end
+        self._index_size = self.index_path.stat().st_size
+        logger.info("Rebuilt ledger index %s (%d records)", self.index_path, len(entries))
+        return {"records": len(entries), "truncated_bytes": truncated}
+
+
+_LEDGERS: Dict[Tuple[Path, Optional[Path]], JsonlLedger] = {}
+_LEDGERS_LOCK = threading.Lock()
+
+
+def get_ledger(ledger_path: Path, *, mirror_path: Optional[Path] = None, sort_keys: bool = True) -> JsonlLedger:
+    """Return a process-wide ledger writer for ``ledger_path``.
+
+    Raises ``ValueError`` if the shared writer was opened with a different
+    ``sort_keys``, since records in one ledger should serialise the same way.
+    """
+    key = (Path(ledger_path).resolve(), Path(mirror_path).resolve() if mirror_path else None)
+    with _LEDGERS_LOCK:
+        ledger = _LEDGERS.get(key)
+        if ledger is None or ledger._ledger.closed:
+            ledger = JsonlLedger(Path(ledger_path), mirror_path=mirror_path, sort_keys=sort_keys)
+            _LEDGERS[key] = ledger
+        elif ledger.sort_keys != sort_keys:
+            raise ValueError(
+                f"Ledger {ledger_path} is already open with sort_keys={ledger.sort_keys}; got sort_keys={sort_keys}"
+            )
+        return ledger
+
+
+@atexit.register
+def _close_ledgers() -> None:
+    with _LEDGERS_LOCK:
+        for ledger in _LEDGERS.values():
+            try:
+                ledger.close()
+            except Exception:  # pragma: no cover - best effort at shutdown
+                pass
+        _LEDGERS.clear()
+
+
 def append_jsonl_record(
     record: Dict[str, Any],
     ledger_path: Path,
@@ -28,31 +326,8 @@ def append_jsonl_record(
     Args:
         record: The dictionary payload to persist.
         ledger_path: Target JSONL file path.
-        mirror_path: Optional path to copy the resulting ledger to after append.
+        mirror_path: Optional path that receives the same line as the ledger.
         sort_keys: Deterministic key ordering for readability.
     """
 
-    _ensure_parent(ledger_path)
-
-    serialized = json.dumps(record, ensure_ascii=False, sort_keys=sort_keys)
-    tmp_path = ledger_path.with_suffix(ledger_path.suffix + ".tmp")
-
-    # Write to a temporary file first
-    with open(tmp_path, "w", encoding="utf-8") as tmp_file:
-        tmp_file.write(serialized)
-        tmp_file.write("\n")
-        tmp_file.flush()
-        os.fsync(tmp_file.fileno())
-
-    # Append atomically to the ledger
-    with open(ledger_path, "ab") as ledger_file, open(tmp_path, "rb") as tmp_file:
-        shutil.copyfileobj(tmp_file, ledger_file)
-        ledger_file.flush()
-        os.fsync(ledger_file.fileno())
-
-    tmp_path.unlink(missing_ok=True)
-
-    if mirror_path:
-        _ensure_parent(mirror_path)
-        shutil.copy2(ledger_path, mirror_path)
-
+    get_ledger(ledger_path, mirror_path=mirror_path, sort_keys=sort_keys).append(record)
@@ -0,0 +1,169 @@
+"""Per-document index for locating quoted text in a source document.
+
+Citation checks used to compare every quote against the whole document (or
+every sentence) with ``difflib``, which is quadratic on long papers.
+``QuoteLocator`` indexes the document once:
+
+- word shingles (``shingle_size`` consecutive lower-cased words) → token
+  positions, used to find exact occurrences and to vote for the alignment of
+  fuzzy matches, so only a handful of windows are scored with ``SequenceMatcher``
+- word → sentence ids for the sentence-level ``get_close_matches`` check
+
+Lookups touch only the postings of the quote's own words, so their cost
+grows with how often those words occur rather than with document length.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+_WORD_RE = re.compile(r"\w+")
+# Shingles this common ("of the", "in the") carry no alignment signal
+_MAX_POSTINGS = 512
+_FUZZY_WINDOWS = 8
+_SENTENCE_CANDIDATES = 32
+
+
+@dataclass(frozen=True)
+class QuoteMatch:
+    """Where a quote was found: character offsets into the source and a 0–1 similarity."""
+
+    start: int
+    end: int
+    score: float
+    exact: bool
+
+
+class QuoteLocator:
+    """Exact and fuzzy quote lookups against one source document."""
+
+    def __init__(self, source_text: str, shingle_size: int = 3):
+        self.source_text = source_text or ""
+        self.shingle_size = shingle_size
+
+        matches = list(_WORD_RE.finditer(self.source_text))
+        self._words = [match.group().lower() for match in matches]
+        self._starts = [match.start() for match in matches]
+        self._ends = [match.end() for match in matches]
+        self._shingles: Dict[Tuple[str, ...], List[int]] = {}
+        for index in range(len(self._words) - shingle_size + 1):
+            self._shingles.setdefault(tuple(self._words[index: index + shingle_size]), []).append(index)
+        self._word_positions: Dict[str, List[int]] = {}
+        for index, word in enumerate(self._words):
+            self._word_positions.setdefault(word, []).append(index)
+
+        # Same segmentation as the original sentence-level check
+        self.sentences = self.source_text.split(". ")
+        self._sentence_words: Dict[str, List[int]] = {}
+        for sentence_id, sentence in enumerate(self.sentences):
+            for word in {word.lower() for word in _WORD_RE.findall(sentence)}:
+                self._sentence_words.setdefault(word, []).append(sentence_id)
+
+    # ------------------------------------------------------------------ exact
+    def find_exact(self, quote: str) -> Optional[QuoteMatch]:
+        """Return the first verbatim (case-sensitive) occurrence of ``quote``."""
+        if not quote:
+            return None
+        words = list(_WORD_RE.finditer(quote))
+        # The first and last words may be cut mid-word, so anchor on an inner one
+        inner = words[1:-1]
+        if not inner:
+            start = self.source_text.find(quote)
+            return QuoteMatch(start, start + len(quote), 1.0, True) if start >= 0 else None
+        anchor = min(inner, key=lambda match: len(self._word_positions.get(match.group().lower(), ())))
+        for position in self._word_positions.get(anchor.group().lower(), ()):
+            start = self._starts[position] - anchor.start()
+            if start >= 0 and self.source_text.startswith(quote, start):
+                return QuoteMatch(start, start + len(quote), 1.0, True)
+        return None
+
+    # ------------------------------------------------------------------ fuzzy
+    def _normalized(self, first: int, last: int) -> str:
+        return " ".join(self._words[first:last])
+
+    def locate(self, quote: str) -> Optional[QuoteMatch]:
+        """Return the exact match, else the best case-insensitive fuzzy match.
+
+        The fuzzy score is ``SequenceMatcher.ratio`` between the normalised
+        quote and the best-aligned window of the document.
+        """
+        exact = self.find_exact(quote)
+        if exact is not None:
+            return exact
+        query = [word.lower() for word in _WORD_RE.findall(quote or "")]
+        if not query or not self._words:
+            return None
+        size = min(self.shingle_size, len(query))
+
+        votes: Counter[int] = Counter()
+        for offset in range(len(query) - size + 1):
+            key = tuple(query[offset: offset + size])
+            positions = self._shingles.get(key, []) if size == self.shingle_size else self._positions_of(key)
+            if not positions or len(positions) > _MAX_POSTINGS:
+                continue
+            for position in positions:
+                votes[position - offset] += 1
+        if not votes:
+            return None
+
+        normalized_quote = " ".join(query)
+        best: Optional[QuoteMatch] = None
+        for diagonal, _ in votes.most_common(_FUZZY_WINDOWS):
+            first = max(0, diagonal)
+            last = min(len(self._words), diagonal + len(query))
+            if first >= last:
+                continue
+            score = SequenceMatcher(None, normalized_quote, self._normalized(first, last)).ratio()
+            if best is None or score > best.score:
+                best = QuoteMatch(self._starts[first], self._ends[last - 1], score, False)
+        return best
+
+    def _positions_of(self, key: Tuple[str, ...]) -> List[int]:
+        """Positions of a word sequence shorter than the shingle size."""
+        return [
+            position
+            for position in self._word_positions.get(key[0], ())
+            if tuple(self._words[position: position + len(key)]) == key
+        ]
+
+    # --------------------------------------------------------------- sentences
+    def close_sentence(self, quote: str, cutoff: float = 0.8) -> Optional[str]:
+        """Sentence-level equivalent of ``difflib.get_close_matches(quote, sentences, n=1, cutoff)``.
+
+        Only sentences sharing words with the quote are scored, most shared first.
+        """
+        words = {word.lower() for word in _WORD_RE.findall(quote or "")}
+        shared: Counter[int] = Counter()
+        for word in words:
+            for sentence_id in self._sentence_words.get(word, ()):
+                shared[sentence_id] += 1
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(quote)
+        best_score, best_sentence = 0.0, None
+        for sentence_id, _ in shared.most_common(_SENTENCE_CANDIDATES):
+            matcher.set_seq1(self.sentences[sentence_id])
+            if (
+                matcher.real_quick_ratio() >= cutoff
+                and matcher.quick_ratio() >= cutoff
+                and matcher.ratio() >= cutoff
+            ):
+                score = matcher.ratio()
+                if score > best_score:
+                    best_score, best_sentence = score, self.sentences[sentence_id]
+        return best_sentence
+
+    def contains(self, quote: str, cutoff: float = 0.8) -> bool:
+        """Verbatim occurrence, or a sentence at least ``cutoff`` similar."""
+        return self.find_exact(quote) is not None or self.close_sentence(quote, cutoff) is not None
+
+
+@lru_cache(maxsize=8)
+def get_quote_locator(source_text: str) -> QuoteLocator:
+    """Return a cached locator so repeated checks against one document index it once."""
+    return QuoteLocator(source_text)
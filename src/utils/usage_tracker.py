@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import json
+import logging
 import math
 import os
+import sqlite3
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
 
 USAGE_FILE = Path("logs") / "ai_usage.json"
 DEFAULT_LIMITS = {
@@ -29,7 +35,134 @@ def _utc_now_iso() -> str:
     return datetime.now(tz=timezone.utc).isoformat()
 
 
-def _load_usage() -> Dict[str, Any]:
+# Usage events are appended to a local SQLite database in WAL mode so concurrent
+# agents (threads or processes) each pay one INSERT instead of rewriting a JSON
+# file, and no update is lost to a read-modify-write race. Totals are rolled up
+# on read. The first connection a process makes to a database creates the
+# schema, imports the legacy JSON file and runs ``compact_usage``, which folds
+# events older than ``USAGE_RETAIN_DAYS`` into daily rows and refreshes the
+# ``ai_usage.json`` snapshot.
+USAGE_DB = Path("logs") / "ai_usage.sqlite3"
+MAX_EVENTS_PER_TOOL = 50
+USAGE_RETAIN_DAYS = int(os.getenv("ENLITENS_USAGE_RETAIN_DAYS", "7"))
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    day TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 1,
+    tokens_in INTEGER NOT NULL DEFAULT 0,
+    tokens_out INTEGER NOT NULL DEFAULT 0,
+    cost_usd REAL NOT NULL DEFAULT 0,
+    model TEXT,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS usage_events_day_tool ON usage_events (day, tool);
+CREATE TABLE IF NOT EXISTS usage_daily (
+    day TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    tokens_in INTEGER NOT NULL DEFAULT 0,
+    tokens_out INTEGER NOT NULL DEFAULT 0,
+    cost_usd REAL NOT NULL DEFAULT 0,
+    last_used TEXT,
+    model TEXT,
+    PRIMARY KEY (day, tool)
+);
+CREATE TABLE IF NOT EXISTS usage_meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+_PREPARED: Set[str] = set()
+_PREPARED_LOCK = threading.Lock()
+
+
+def _open() -> sqlite3.Connection:
+    conn = sqlite3.connect(str(USAGE_DB), timeout=30.0, isolation_level=None)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
+
+
+def _ensure_prepared() -> None:
+    """Set up ``USAGE_DB`` once per process: schema, legacy import, then compaction."""
+    key = str(USAGE_DB.resolve())
+    if key in _PREPARED:
+        return
+    with _PREPARED_LOCK:
+        if key in _PREPARED:
+            return
+        USAGE_DB.parent.mkdir(parents=True, exist_ok=True)
+        conn = _open()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            _import_legacy_json(conn)
+        finally:
+            conn.close()
+        _PREPARED.add(key)
+    if USAGE_RETAIN_DAYS > 0:
+        try:
+            compact_usage(USAGE_RETAIN_DAYS)
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Usage compaction skipped: %s", exc)
+
+
+@contextmanager
+def _connect(write: bool = False) -> Iterator[sqlite3.Connection]:
+    _ensure_prepared()
+    conn = _open()
+    try:
+        if write:
+            conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            if write:
+                conn.execute("COMMIT")
+        except Exception:
+            if write:
+                conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+
+
+def _import_legacy_json(conn: sqlite3.Connection) -> None:
+    """One-time import of the pre-SQLite ``ai_usage.json`` totals."""
+    if conn.execute("SELECT 1 FROM usage_meta WHERE key = 'legacy_imported'").fetchone():
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if not conn.execute("SELECT 1 FROM usage_meta WHERE key = 'legacy_imported'").fetchone():
+            legacy = _read_legacy_json()
+            for day, tools in legacy.items():
+                if not isinstance(tools, dict):
+                    continue
+                for tool, record in tools.items():
+                    if not isinstance(record, dict):
+                        continue
+                    conn.execute(
+                        "INSERT OR REPLACE INTO usage_daily VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            day,
+                            tool,
+                            int(record.get("count", 0)),
+                            int(record.get("tokens_in", 0)),
+                            int(record.get("tokens_out", 0)),
+                            float(record.get("cost_usd", 0.0)),
+                            record.get("last_used"),
+                            record.get("model"),
+                        ),
+                    )
+            conn.execute("INSERT INTO usage_meta VALUES ('legacy_imported', ?)", (_utc_now_iso(),))
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _read_legacy_json() -> Dict[str, Any]:
     if not USAGE_FILE.exists():
         return {}
     try:
@@ -44,10 +177,117 @@ def _load_usage() -> Dict[str, Any]:
         return {}
 
 
+def _rollup(conn: sqlite3.Connection, day: Optional[str] = None) -> Dict[str, Any]:
+    """Build the legacy ``{day: {tool: record}}`` payload from events plus compacted rows."""
+    where = "WHERE day = ?" if day else ""
+    params: Tuple[Any, ...] = (day,) if day else ()
+    rows = conn.execute(
+        f"""
+        SELECT day, tool, SUM(count), SUM(tokens_in), SUM(tokens_out), SUM(cost_usd), MAX(last_used)
+        FROM (
+            SELECT day, tool, count, tokens_in, tokens_out, cost_usd, last_used FROM usage_daily {where}
+            UNION ALL
+            SELECT day, tool, count, tokens_in, tokens_out, cost_usd, timestamp FROM usage_events {where}
+        )
+        GROUP BY day, tool
+        """,
+        params + params,
+    ).fetchall()
+
+    payload: Dict[str, Any] = {}
+    for row_day, tool, count, tokens_in, tokens_out, cost_usd, last_used in rows:
+        payload.setdefault(row_day, {})[tool] = {
+            "count": int(count or 0),
+            "events": [],
+            "tokens_in": int(tokens_in or 0),
+            "tokens_out": int(tokens_out or 0),
+            "cost_usd": round(float(cost_usd or 0.0), 6),
+            "last_used": last_used,
+        }
+
+    models = conn.execute(
+        f"""
+        SELECT day, tool, model FROM (
+            SELECT day, tool, model, last_used AS ts FROM usage_daily {where}
+            UNION ALL
+            SELECT day, tool, model, timestamp AS ts FROM usage_events {where}
+        )
+        WHERE model IS NOT NULL
+        ORDER BY ts
+        """,
+        params + params,
+    ).fetchall()
+    for row_day, tool, model in models:
+        payload[row_day][tool]["model"] = model
+
+    events = conn.execute(
+        f"""
+        SELECT day, tool, timestamp, metadata FROM (
+            SELECT day, tool, timestamp, metadata,
+                   ROW_NUMBER() OVER (PARTITION BY day, tool ORDER BY id DESC) AS rank
+            FROM usage_events
+            WHERE metadata IS NOT NULL {"AND day = ?" if day else ""}
+        )
+        WHERE rank <= ?
+        ORDER BY timestamp
+        """,
+        params + (MAX_EVENTS_PER_TOOL,),
+    ).fetchall()
+    for row_day, tool, timestamp, metadata in events:
+        payload[row_day][tool]["events"].append({"timestamp": timestamp, "metadata": json.loads(metadata)})
+    return payload
+
+
+def _load_usage(day: Optional[str] = None) -> Dict[str, Any]:
+    try:
+        with _connect() as conn:
+            return _rollup(conn, day)
+    except sqlite3.Error:
+        return {}
+
+
 def _save_usage(payload: Dict[str, Any]) -> None:
+    """Write the rolled-up snapshot to ``USAGE_FILE`` atomically (read-only export)."""
     USAGE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with USAGE_FILE.open("w", encoding="utf-8") as handle:
+    tmp_path = USAGE_FILE.with_suffix(f".json.{os.getpid()}.{threading.get_ident()}.tmp")
+    with tmp_path.open("w", encoding="utf-8") as handle:
         json.dump(payload, handle, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, USAGE_FILE)
+
+
+def compact_usage(retain_days: int = 7, export_json: bool = True) -> Dict[str, Any]:
+    """
+    Fold events older than ``retain_days`` into daily rows and export the summary.
+
+    Returns the full rolled-up payload (legacy JSON layout).
+    """
+    cutoff = (datetime.utcnow() - timedelta(days=retain_days)).strftime("%Y-%m-%d")
+    with _connect(write=True) as conn:
+        conn.execute(
+            """
+            INSERT INTO usage_daily (day, tool, count, tokens_in, tokens_out, cost_usd, last_used, model)
+            SELECT day, tool, SUM(count), SUM(tokens_in), SUM(tokens_out), SUM(cost_usd), MAX(timestamp),
+                   (SELECT e2.model FROM usage_events e2
+                    WHERE e2.day = e.day AND e2.tool = e.tool AND e2.model IS NOT NULL
+                    ORDER BY e2.id DESC LIMIT 1)
+            FROM usage_events e
+            WHERE day < ?
+            GROUP BY day, tool
+            ON CONFLICT (day, tool) DO UPDATE SET
+                count = usage_daily.count + excluded.count,
+                tokens_in = usage_daily.tokens_in + excluded.tokens_in,
+                tokens_out = usage_daily.tokens_out + excluded.tokens_out,
+                cost_usd = usage_daily.cost_usd + excluded.cost_usd,
+                last_used = MAX(COALESCE(usage_daily.last_used, ''), excluded.last_used),
+                model = COALESCE(excluded.model, usage_daily.model)
+            """,
+            (cutoff,),
+        )
+        conn.execute("DELETE FROM usage_events WHERE day < ?", (cutoff,))
+        payload = _rollup(conn)
+    if export_json:
+        _save_usage(payload)
+    return payload
 
 
 def record_usage(
@@ -75,26 +315,25 @@ def record_usage(
     if not tool:
         return
 
-    payload = _load_usage()
     today = datetime.utcnow().strftime("%Y-%m-%d")
-    tool_record = payload.setdefault(today, {}).setdefault(
-        tool, {"count": 0, "events": [], "tokens_in": 0, "tokens_out": 0, "cost_usd": 0.0}
-    )
-    tool_record["count"] = int(tool_record.get("count", 0)) + max(1, int(count))
-    timestamp = _utc_now_iso()
-    tool_record["last_used"] = timestamp
-    if tokens_in:
-        tool_record["tokens_in"] = int(tool_record.get("tokens_in", 0)) + int(tokens_in)
-    if tokens_out:
-        tool_record["tokens_out"] = int(tool_record.get("tokens_out", 0)) + int(tokens_out)
-    if cost_usd:
-        tool_record["cost_usd"] = round(float(tool_record.get("cost_usd", 0.0)) + float(cost_usd), 6)
-    if model:
-        tool_record["model"] = model
-    if metadata:
-        tool_record["events"].append({"timestamp": timestamp, "metadata": metadata})
-        tool_record["events"] = tool_record["events"][-50:]
-    _save_usage(payload)
+    with _connect(write=True) as conn:
+        conn.execute(
+            """
+            INSERT INTO usage_events (day, tool, timestamp, count, tokens_in, tokens_out, cost_usd, model, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                today,
+                tool,
+                _utc_now_iso(),
+                max(1, int(count)),
+                int(tokens_in or 0),
+                int(tokens_out or 0),
+                float(cost_usd or 0.0),
+                model,
+                json.dumps(metadata, ensure_ascii=False, default=str) if metadata else None,
+            ),
+        )
 
 
 @dataclass
@@ -147,8 +386,8 @@ def get_usage_summary() -> Dict[str, Any]:
     Return today's usage summary for the dashboard/API.
     """
 
-    payload = _load_usage()
     today = datetime.utcnow().strftime("%Y-%m-%d")
+    payload = _load_usage(today)
     day_record = payload.get(today, {})
 
     summary = {}
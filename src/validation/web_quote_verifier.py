@@ -0,0 +1,172 @@
+"""Concurrent web verification of citation quotes with a persistent cache.
+
+Quotes that cannot be found in the source document are searched on the web
+and the top results are scraped to look for the quote verbatim. Searches and
+scrapes run in worker threads so the event loop shared by the agents is never
+blocked. Scrapes are limited per host, and the whole batch is bounded by a
+deadline. Verdicts (quote → verified?) and scraped bodies (URL → text) are
+stored in an ``ArtifactCache``, so re-validating a document needs no network.
+Pages that could not be scraped are not cached and keep the verdict open.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from src.utils.artifact_cache import ArtifactCache
+from tools.web.scrape_url import ScrapeUrlRequest, scrape_url
+from tools.web.web_search_ddg import WebSearchRequest, ddg_text_search
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WEB_VERIFY_CACHE_DIR = Path(os.getenv("ENLITENS_WEB_VERIFY_CACHE_DIR", "cache/web_quote_verification"))
+DEFAULT_DEADLINE_SECONDS = float(os.getenv("ENLITENS_WEB_VERIFY_DEADLINE", "45"))
+DEFAULT_PER_HOST_LIMIT = int(os.getenv("ENLITENS_WEB_VERIFY_PER_HOST", "2"))
+
+MIN_QUOTE_LENGTH = 25
+MAX_CANDIDATES = 3
+RESULTS_PER_QUOTE = 2
+
+VERDICT_NAMESPACE = "quote_verdicts"
+PAGE_NAMESPACE = "scraped_pages"
+_TTL_SECONDS = {
+    VERDICT_NAMESPACE: 30 * 24 * 3600,
+    PAGE_NAMESPACE: 7 * 24 * 3600,
+}
+
+
+class WebQuoteVerifier:
+    """Search-and-scrape verification of quotes, fanned out across threads."""
+
+    def __init__(
+        self,
+        *,
+        search: Callable[[WebSearchRequest], List[Any]] = ddg_text_search,
+        scrape: Callable[[ScrapeUrlRequest], Any] = scrape_url,
+        cache: Optional[ArtifactCache] = None,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+        max_concurrent_searches: int = MAX_CANDIDATES,
+        deadline_seconds: float = DEFAULT_DEADLINE_SECONDS,
+    ) -> None:
+        self.search = search
+        self.scrape = scrape
+        self.cache = cache or ArtifactCache(root=DEFAULT_WEB_VERIFY_CACHE_DIR, ttl_seconds=dict(_TTL_SECONDS))
+        self.per_host_limit = max(1, per_host_limit)
+        self.max_concurrent_searches = max(1, max_concurrent_searches)
+        self.deadline_seconds = deadline_seconds
+
+    async def verify(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the candidates whose quote was found verbatim on the web.
+
+        Quotes whose lookup did not finish before the deadline, hit errors or
+        had a result page that could not be scraped count as unverified for
+        this call and are not cached, so a later run retries them.
+        """
+        eligible: List[Tuple[Dict[str, Any], str]] = []
+        for candidate in candidates[:MAX_CANDIDATES]:
+            quote = (candidate.get("quote") or "").strip()
+            if len(quote) >= MIN_QUOTE_LENGTH:
+                eligible.append((candidate, quote))
+
+        verdicts: Dict[str, bool] = {}
+        pending: List[str] = []
+        for _, quote in eligible:
+            cached = self.cache.get(VERDICT_NAMESPACE, quote)
+            if cached is not None:
+                verdicts[quote] = bool(cached.get("verified"))
+            elif quote not in pending:
+                pending.append(quote)
+
+        if pending:
+            search_slots = asyncio.Semaphore(self.max_concurrent_searches)
+            host_slots: Dict[str, asyncio.Semaphore] = {}
+            tasks = {
+                asyncio.ensure_future(self._verify_quote(quote, search_slots, host_slots)): quote
+                for quote in pending
+            }
+            done, not_done = await asyncio.wait(tasks, timeout=self.deadline_seconds)
+            for task in not_done:
+                task.cancel()
+            if not_done:
+                logger.info(
+                    "Web quote verification hit the %.0fs deadline with %d quote(s) unresolved",
+                    self.deadline_seconds,
+                    len(not_done),
+                )
+            for task in done:
+                quote = tasks[task]
+                try:
+                    verified, definitive = task.result()
+                except Exception as exc:  # pragma: no cover - _verify_quote handles its own errors
+                    logger.debug("Web verification failed for quote: %s", exc)
+                    continue
+                verdicts[quote] = verified
+                if definitive:
+                    self.cache.set(VERDICT_NAMESPACE, {"verified": verified}, quote)
+
+        return [candidate for candidate, quote in eligible if verdicts.get(quote)]
+
+    async def _verify_quote(
+        self,
+        quote: str,
+        search_slots: asyncio.Semaphore,
+        host_slots: Dict[str, asyncio.Semaphore],
+    ) -> Tuple[bool, bool]:
+        """Return ``(verified, definitive)`` for one quote."""
+        request = WebSearchRequest(query=f'"{quote[:120]}"', max_results=RESULTS_PER_QUOTE)
+        try:
+            async with search_slots:
+                results = await asyncio.to_thread(self.search, request)
+        except Exception as exc:
+            logger.debug("Web search failed for citation quote: %s", exc)
+            return False, False
+
+        needle = quote.lower()
+        definitive = True
+        pages = [
+            asyncio.ensure_future(self._page_text(result.url, host_slots))
+            for result in results
+            if getattr(result, "url", None)
+        ]
+        try:
+            for next_page in asyncio.as_completed(pages):
+                try:
+                    body = await next_page
+                except Exception as exc:
+                    logger.debug("Scrape failed while verifying quote: %s", exc)
+                    definitive = False
+                    continue
+                if body is None:
+                    definitive = False
+                    continue
+                if needle in body.lower():
+                    return True, True
+        finally:
+            for page in pages:
+                page.cancel()
+        return False, definitive
+
+    async def _page_text(self, url: str, host_slots: Dict[str, asyncio.Semaphore]) -> Optional[str]:
+        """Return the page's readable text, or ``None`` if it could not be scraped.
+
+        ``scrape_url`` returns ``None`` for rate limits, server errors, robots.txt
+        refusals and pages without readable text alike, so ``None`` is treated as
+        transient: it is neither cached nor taken as proof the quote is absent.
+        """
+        cached = self.cache.get(PAGE_NAMESPACE, url)
+        if cached is not None and cached.get("text"):
+            return cached["text"]
+        host = urlparse(url).netloc.lower()
+        slot = host_slots.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+        async with slot:
+            scraped = await asyncio.to_thread(self.scrape, ScrapeUrlRequest(url=url))
+        text = getattr(scraped, "text", None) if scraped else None
+        if not text:
+            return None
+        self.cache.set(PAGE_NAMESPACE, {"text": text}, url)
+        return text
@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.utils.artifact_cache import ArtifactCache
+
+
+def test_artifact_cache_roundtrip_and_invalidation(tmp_path):
+    cache = ArtifactCache(root=tmp_path)
+    assert cache.get("health_brief", "report", ["p1.json"], "") is None
+
+    cache.set("health_brief", "brief text", "report", ["p1.json"], "")
+    cache.set("voice_guide", "guide", "transcripts")
+    assert cache.get("health_brief", "report", ["p1.json"], "") == "brief text"
+    assert cache.get("health_brief", "report", ["p2.json"], "") is None
+
+    # A fresh instance sees the persisted artifact
+    assert ArtifactCache(root=tmp_path).get("voice_guide", "transcripts") == "guide"
+
+    assert cache.invalidate("health_brief") == 1
+    assert cache.get("health_brief", "report", ["p1.json"], "") is None
+    assert cache.get("voice_guide", "transcripts") == "guide"
+
+
+def test_artifact_cache_expires_entries(tmp_path):
+    cache = ArtifactCache(root=tmp_path, ttl_seconds={"maps_lookup": 0})
+    cache.set("maps_lookup", [{"name": "Clinic"}], "query")
+    assert cache.get("maps_lookup", "query") is None
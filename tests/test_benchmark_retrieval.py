@@ -0,0 +1,34 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+_spec = importlib.util.spec_from_file_location("benchmark_retrieval", ROOT / "scripts/utilities/benchmark_retrieval.py")
+benchmark_retrieval = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(benchmark_retrieval)
+
+
+def _results(p50, throughput=100.0):
+    return {"stages": {"search": {"p50_ms": p50, "p95_ms": p50, "throughput": throughput, "throughput_unit": "queries/s"}}}
+
+
+def test_sub_floor_latency_changes_are_not_regressions():
+    baseline = _results(0.010)
+
+    # +100% but only 0.01ms: timer noise
+    assert benchmark_retrieval.compare_to_baseline(_results(0.020), baseline, 0.15, min_delta_ms=0.05) == []
+    regressions = benchmark_retrieval.compare_to_baseline(_results(0.200), baseline, 0.15, min_delta_ms=0.05)
+    assert [message.split(":")[1].split()[0] for message in regressions] == ["p50_ms", "p95_ms"]
+
+
+def test_stage_metrics_are_medians_of_repeats(monkeypatch):
+    runs = iter([([9.0, 9.0], 2, "queries"), ([0.001, 0.003], 2, "queries"), ([0.002, 0.002], 2, "queries"), ([0.004, 0.004], 2, "queries")])
+    monkeypatch.setattr(benchmark_retrieval, "_run_stage", lambda stage, corpus: next(runs))
+
+    summary = benchmark_retrieval.measure_stage("search", {}, repeats=3, warmup=1)
+
+    assert summary["repeats"] == 3
+    assert summary["p50_ms"] == 2.0  # the 9s warm-up run is discarded
+    assert summary["throughput"] == 500.0
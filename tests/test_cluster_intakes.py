@@ -0,0 +1,79 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from enlitens_client_profiles import cluster_intakes
+from enlitens_client_profiles.cluster_intakes import cluster_member_count, embed_intakes
+
+
+class FakeEncoder:
+    """Deterministic vectors keyed on text length; records what it was asked to encode."""
+
+    encoded = []
+
+    def __init__(self, model_name, device=None):
+        pass
+
+    def encode(self, texts, batch_size=None, show_progress_bar=None, normalize_embeddings=None):
+        FakeEncoder.encoded.extend(texts)
+        return np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+
+@pytest.fixture(autouse=True)
+def fake_encoder(monkeypatch):
+    FakeEncoder.encoded = []
+    monkeypatch.setattr(cluster_intakes, "SentenceTransformer", FakeEncoder)
+
+
+def test_second_run_only_encodes_new_intakes(tmp_path):
+    first = embed_intakes(["a", "bb"], cache_dir=tmp_path)
+    second = embed_intakes(["bb", "ccc", "a"], cache_dir=tmp_path)
+
+    assert FakeEncoder.encoded == ["a", "bb", "ccc"]
+    assert second.tolist() == [first[1].tolist(), [3.0, 1.0], first[0].tolist()]
+    # Superseded vector files are removed once the manifest points elsewhere
+    assert len(list(tmp_path.rglob("embeddings_*.npy"))) == 1
+
+
+def test_crash_before_manifest_swap_keeps_keys_and_vectors_consistent(tmp_path, monkeypatch):
+    embed_intakes(["a", "bb"], cache_dir=tmp_path)
+    real_replace = os.replace
+
+    def crash_on_manifest(src, dst):
+        if str(dst).endswith("keys.json"):
+            raise OSError("disk full")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(cluster_intakes.os, "replace", crash_on_manifest)
+    with pytest.raises(OSError):
+        embed_intakes(["a", "bb", "ccc"], cache_dir=tmp_path)
+    monkeypatch.setattr(cluster_intakes.os, "replace", real_replace)
+
+    FakeEncoder.encoded = []
+    vectors = embed_intakes(["bb", "a"], cache_dir=tmp_path)
+
+    assert FakeEncoder.encoded == []
+    assert vectors.tolist() == [[2.0, 1.0], [1.0, 1.0]]
+
+
+def test_legacy_key_list_layout_is_still_read(tmp_path):
+    model_dir = tmp_path / cluster_intakes._text_key(cluster_intakes.EMBEDDING_MODEL)[:12]
+    model_dir.mkdir()
+    np.save(model_dir / "embeddings.npy", np.array([[9.0, 9.0]], dtype=np.float32))
+    (model_dir / "keys.json").write_text(json.dumps([cluster_intakes._text_key("a")]), encoding="utf-8")
+
+    assert embed_intakes(["a"], cache_dir=tmp_path).tolist() == [[9.0, 9.0]]
+    assert FakeEncoder.encoded == []
+
+
+def test_member_count_reads_full_and_compact_entries():
+    assert cluster_member_count({"all_texts": ["x", "y", "z"]}) == 3
+    assert cluster_member_count({"member_indices": [4, 8]}) == 2
+    assert cluster_member_count({"size": 5, "member_indices": [4, 8]}) == 5
+    assert cluster_member_count({}) == 0
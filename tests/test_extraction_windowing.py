@@ -0,0 +1,99 @@
+import asyncio
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.agents.extraction_team import (
+    NER_MODEL_SPECS,
+    ExtractionTeam,
+    merge_window_entities,
+    split_into_windows,
+)
+
+_NAME = re.compile(r"[A-Z][a-z]+(?: [A-Z][a-z]+)*")
+TEXT = "levels of Ventral Tegmental Area activity rose while the Nucleus Accumbens stayed quiet"
+
+
+class WhitespaceTokenizer:
+    def __call__(self, text, return_offsets_mapping=False, add_special_tokens=True):
+        return {"offset_mapping": [match.span() for match in re.finditer(r"\S+", text)]}
+
+
+class FakeNer:
+    """Reports runs of capitalised words in each window, cut off wherever the window ends."""
+
+    tokenizer = WhitespaceTokenizer()
+
+    def __call__(self, texts, batch_size=None):
+        return [
+            [{"word": m.group(), "entity_group": "Region", "score": 0.9, "start": m.start(), "end": m.end()}
+             for m in _NAME.finditer(text)]
+            for text in texts
+        ]
+
+
+class LoadRecorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.loads = []
+
+    def __call__(self, task, model=None, device=None, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+            self.loads.append(model)
+        return FakeNer()
+
+
+def test_windows_overlap_so_boundary_entities_appear_whole_once():
+    windows = split_into_windows(TEXT, WhitespaceTokenizer(), window_tokens=4, stride_tokens=2)
+
+    assert windows[0][0] == 0 and windows[-1][1] == len(TEXT)
+    assert all(nxt[0] < cur[1] for cur, nxt in zip(windows, windows[1:]))
+    # "Ventral Tegmental Area" straddles the first window edge
+    assert TEXT[windows[0][0]:windows[0][1]].endswith("Ventral Tegmental")
+
+    found = []
+    for (start, end), entities in zip(windows, FakeNer()([TEXT[s:e] for s, e in windows])):
+        found.extend(
+            {"text": e["word"], "label": "Region", "confidence": e["score"], "start": start + e["start"], "end": start + e["end"]}
+            for e in entities
+        )
+    merged = merge_window_entities(found, TEXT)
+
+    assert [entity["text"] for entity in merged] == ["Ventral Tegmental Area", "Nucleus Accumbens"]
+
+
+def test_merge_keeps_longest_overlapping_span_per_label():
+    text = "Nucleus Accumbens"
+    entities = [
+        {"text": "Nucleus", "label": "Region", "confidence": 0.99, "start": 0, "end": 7},
+        {"text": "Nucleus Accumbens", "label": "Region", "confidence": 0.8, "start": 0, "end": 17},
+        {"text": "Accumbens", "label": "Region", "confidence": 0.95, "start": 8, "end": 17},
+        {"text": "Accumbens", "label": "Other", "confidence": 0.5, "start": 8, "end": 17},
+    ]
+
+    merged = merge_window_entities(entities, text)
+
+    assert [(e["label"], e["text"]) for e in merged] == [("Region", "Nucleus Accumbens"), ("Other", "Accumbens")]
+
+
+def test_windowed_extraction_serialises_model_loads():
+    recorder = LoadRecorder()
+    team = ExtractionTeam(pipeline_factory=recorder, ner_mode="windowed", window_tokens=4, stride_tokens=2)
+
+    first = asyncio.run(team._extract_entities_windowed(TEXT))
+    asyncio.run(team._extract_entities_windowed(TEXT))
+
+    assert recorder.peak == 1
+    assert sorted(recorder.loads) == sorted(spec[2] for spec in NER_MODEL_SPECS)
+    assert [e["text"] for e in first["diseases"]] == ["Ventral Tegmental Area", "Nucleus Accumbens"]
@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from enlitens_client_profiles.config import ProfilePipelineConfig
+from enlitens_client_profiles.data_ingestion import IngestionBundle, IntakeRecord, _collect_localities
+from enlitens_client_profiles.gazetteer import Gazetteer
+from enlitens_client_profiles.knowledge_keeper import KnowledgeKeeperAgent
+
+
+def test_scan_reports_whole_word_and_nested_hits():
+    gazetteer = Gazetteer(["St. Louis", "St. Louis County", "Shaw", "Alton"])
+
+    tokens, hits = gazetteer.scan("Moved from St Louis County to Shawnee, near Alton's riverfront.")
+
+    assert tokens[:4] == ["moved", "from", "st", "louis"]
+    assert {hit.label for hit in hits} == {"St. Louis", "St. Louis County", "Alton"}
+    assert [(hit.start, hit.end) for hit in hits if hit.label == "St. Louis County"] == [(2, 5)]
+
+
+def test_localities_feed_the_knowledge_graph(tmp_path):
+    records = [
+        IntakeRecord(raw_text="We live in Florissant and my son's school is in Ferguson.", line_number=1),
+        IntakeRecord(raw_text="Commuting from Shawnee every day; sensory overload at school.", line_number=2),
+    ]
+
+    counts = _collect_localities(records)
+
+    assert counts == {"Ferguson": 1, "Florissant": 1}
+    assert records[0].localities == ["Ferguson", "Florissant"]
+
+    bundle = IngestionBundle(
+        intakes=records,
+        transcripts=[],
+        health_report_markdown="",
+        knowledge_assets=[],
+        locality_counts=counts,
+        intake_sentence_pool=[],
+        founder_voice_snippets=[],
+    )
+    context = KnowledgeKeeperAgent(ProfilePipelineConfig(project_root=tmp_path)).build_graph(bundle)
+
+    assert ("school", 2) in context.top_keywords
+    assert context.graph.has_edge("intake::1", "locality::Florissant")
+    assert context.graph.nodes["locality::Florissant"]["count"] == 1
@@ -0,0 +1,37 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.retrieval.hybrid_retriever import HybridRetriever
+from src.retrieval.vector_store import SearchResult
+
+CHUNKS = [
+    {"chunk_id": "c1", "text": "sensory overload and autistic burnout"},
+    {"chunk_id": "c2", "text": "dopamine and working memory in adhd"},
+    {"chunk_id": "c3", "text": "sleep routines for adolescents"},
+]
+
+
+class DenseStore:
+    """Returns ``SearchResult`` objects like the real vector stores."""
+
+    def search(self, query, limit=50):
+        return [
+            SearchResult(chunk_id="c2", score=0.9, text=CHUNKS[1]["text"], payload=CHUNKS[1]),
+            SearchResult(chunk_id="c3", score=0.5, text=CHUNKS[2]["text"], payload=CHUNKS[2]),
+        ][:limit]
+
+
+def test_fusion_accepts_search_results_and_ranks_by_rrf():
+    retriever = HybridRetriever(DenseStore(), final_k=3, enable_reranker=False)
+    retriever.index_chunks(CHUNKS)
+
+    results = retriever.retrieve("adhd dopamine")
+
+    assert [result["chunk_id"] for result in results] == ["c2", "c3"]
+    # c2 is first in both lists; c3 is dense-only at rank 2
+    assert results[0]["ranks"] == {"dense": 1, "sparse": 1}
+    assert results[0]["score"] == 2 / 61
+    assert results[1]["ranks"] == {"dense": 2}
+    assert results[1]["score"] == 1 / 62
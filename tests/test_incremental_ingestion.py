@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.retrieval.embedding_ingestion import EmbeddingIngestionPipeline
+from src.retrieval.vector_store import BaseVectorStore
+
+
+class RecordingStore(BaseVectorStore):
+    def __init__(self):
+        self.chunks = {}
+        self.embedded = 0
+
+    def upsert(self, chunks):
+        self.embedded += len(chunks)
+        for chunk in chunks:
+            self.chunks[chunk["chunk_id"]] = chunk
+
+    def list_chunk_ids(self, document_id):
+        return {key for key, chunk in self.chunks.items() if chunk["metadata"]["document_id"] == document_id}
+
+    def delete_chunks(self, chunk_ids):
+        for chunk_id in chunk_ids:
+            self.chunks.pop(chunk_id, None)
+
+
+PARAGRAPHS = [f"Paragraph {idx} about sensory processing and executive function." * 3 for idx in range(12)]
+
+
+def test_rerun_on_unchanged_document_embeds_nothing():
+    store = RecordingStore()
+    pipeline = EmbeddingIngestionPipeline(vector_store=store, chunk_size_tokens=60)
+    text = "\n\n".join(PARAGRAPHS)
+    outputs = {"clinical_content": {"summary": "Short clinical summary."}}
+
+    first = pipeline.ingest_document("doc-1", text, outputs, incremental=True)
+    assert first.chunks_embedded == first.chunks_ingested > 1
+
+    second = pipeline.ingest_document("doc-1", "\n\n".join(" ".join(p.split()) for p in PARAGRAPHS), outputs, incremental=True)
+    assert second.chunks_embedded == 0
+    assert second.chunks_unchanged == first.chunks_ingested
+    assert second.chunks_deleted == 0
+
+    edited = "\n\n".join(PARAGRAPHS[:-1] + ["A brand new closing paragraph."])
+    third = pipeline.ingest_document("doc-1", edited, outputs, incremental=True)
+    assert 0 < third.chunks_embedded < third.chunks_ingested
+    assert third.chunks_deleted >= 1
+    assert set(store.chunks) == store.list_chunk_ids("doc-1")
+    assert len(store.chunks) == third.chunks_ingested
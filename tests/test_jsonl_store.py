@@ -0,0 +1,89 @@
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.utils import jsonl_store
+from src.utils.jsonl_store import JsonlLedger, get_ledger
+
+
+def test_ledger_appends_to_mirror_and_indexes_offsets(tmp_path):
+    ledger_path = tmp_path / "kb.jsonl"
+    mirror_path = tmp_path / "kb.jsonl.bak"
+    with JsonlLedger(ledger_path, mirror_path=mirror_path, fsync_interval=60) as ledger:
+        ledger.append({"document_id": "a", "value": 1})
+        offset_b = ledger.append({"document_id": "b", "value": 2})
+        assert ledger.offset_of("b") == offset_b
+        assert ledger.read("b") == {"document_id": "b", "value": 2}
+
+    assert mirror_path.read_bytes() == ledger_path.read_bytes()
+
+    reopened = JsonlLedger(ledger_path, mirror_path=mirror_path)
+    assert "a" in reopened and "b" in reopened and "c" not in reopened
+    assert reopened.read("a")["value"] == 1
+    reopened.close()
+
+
+def test_ledger_repairs_torn_write(tmp_path):
+    ledger_path = tmp_path / "kb.jsonl"
+    with JsonlLedger(ledger_path) as ledger:
+        ledger.append({"document_id": "a"})
+        ledger.append({"document_id": "b"})
+
+    with open(ledger_path, "ab") as handle:
+        handle.write(b'{"document_id": "c", "trunc')
+
+    ledger = JsonlLedger(ledger_path)
+    assert len(ledger) == 2
+    ledger.append({"document_id": "d"})
+    ledger.close()
+
+    lines = ledger_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["document_id"] for line in lines] == ["a", "b", "d"]
+
+
+def test_group_commit_syncs_on_a_timer_without_another_append(tmp_path, monkeypatch):
+    synced = []
+    real_fsync = jsonl_store.os.fsync
+    monkeypatch.setattr(jsonl_store.os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+    ledger = JsonlLedger(tmp_path / "kb.jsonl", fsync_interval=0.1)
+    ledger.append({"document_id": "a"})
+    assert synced == []
+
+    time.sleep(0.3)
+    assert len(synced) == 2  # ledger and index
+    assert not ledger._dirty
+    ledger.close()
+
+
+def test_writers_sharing_a_ledger_record_true_offsets(tmp_path):
+    ledger_path = tmp_path / "kb.jsonl"
+    first = JsonlLedger(ledger_path, fsync_interval=60)
+    second = JsonlLedger(ledger_path, fsync_interval=60)
+    first.append({"document_id": "a", "value": 1})
+    second.append({"document_id": "b", "value": 2})
+    first.append({"document_id": "c", "value": 3})
+
+    assert first.read("b") == {"document_id": "b", "value": 2}
+    assert second.read("a") == {"document_id": "a", "value": 1}
+    assert second.read("c") is None  # appended after second's last write
+    first.close()
+    second.close()
+
+    reopened = JsonlLedger(ledger_path)
+    assert [reopened.read(key)["value"] for key in "abc"] == [1, 2, 3]
+    assert reopened.repair()["truncated_bytes"] == 0
+    reopened.close()
+
+
+def test_shared_ledger_rejects_a_different_sort_keys(tmp_path):
+    ledger_path = tmp_path / "kb.jsonl"
+    ledger = get_ledger(ledger_path, sort_keys=True)
+    assert get_ledger(ledger_path) is ledger
+    with pytest.raises(ValueError):
+        get_ledger(ledger_path, sort_keys=False)
+    ledger.close()
@@ -0,0 +1,123 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.knowledge_base.knowledge_manager import KnowledgeBaseManager
+
+PAPERS = [
+    {
+        "source_metadata": {"title": "Sensory Processing in Autistic Adults", "doi": "10.1/a"},
+        "clinical_content": {"summary": "Sensory overload drives burnout; co-regulation helps."},
+        "research_content": ["Interoception deficits", {"note": "ADHD + autism (AuDHD) overlap"}],
+    },
+    {
+        "source_metadata": {"title": "Executive Function and Dopamine", "doi": "10.1/b"},
+        "clinical_content": {"summary": "Working-memory supports reduce shame."},
+        "marketing_content": ["Your brain isn't broken.", 42],
+    },
+    {
+        "source_metadata": {"title": "Sensory Processing in Autistic Adults", "doi": "10.1/a"},
+        "clinical_content": {"summary": "Duplicate entry about sensory overload."},
+    },
+]
+
+QUERIES = [
+    "sensory", "SENS", "ory over", "overload drives", "co-regulation", "brain isn't",
+    "(audhd)", "dopamine", "memory supports", "nsory proc", "10.1/", "42", "-", "zebra", "",
+]
+
+
+def _manager(tmp_path):
+    manager = KnowledgeBaseManager(
+        knowledge_base_path=str(tmp_path / "kb.json"),
+        processed_files_path=str(tmp_path / "processed.json"),
+    )
+    for idx, paper in enumerate(PAPERS):
+        pdf = tmp_path / f"paper{idx}.pdf"
+        pdf.write_bytes(f"pdf {idx}".encode())
+        assert manager.add_paper_to_knowledge_base(paper, str(pdf))
+    return manager
+
+
+def _hits(results):
+    return {(result["paper_id"], tuple(sorted(result["matches"]))) for result in results}
+
+
+def test_index_matches_substring_scan(tmp_path):
+    manager = _manager(tmp_path)
+    for query in QUERIES:
+        for content_types in (None, ["clinical_content"], ["research_content", "marketing_content"]):
+            expected = manager._scan_knowledge_base(query, content_types)
+            assert _hits(manager.search_knowledge_base(query, content_types)) == _hits(expected), query
+
+
+def test_index_persists_and_follows_deduplication(tmp_path):
+    manager = _manager(tmp_path)
+    manager.deduplicate_content()
+
+    reloaded = KnowledgeBaseManager(
+        knowledge_base_path=str(tmp_path / "kb.json"),
+        processed_files_path=str(tmp_path / "processed.json"),
+    )
+    assert reloaded.index.is_current(reloaded.knowledge_base["papers"], reloaded.knowledge_base["metadata"]["last_updated"])
+    for query in QUERIES:
+        assert _hits(reloaded.search_knowledge_base(query)) == _hits(reloaded._scan_knowledge_base(query))
+
+    phrase_hits = reloaded.search_knowledge_base('"sensory overload"')
+    assert [hit["paper_id"] for hit in phrase_hits] == [1]
+    assert reloaded.search_knowledge_base("overload sensory", phrase=True) == []
+
+
+def _synthetic_papers(count):
+    words = "sensory overload burnout dopamine executive function memory shame autism regulation".split()
+    return [
+        {
+            "id": idx,
+            "file_path": f"paper{idx}.pdf",
+            "data": {
+                f"section_{field}": {"summary": " ".join(words[(idx + field + offset) % len(words)] for offset in range(30))}
+                for field in range(8)
+            },
+        }
+        for idx in range(count)
+    ]
+
+
+def _search_seconds(tmp_path, count):
+    manager = KnowledgeBaseManager(
+        knowledge_base_path=str(tmp_path / f"kb{count}.json"),
+        processed_files_path=str(tmp_path / f"processed{count}.json"),
+    )
+    manager.knowledge_base["papers"] = _synthetic_papers(count)
+    manager.index.rebuild(manager.knowledge_base["papers"])
+    timings = []
+    for _ in range(3):
+        started = time.perf_counter()
+        results = manager.search_knowledge_base("sensory over")
+        timings.append(time.perf_counter() - started)
+    assert len(results) == count
+    return min(timings)
+
+
+def test_search_cost_grows_linearly_with_matching_fields(tmp_path):
+    small = _search_seconds(tmp_path, 500)
+    large = _search_seconds(tmp_path, 2000)
+    # Four times the matching fields; per-candidate work that re-walks the index would be ~16x
+    assert large < small * 8
+
+
+def test_running_length_total_follows_adds_and_removals(tmp_path):
+    manager = _manager(tmp_path)
+    index = manager.index
+    assert index.total_length == sum(index.field_lengths.values())
+
+    manager.deduplicate_content()
+    assert index.total_length == sum(index.field_lengths.values())
+
+    reloaded = KnowledgeBaseManager(
+        knowledge_base_path=str(tmp_path / "kb.json"),
+        processed_files_path=str(tmp_path / "processed.json"),
+    )
+    assert reloaded.index.total_length == index.total_length
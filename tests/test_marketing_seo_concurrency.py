@@ -0,0 +1,64 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.agents.marketing_seo_agent import MarketingSEOAgent
+from src.models.enlitens_schemas import MarketingContent, SEOContent
+
+
+class SlowClient:
+    def __init__(self, fail_models=(), empty_models=()):
+        self.fail_models = set(fail_models)
+        self.empty_models = set(empty_models)
+        self.prompts = []
+
+    def clone_with_model(self, model):
+        return self
+
+    async def generate_structured_response(self, prompt, response_model, **kwargs):
+        self.prompts.append(prompt)
+        await asyncio.sleep(0.2)
+        if response_model in self.fail_models:
+            raise RuntimeError("backend unavailable")
+        if response_model in self.empty_models:
+            # generate_structured_response returns None after exhausting its retries
+            return None
+        if response_model is MarketingContent:
+            return MarketingContent(headlines=["Your brain is not broken"])
+        return SEOContent(primary_keywords=["adhd therapy st louis"])
+
+
+def _run(client):
+    agent = MarketingSEOAgent()
+    agent.ollama_client = client
+    return asyncio.run(agent.process({"document_id": "doc-1", "final_context": {}}))
+
+
+def test_marketing_and_seo_run_concurrently():
+    result = _run(SlowClient())
+
+    assert result["marketing_content"]["headlines"] == ["Your brain is not broken"]
+    assert result["seo_content"]["primary_keywords"] == ["adhd therapy st louis"]
+    timings = result["generation_timings"]
+    assert timings["total"] < timings["marketing"] + timings["seo"] - 0.1
+    assert result["generation_quality"] == "high"
+
+
+def test_one_failure_does_not_discard_the_other():
+    result = _run(SlowClient(fail_models={MarketingContent}))
+
+    assert result["marketing_content"] == MarketingContent().model_dump()
+    assert result["seo_content"]["primary_keywords"] == ["adhd therapy st louis"]
+    assert result["generation_quality"] == "partial"
+
+
+def test_empty_results_count_as_failures():
+    result = _run(SlowClient(empty_models={SEOContent}))
+
+    assert result["seo_content"] == SEOContent().model_dump()
+    assert result["generation_quality"] == "partial"
+
+    result = _run(SlowClient(fail_models={MarketingContent}, empty_models={SEOContent}))
+    assert result["generation_quality"] == "low"
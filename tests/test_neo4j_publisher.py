@@ -0,0 +1,87 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.graph.neo4j_publisher import Neo4jPublisher
+
+
+class RecordingDriver:
+    def __init__(self):
+        self.transactions = []
+        self.closed_sessions = 0
+
+    def session(self):
+        return RecordingSession(self)
+
+    def close(self):
+        pass
+
+
+class RecordingSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def execute_write(self, work, **kwargs):
+        tx = RecordingTx()
+        if any(row["title"] == "poison" for row in kwargs["documents"]):
+            raise RuntimeError("Neo4j rejected the batch")
+        result = work(tx, **kwargs)
+        self.driver.transactions.append(tx.queries)
+        return result
+
+    def close(self):
+        self.driver.closed_sessions += 1
+
+
+class RecordingTx:
+    def __init__(self):
+        self.queries = []
+
+    def run(self, query, **params):
+        self.queries.append((query, params))
+
+
+def _record(idx, tags=20, citations=40):
+    return {
+        "document_id": f"doc-{idx}",
+        "metadata": {"title": f"Doc {idx}", "tags": [f"tag-{n}" for n in range(tags)]},
+        "extraction": {"citations": [f"10.1000/{idx}.{n}" for n in range(citations)]},
+    }
+
+
+def test_single_document_uses_one_transaction_with_unwind_statements():
+    driver = RecordingDriver()
+    Neo4jPublisher(driver=driver).publish_document(_record(1))
+
+    assert len(driver.transactions) == 1
+    queries = driver.transactions[0]
+    assert len(queries) == 3
+    assert all("UNWIND $rows" in query for query, _ in queries)
+    assert [len(params["rows"]) for _, params in queries] == [1, 20, 40]
+
+
+def test_many_documents_are_grouped_by_batch_size():
+    driver = RecordingDriver()
+    publisher = Neo4jPublisher(driver=driver, batch_size=4)
+
+    committed = publisher.publish_documents(_record(idx, tags=2, citations=0) for idx in range(10))
+
+    assert committed == 3
+    assert [len(tx) for tx in driver.transactions] == [2, 2, 2]
+    assert [len(tx[0][1]["rows"]) for tx in driver.transactions] == [4, 4, 2]
+    assert driver.closed_sessions == 1
+
+
+def test_bad_records_do_not_sink_their_batch():
+    driver = RecordingDriver()
+    publisher = Neo4jPublisher(driver=driver, batch_size=4)
+    records = [_record(idx, tags=1, citations=0) for idx in range(4)]
+    records[1]["metadata"]["title"] = "poison"
+    records.insert(2, {"metadata": {"title": "no id"}})
+
+    committed = publisher.publish_documents(records)
+
+    assert committed == 3
+    published = [tx[0][1]["rows"][0]["document_id"] for tx in driver.transactions]
+    assert published == ["doc-0", "doc-2", "doc-3"]
@@ -0,0 +1,86 @@
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.agents.node_checkpoints import NodeCheckpointStore, document_checksum
+
+
+def test_checkpoint_round_trip_and_node_invalidation(tmp_path):
+    store = NodeCheckpointStore(root=tmp_path)
+    checksum = document_checksum("full paper text")
+    delta = {
+        "stage": "clinical_synthesis_completed",
+        "clinical_result": {"summary": "ok"},
+        "skip_nodes": {"context_rag"},
+        "end_timestamp": datetime(2025, 1, 2, 3, 4, 5),
+        "completed_nodes": {"clinical_synthesis": "done"},
+    }
+    store.save(checksum, "clinical_synthesis", "v1", delta)
+    store.save(checksum, "founder_voice", "v1", {"stage": "founder_voice_completed"})
+
+    assert store.load(checksum, "clinical_synthesis", "v1") == delta
+    assert store.load(checksum, "clinical_synthesis", "v2") is None
+
+    assert store.invalidate(["clinical_synthesis"]) == 1
+    assert store.load(checksum, "clinical_synthesis", "v1") is None
+    assert store.load(checksum, "founder_voice", "v1") == {"stage": "founder_voice_completed"}
+
+
+class StubAgent:
+    model = "stub"
+
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+        self.fail = False
+        self.received = None
+
+    async def execute(self, context):
+        if self.fail:
+            raise RuntimeError("worker crashed")
+        self.calls[self.name] = self.calls.get(self.name, 0) + 1
+        self.received = context
+        return {self.name: f"{self.name}-run{self.calls[self.name]}"}
+
+
+def _supervisor(tmp_path, calls):
+    from src.agents.supervisor_agent import SupervisorAgent
+
+    supervisor = SupervisorAgent(checkpoint_store=NodeCheckpointStore(root=tmp_path))
+    supervisor.agents = {
+        name: StubAgent(name, calls) for name in SupervisorAgent.GRAPH_NODES if name != "entry"
+    }
+    supervisor.retry_policy["max_attempts"] = 1
+    supervisor.workflow_graph = supervisor._build_graph()
+    return supervisor
+
+
+def test_resume_replays_only_own_outputs_and_respects_upstream_changes(tmp_path):
+    calls = {}
+    payload = {"document_id": "doc-1", "document_text": "full paper text"}
+    supervisor = _supervisor(tmp_path, calls)
+    supervisor.agents["validation"].fail = True
+    with pytest.raises(RuntimeError):
+        asyncio.run(supervisor.process_document(payload))
+
+    # Resume after a prompt change to clinical synthesis, without clearing dependents
+    resumed = _supervisor(tmp_path, calls)
+    resumed.node_versions["clinical_synthesis"] = "v2"
+    asyncio.run(resumed.process_document(payload))
+
+    assert calls["science_extraction"] == 1
+    assert calls["clinical_synthesis"] == 2
+    assert calls["founder_voice"] == 2
+    assert calls["validation"] == 1
+    complete_output = resumed.agents["validation"].received["complete_output"]
+    assert complete_output["clinical_synthesis"] == "clinical_synthesis-run2"
+    assert complete_output["marketing_seo"] == "marketing_seo-run2"
+
+    # A completed run leaves nothing to replay
+    asyncio.run(_supervisor(tmp_path, calls).process_document(payload))
+    assert calls["science_extraction"] == 2
@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from enlitens_client_profiles import matching
+from enlitens_client_profiles.matching import PersonaMatcher, match_personas
+from enlitens_client_profiles.similarity import SimilarityIndex
+
+TOPICS = ["sensory", "burnout", "adhd", "sleep"]
+
+
+class FakePersona:
+    def __init__(self, name, tags):
+        self.meta = SimpleNamespace(persona_name=name)
+        self.name = name
+        self.tags = tags
+
+    def attribute_set(self):
+        return self.tags
+
+
+def _one_hot(text):
+    vector = np.full(len(TOPICS), 0.01, dtype=np.float32)
+    for position, topic in enumerate(TOPICS):
+        if topic in text:
+            vector[position] = 1.0
+    return vector / np.linalg.norm(vector)
+
+
+def _fake_embeddings(monkeypatch):
+    encoded = []
+    monkeypatch.setattr(matching, "build_corpus", lambda persona: persona.name)
+
+    def embed_many(cls, texts):
+        encoded.extend(texts)
+        return np.vstack([_one_hot(text) for text in texts])
+
+    monkeypatch.setattr(SimilarityIndex, "_embed_many", classmethod(embed_many))
+    PersonaMatcher.clear_cache()
+    return encoded
+
+
+def test_vector_cache_is_bounded_lru(monkeypatch):
+    encoded = _fake_embeddings(monkeypatch)
+    monkeypatch.setattr(matching, "VECTOR_CACHE_SIZE", 3)
+    personas = [FakePersona(f"{topic} persona", []) for topic in TOPICS]
+
+    PersonaMatcher(personas[:3])
+    PersonaMatcher(personas[:1])  # refresh "sensory" so "burnout" is the oldest
+    PersonaMatcher(personas[3:])
+
+    assert len(PersonaMatcher._vector_cache) == 3
+    encoded.clear()
+    PersonaMatcher(personas)
+    assert encoded == ["burnout persona"]
+
+
+def test_match_personas_reuses_the_matcher(monkeypatch):
+    encoded = _fake_embeddings(monkeypatch)
+    personas = [
+        FakePersona("sensory persona", ["sensory"]),
+        FakePersona("adhd persona", ["adhd"]),
+        FakePersona("sleep persona", []),
+    ]
+
+    first = match_personas(personas, narrative_text="adhd at work", attribute_tags=["adhd"], top_k=2)
+    built = matching._MATCHERS[tuple(id(persona) for persona in personas)]
+    second = match_personas(personas, narrative_text="sensory overload", attribute_tags=[], top_k=1)
+
+    assert [persona.name for persona, _ in first] == ["adhd persona", "sensory persona"]
+    assert first[0][1] > 0.95
+    assert [persona.name for persona, _ in second] == ["sensory persona"]
+    assert matching._MATCHERS[tuple(id(persona) for persona in personas)] is built
+    # Personas were embedded once; later calls only embed the narratives
+    assert encoded.count("adhd persona") == 1
+    assert len(matching._MATCHERS) == 1
@@ -0,0 +1,129 @@
+import hashlib
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.persistence.postgres_store import PostgresStore, section_checksum
+
+
+class FakeDatabase:
+    """Logs statements and COPY payloads; answers the checksum lookup from memory."""
+
+    def __init__(self):
+        self.checksums = {}
+        self.statements = []
+        self.copies = []
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        self.db.statements.append(sql)
+        self._rows = []
+        if "SELECT document_id, sections_sha256" in sql:
+            self._rows = [(doc_id, self.db.checksums[doc_id]) for doc_id in params[0] if doc_id in self.db.checksums]
+
+    def copy_expert(self, sql, stream):
+        self.db.statements.append(sql)
+        self.db.copies.append((sql, stream.read()))
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    closed = 0
+    autocommit = True
+
+    def __init__(self, db):
+        self.db = db
+
+    def set_isolation_level(self, level):
+        pass
+
+    def cursor(self):
+        return FakeCursor(self.db)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class CountingEmbeddings:
+    dimension = 4
+
+    def __init__(self):
+        self.texts = []
+
+    def embed(self, texts):
+        self.texts.extend(texts)
+        return [[0.5] * self.dimension for _ in texts]
+
+
+def _record(idx, findings="Findings"):
+    return {
+        "document_id": f"doc-{idx}",
+        "metadata": {"title": f"Doc {idx}", "processed_at": "2025-01-01T00:00:00Z"},
+        "extraction": {"findings": f"{findings} {idx}.", "limitations": f"Limitations {idx}."},
+    }
+
+
+def _store(monkeypatch, db, embeddings):
+    monkeypatch.setenv("ENLITENS_ENABLE_POSTGRES", "1")
+    store = PostgresStore(embedding_provider=embeddings, connection_factory=lambda: FakeConnection(db))
+    assert store.available
+    return store
+
+
+def test_statements_per_batch_do_not_grow_with_documents(monkeypatch):
+    counts = []
+    for documents in (2, 20):
+        db = FakeDatabase()
+        store = _store(monkeypatch, db, CountingEmbeddings())
+        db.statements.clear()
+        store.upsert_records([_record(idx) for idx in range(documents)])
+        counts.append(len(db.statements))
+
+    assert counts[0] == counts[1]
+    # Document embeddings travel in the binary COPY, not as SQL literals
+    assert not any("[0.5" in sql for sql in db.statements)
+    document_copy = next(data for sql, data in db.copies if "documents_stage" in sql)
+    assert document_copy.count(b"\x00\x04\x00\x00" + b"\x3f\x00\x00\x00" * 4) == 20
+
+
+def test_unchanged_documents_are_not_re_embedded(monkeypatch):
+    db = FakeDatabase()
+    embeddings = CountingEmbeddings()
+    store = _store(monkeypatch, db, embeddings)
+    records = [_record(idx) for idx in range(3)]
+    for payload in map(store._build_payload, records):
+        db.checksums[payload.document_id] = section_checksum(payload.section_payloads)
+    records[1] = _record(1, findings="Revised findings")
+    db.statements.clear()
+
+    stats = store.upsert_records(records)
+
+    assert stats["documents_skipped_sections"] == 2
+    # Only doc-1 is embedded: its document text and its two sections
+    assert embeddings.texts == ["Revised findings 1.", "Revised findings 1.", "Limitations 1."]
+    assert sum("DELETE FROM sections" in sql for sql in db.statements) == 1
+
+
+def test_single_record_upsert_fills_section_checksums(monkeypatch):
+    db = FakeDatabase()
+    store = _store(monkeypatch, db, CountingEmbeddings())
+
+    store.upsert_record(_record(7))
+
+    section_copy = next(data for sql, data in db.copies if sql.startswith("COPY sections"))
+    for content in ("Findings 7.", "Limitations 7."):
+        assert hashlib.sha256(content.encode("utf-8")).hexdigest().encode() in section_copy
@@ -0,0 +1,51 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.agents.persona_index import HashedBagOfWordsEncoder, PersonaIndex
+from src.agents.profile_matcher_agent import ProfileMatcherAgent
+
+PERSONAS = {
+    "persona_sensory.json": "sensory overload at school and noise sensitivity",
+    "persona_burnout.json": "autistic burnout after years of masking at work",
+    "persona_adhd.json": "late adhd diagnosis and executive function struggles",
+}
+
+
+class PickingClient:
+    def __init__(self, picks):
+        self.picks = picks
+
+    async def generate_response(self, prompt, **kwargs):
+        return {"response": json.dumps({"selected_persona_ids": self.picks})}
+
+
+def _matcher(tmp_path):
+    personas_dir = tmp_path / "profiles"
+    personas_dir.mkdir()
+    for name, text in PERSONAS.items():
+        (personas_dir / name).write_text(json.dumps({"meta": {"summary": text}}), encoding="utf-8")
+    matcher = ProfileMatcherAgent(personas_dir=str(personas_dir), shortlist_size=2, use_index=False)
+    matcher.persona_index = PersonaIndex(personas_dir, index_dir=tmp_path / "index", encoder=HashedBagOfWordsEncoder())
+    return matcher
+
+
+def test_prerank_shortlists_without_mutating_the_index(tmp_path):
+    matcher = _matcher(tmp_path)
+
+    selected = asyncio.run(
+        matcher.select_top_personas(
+            "Masking and autistic burnout at work", {}, PickingClient(["persona_burnout.json"]), top_k=2
+        )
+    )
+
+    assert [Path(persona["_file"]).name for persona in selected] == ["persona_burnout.json", "persona_sensory.json"]
+    selection = selected[0]["meta"]["selection_meta"]
+    assert selection["llm_selected"] is True and selection["prerank_score"] > 0
+    assert "fallback_score" in selected[1]["meta"]["selection_meta"]
+    # The resident catalog stays clean for the next paper
+    for persona in matcher.persona_index.personas():
+        assert "selection_meta" not in persona["meta"]
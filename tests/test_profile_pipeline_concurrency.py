@@ -0,0 +1,158 @@
+import itertools
+import json
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from enlitens_client_profiles import profile_pipeline
+from enlitens_client_profiles.config import ProfilePipelineConfig
+from enlitens_client_profiles.deep_research import DeepResearchAgent, ResearchCache
+from enlitens_client_profiles.similarity import SimilarityReport
+
+THEMES = ["sensory overwhelm", "late diagnosis", "sensory overwhelm", "burnout recovery"]
+
+
+class FakeDocument:
+    def __init__(self, profile_id, theme):
+        self.meta = SimpleNamespace(profile_id=profile_id)
+        self.theme = theme
+
+    def model_dump_json(self, indent=None):
+        return json.dumps({"profile_id": self.meta.profile_id, "theme": self.theme})
+
+
+class Workers:
+    """Shared state for every forked orchestrator."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counter = itertools.count()
+        self.active = 0
+        self.peak = 0
+
+
+class FakeOrchestrator:
+    workers = None
+
+    def __init__(self, config=None):
+        self.state = FakeOrchestrator.workers
+
+    def prepare_context(self, bundle):
+        return SimpleNamespace(top_keywords=[], site_documents=[], brand_mentions=[])
+
+    def fork(self):
+        return FakeOrchestrator()
+
+    def assemble_persona(self, bundle):
+        with self.state.lock:
+            index = next(self.state.counter)
+            self.state.active += 1
+            self.state.peak = max(self.state.peak, self.state.active)
+        time.sleep(0.2)
+        with self.state.lock:
+            self.state.active -= 1
+        context = self.prepare_context(bundle)
+        return (
+            FakeDocument(f"persona-{index}", THEMES[index]),
+            context,
+            SimpleNamespace(gaps=[]),
+            SimpleNamespace(queries=[]),
+        )
+
+
+class FakeIndex:
+    """Flags personas sharing a theme with a registered one; checks calls never overlap."""
+
+    def __init__(self, path):
+        self.themes = {}
+        self.busy = False
+        self.overlaps = 0
+
+    def _enter(self):
+        if self.busy:
+            self.overlaps += 1
+        self.busy = True
+        time.sleep(0.01)
+        self.busy = False
+
+    def register_existing_if_needed(self, documents):
+        pass
+
+    def evaluate(self, document):
+        self._enter()
+        for profile_id, theme in self.themes.items():
+            if theme == document.theme:
+                return SimilarityReport(profile_id=profile_id, cosine=0.9, jaccard=0.5)
+        return SimilarityReport(profile_id=None, cosine=0.0, jaccard=0.0)
+
+    def register(self, document):
+        self._enter()
+        self.themes[document.meta.profile_id] = document.theme
+
+    def flush(self):
+        pass
+
+
+class Telemetry:
+    def __init__(self):
+        self.events = []
+
+    def log_event(self, event, payload):
+        self.events.append(event)
+
+    def log_profile_created(self, document):
+        self.events.append("profile_created")
+
+
+def test_concurrent_generation_still_catches_parallel_near_duplicates(tmp_path, monkeypatch):
+    FakeOrchestrator.workers = Workers()
+    indexes = []
+    monkeypatch.setattr(profile_pipeline, "load_ingestion_bundle", lambda config: SimpleNamespace(analytics=None))
+    monkeypatch.setattr(profile_pipeline, "PersonaOrchestrator", FakeOrchestrator)
+    monkeypatch.setattr(profile_pipeline, "SimilarityIndex", lambda path: indexes.append(FakeIndex(path)) or indexes[-1])
+    config = ProfilePipelineConfig(project_root=tmp_path)
+    telemetry = Telemetry()
+
+    started = time.perf_counter()
+    result = profile_pipeline.run_profile_pipeline(
+        config, desired_profiles=4, telemetry=telemetry, concurrency=4
+    )
+    elapsed = time.perf_counter() - started
+
+    # Four 0.2s assemblies one after another would take ~0.8s
+    assert FakeOrchestrator.workers.peak == 4
+    assert elapsed < 0.6
+    assert indexes[0].overlaps == 0
+    assert sorted(document.theme for document in result.generated) == [
+        "burnout recovery",
+        "late diagnosis",
+        "sensory overwhelm",
+    ]
+    assert telemetry.events.count("profile_similarity_flagged") == 1
+
+    manifest = json.loads(result.manifest_path.read_text(encoding="utf-8"))
+    assert manifest == sorted(document.meta.profile_id for document in result.generated)
+    for profile_id in manifest:
+        assert (config.output_dir / f"{profile_id}.json").exists()
+    assert not list(config.output_dir.glob("*.tmp"))
+
+
+def test_parallel_research_caches_do_not_overwrite_each_other(tmp_path):
+    agent = DeepResearchAgent(ProfilePipelineConfig(project_root=tmp_path))
+    generated_at = datetime(2025, 1, 1, 12, 0, 0)
+    caches = [ResearchCache(generated_at=generated_at, notes=[f"worker {idx}"]) for idx in range(2)]
+
+    threads = [threading.Thread(target=agent._persist, args=(cache,)) for cache in caches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    written = sorted(agent.output_dir.glob("research_20250101_120000_*.json"))
+    assert len(written) == 2
+    assert sorted(json.loads(path.read_text(encoding="utf-8"))["notes"][0] for path in written) == ["worker 0", "worker 1"]
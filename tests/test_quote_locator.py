@@ -0,0 +1,49 @@
+import difflib
+import random
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.utils.quote_locator import QuoteLocator
+
+WORDS = (
+    "sensory processing differences were associated with anxiety in autistic adults while "
+    "executive function scores predicted burnout across the cohort of participants"
+).split()
+
+
+def _paper(sentences=400, seed=5):
+    rng = random.Random(seed)
+    return ". ".join(
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(10, 20))).capitalize() for _ in range(sentences)
+    )
+
+
+def test_exact_and_fuzzy_positions():
+    source = _paper()
+    locator = QuoteLocator(source)
+    sentence = source.split(". ")[123]
+    quote = sentence[7:-5]
+
+    exact = locator.locate(quote)
+    assert exact.exact and source[exact.start: exact.end] == quote
+
+    altered = quote.replace(quote.split()[3], "XYZ", 1).upper()
+    fuzzy = locator.locate(altered)
+    assert not fuzzy.exact and fuzzy.score >= 0.8
+    assert abs(fuzzy.start - exact.start) < 25
+
+
+def test_sentence_check_agrees_with_get_close_matches():
+    source = _paper()
+    sentences = source.split(". ")
+    locator = QuoteLocator(source)
+    rng = random.Random(11)
+    for sentence in rng.sample(sentences, 25):
+        words = sentence.split()
+        words[rng.randrange(len(words))] = rng.choice(["markedly", "n=42", "however"])
+        quote = " ".join(words)
+        expected = bool(difflib.get_close_matches(quote, sentences, n=1, cutoff=0.8))
+        assert (locator.close_sentence(quote, 0.8) is not None) == expected
+    assert not locator.contains("Completely unrelated statement about gardening tools")
@@ -0,0 +1,104 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+from pydantic import BaseModel, ConfigDict
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.models.enlitens_schemas import ResearchContent
+from src.synthesis.ollama_client import VLLMClient
+from src.synthesis.schema_stream_guard import StreamingSchemaGuard
+
+VALID = json.dumps({"findings": ["Finding A"], "statistics": ["n = 40"], "methodologies": []})
+PROSE = "Sure! Here is a thorough summary of the paper before the JSON you asked for. " * 40
+
+
+class StrictFindings(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    findings: list[str]
+
+
+def _feed(text, model=ResearchContent):
+    return StreamingSchemaGuard(model).feed(text)
+
+
+def test_guard_reports_unrecoverable_output():
+    assert "text before" in _feed("Here is the JSON: {")
+    assert "expects array" in _feed('{"findings": "a single string"')
+    assert "unknown top-level key" in _feed('{"findings": ["a"], "summary": "b"', StrictFindings)
+    assert "expects array" in _feed('{"findings": null', StrictFindings)
+
+
+def test_guard_accepts_recoverable_output():
+    assert _feed("```json\n" + VALID) is None
+    assert _feed('{"result": {"findings": ["a"]}}') is None  # wrapper, unwrapped later
+    assert _feed('[{"findings": ["a"]}]') is None
+    assert _feed('{"findings": ["x, \\"y\\"}"], "statistics": []}') is None
+
+
+def test_guard_accepts_what_the_model_would_validate():
+    # extra="ignore" (the pydantic default) drops unknown keys
+    payload = '{"findings": ["a"], "notes": "x"}'
+    assert _feed(payload) is None
+    assert ResearchContent.model_validate_json(payload).findings == ["a"]
+    # citations has a mode="before" validator that turns null into []
+    payload = '{"citations": null, "findings": ["a"]}'
+    assert _feed(payload) is None
+    assert ResearchContent.model_validate_json(payload).citations == []
+    # fields with defaults may arrive as null
+    assert _feed('{"statistics": null, "findings": ["a"]}') is None
+
+
+class StreamingServer:
+    """Streams one token per SSE event; the first completion drifts into prose."""
+
+    def __init__(self):
+        self.requests = []
+        self.events_sent = []
+
+    def __call__(self, request):
+        if request.url.path.endswith("/models"):
+            return httpx.Response(200, json={"data": [{"id": "fake", "max_model_len": 65536}]})
+        payload = json.loads(request.content)
+        self.requests.append(payload)
+        assert payload["stream"] is True
+        text = PROSE + VALID if len(self.requests) == 1 else VALID
+        tokens = [text[idx: idx + 4] for idx in range(0, len(text), 4)]
+        slot = len(self.events_sent)
+        self.events_sent.append(0)
+
+        async def events():
+            for token in tokens:
+                self.events_sent[slot] += 1
+                chunk = {"choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]}
+                yield f"data: {json.dumps(chunk)}\n\n".encode()
+            done = {"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+            yield f"data: {json.dumps(done)}\n\ndata: [DONE]\n\n".encode()
+
+        return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=events())
+
+
+def test_off_schema_stream_is_cancelled_and_retried():
+    server = StreamingServer()
+    client = VLLMClient(
+        base_url="http://fake/v1",
+        default_model="fake",
+        enable_prefix_caching=False,
+        enable_stream_guard=True,
+        transport=httpx.MockTransport(server),
+    )
+
+    result = asyncio.run(
+        client.generate_structured_response("PROMPT", ResearchContent, base_num_predict=4000, use_cot_prompt=False)
+    )
+
+    assert result.findings == ["Finding A"]
+    assert len(server.requests) == 2
+    # The first stream was dropped after its first token instead of running to the end
+    assert server.events_sent[0] <= 2
+    assert client.stream_guard_stats["aborts"] == 1
+    assert client.stream_guard_stats["tokens_saved"] > 3900
@@ -0,0 +1,89 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.agents.enhanced_complete_enlitens_agent import EnhancedCompleteEnlitensAgent
+from src.models.enlitens_schemas import BlogContent, ResearchContent, SEOContent
+
+
+class CountingClient:
+    """Stub LLM client that tracks how many generations are in flight at once."""
+
+    def __init__(self, fail_models=()):
+        self.fail_models = set(fail_models)
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        self.response_models = []
+
+    def clone_with_model(self, model):
+        return self
+
+    async def _enter(self):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.05)
+        self.active -= 1
+
+    async def generate_text(self, prompt, **kwargs):
+        await self._enter()
+        return "- Your brain is not broken"
+
+    async def generate_structured_response(self, prompt, response_model, **kwargs):
+        self.response_models.append(response_model)
+        await self._enter()
+        if response_model in self.fail_models:
+            raise RuntimeError("backend unavailable")
+        if response_model is SEOContent:
+            return SEOContent(primary_keywords=["adhd therapy st louis"])
+        return response_model()
+
+
+def _agent(client, limit):
+    agent = EnhancedCompleteEnlitensAgent(max_concurrent_generations=limit)
+    agent.ollama_client = client
+    return agent
+
+
+def test_generations_in_flight_never_exceed_the_limit():
+    client = CountingClient()
+    agent = _agent(client, limit=3)
+
+    sections = asyncio.run(agent._generate_sections("paper text", {}))
+
+    assert client.peak == 3
+    assert list(sections) == [name for name, _, _ in agent._content_sections()]
+    assert sections["seo_content"].primary_keywords == ["adhd therapy st louis"]
+    assert set(agent.last_section_timings) == set(sections)
+
+
+def test_failing_sections_fall_back_without_affecting_the_rest():
+    client = CountingClient(fail_models={BlogContent})
+    agent = _agent(client, limit=4)
+
+    async def broken_extractor(text, content_insights):
+        raise ValueError("unparseable section")
+
+    agent._extract_research_content = broken_extractor
+    sections = asyncio.run(agent._generate_sections("paper text", {}))
+
+    assert sections["blog_content"] == BlogContent()
+    assert sections["research_content"] == ResearchContent()
+    assert sections["seo_content"].primary_keywords == ["adhd therapy st louis"]
+    assert len(sections) == len(agent._content_sections())
+
+
+def test_every_section_prompt_builds_and_reaches_the_client():
+    # Extractors are called directly so a prompt that fails to format raises here
+    # instead of being absorbed by the fan-out's empty-model fallback
+    for name, extractor, fallback_model in EnhancedCompleteEnlitensAgent()._content_sections():
+        client = CountingClient()
+        agent = _agent(client, limit=1)
+        bound = getattr(agent, extractor.__name__)
+
+        asyncio.run(bound("paper text with {braces}", {"themes": ["sensory"]}))
+
+        assert fallback_model in client.response_models, name
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.agents.science_extraction_agent import ScienceExtractionAgent
+from src.synthesis.ollama_client import VLLMClient
+
+VALID = {
+    "findings": ["Finding A"],
+    "statistics": ["n = 40"],
+    "methodologies": ["Cohort study"],
+    "limitations": [],
+    "future_directions": [],
+    "implications": [],
+    "citations": [],
+    "references": [],
+}
+
+
+class FakeCompletionsServer:
+    """Stands in for an OpenAI-compatible server and records chat requests."""
+
+    def __init__(self, reject_n=False, broken_choices=()):
+        self.requests = []
+        self.reject_n = reject_n
+        self.broken_choices = set(broken_choices)
+
+    def __call__(self, request):
+        if request.url.path.endswith("/models"):
+            return httpx.Response(200, json={"data": [{"id": "fake", "max_model_len": 65536}]})
+        payload = json.loads(request.content)
+        self.requests.append(payload)
+        n = payload.get("n", 1)
+        if self.reject_n and n > 1:
+            return httpx.Response(400, json={"message": "n is not supported"})
+        choices = []
+        for index in range(n):
+            broken = len(self.requests) == 1 and index in self.broken_choices
+            choices.append(
+                {
+                    "index": index,
+                    "message": {"role": "assistant", "content": "{not json" if broken else json.dumps(VALID)},
+                    "finish_reason": "stop",
+                }
+            )
+        return httpx.Response(200, json={"choices": choices})
+
+    def prompt_sends(self, prompt):
+        return sum(1 for payload in self.requests if payload["messages"][-1]["content"] == prompt)
+
+
+def _agent(server):
+    agent = ScienceExtractionAgent()
+    agent.ollama_client = VLLMClient(
+        base_url="http://fake/v1",
+        default_model="fake",
+        enable_prefix_caching=False,
+        transport=httpx.MockTransport(server),
+    )
+    return agent
+
+
+def test_samples_share_one_request():
+    server = FakeCompletionsServer()
+    agent = _agent(server)
+
+    samples = asyncio.run(agent._run_self_consistency_sampling("PROMPT", temperatures=[0.1, 0.2, 0.3]))
+
+    assert len(samples) == 3
+    assert server.prompt_sends("PROMPT") == 1
+    assert server.requests[0]["n"] == 3
+    aggregated, stats = agent._aggregate_samples(samples)
+    assert aggregated["findings"] == ["Finding A"]
+    assert stats["num_samples"] == 3
+
+
+def test_failed_choice_is_resampled_alone():
+    server = FakeCompletionsServer(broken_choices={1})
+    agent = _agent(server)
+
+    samples = asyncio.run(agent._run_self_consistency_sampling("PROMPT", temperatures=[0.1, 0.2, 0.3]))
+
+    assert len(samples) == 3
+    assert [payload.get("n", 1) for payload in server.requests] == [3, 1]
+
+
+def test_falls_back_to_one_request_per_temperature():
+    server = FakeCompletionsServer(reject_n=True)
+    agent = _agent(server)
+
+    samples = asyncio.run(agent._run_self_consistency_sampling("PROMPT", temperatures=[0.1, 0.2, 0.3]))
+
+    assert len(samples) == 3
+    assert [payload["temperature"] for payload in server.requests[1:]] == [0.1, 0.2, 0.3]
@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from enlitens_client_profiles import similarity
+from enlitens_client_profiles.similarity import SimilarityIndex
+
+DIMENSION = 8
+
+
+def _vector(seed):
+    vector = np.random.default_rng(seed).random(DIMENSION).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+class FakeDocument:
+    def __init__(self, idx, attributes=()):
+        self.idx = idx
+        self.meta = SimpleNamespace(profile_id=f"persona-{idx}")
+        self.attributes = list(attributes)
+
+    def attribute_set(self):
+        return self.attributes
+
+
+def _fake_embeddings(monkeypatch):
+    monkeypatch.setattr(similarity, "build_corpus", lambda document: str(document.idx))
+    monkeypatch.setattr(
+        SimilarityIndex,
+        "_embed_many",
+        classmethod(lambda cls, texts: np.vstack([_vector(int(text)) for text in texts])),
+    )
+
+
+def test_vector_buffer_grows_geometrically(tmp_path):
+    index = SimilarityIndex(tmp_path / "index.json", flush_every=10_000)
+    buffers = set()
+    for idx in range(1000):
+        index._add_rows([f"persona-{idx}"], _vector(idx)[None, :], [["tag"]])
+        buffers.add(id(index._buffer))
+
+    assert index._matrix.shape == (1000, DIMENSION)
+    assert len(buffers) <= 8  # 16, 32, ..., 1024
+    np.testing.assert_array_equal(index._matrix[500], _vector(500))
+
+    index._add_rows(["persona-3"], _vector(5000)[None, :], [["other"]])
+    assert len(index.profile_ids) == 1000
+    np.testing.assert_array_equal(index._matrix[3], _vector(5000))
+
+
+def test_register_buffers_writes_until_flush(tmp_path, monkeypatch):
+    _fake_embeddings(monkeypatch)
+    path = tmp_path / "index.json"
+    index = SimilarityIndex(path, flush_every=3)
+
+    index.register(FakeDocument(0, ["adhd", "sensory"]))
+    index.register(FakeDocument(1, ["burnout"]))
+    assert not path.exists()
+    index.register(FakeDocument(2, ["adhd"]))
+    assert path.exists()
+
+    index.register(FakeDocument(3, ["adhd", "sensory"]))
+    assert SimilarityIndex(path).profile_ids == ["persona-0", "persona-1", "persona-2"]
+    index.flush()
+
+    reloaded = SimilarityIndex(path)
+    assert reloaded.profile_ids == [f"persona-{idx}" for idx in range(4)]
+    report = reloaded.evaluate(FakeDocument(1, ["burnout"]))
+    assert report.profile_id == "persona-1"
+    assert report.cosine > 0.99 and report.jaccard == 1.0
+
+    # A reloaded (memory-mapped) index keeps accepting registrations
+    reloaded.register(FakeDocument(4))
+    reloaded.flush()
+    assert len(SimilarityIndex(path).profile_ids) == 5
@@ -0,0 +1,126 @@
+import hashlib
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from enlitens_client_profiles.brand_intelligence import BrandIntelligenceAgent
+from enlitens_client_profiles.config import ProfilePipelineConfig
+from enlitens_client_profiles.site_crawler import SiteCrawler
+
+PAGE_NAMES = [f"page-{idx}" for idx in range(8)]
+
+
+class FixtureSite:
+    """Served pages keyed by path; bodies carry ETags and honour If-None-Match."""
+
+    def __init__(self):
+        self.bodies = {}
+        self.full_responses = 0
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        self.set_page("/", "Home", "".join(f'<a href="/{name}">{name}</a>' for name in PAGE_NAMES))
+        for name in PAGE_NAMES:
+            self.set_page(f"/{name}", name.title(), '<a href="/">home</a>')
+
+    def set_page(self, path, title, body):
+        self.bodies[path] = f"<html><title>{title}</title><h1>{title}</h1>{body}</html>"
+
+
+@pytest.fixture
+def site():
+    fixture = FixtureSite()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = fixture.bodies.get(self.path)
+            if body is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            etag = '"%s"' % hashlib.md5(body.encode()).hexdigest()
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            with fixture.lock:
+                fixture.full_responses += 1
+                fixture.active += 1
+                fixture.peak = max(fixture.peak, fixture.active)
+            time.sleep(0.1)
+            with fixture.lock:
+                fixture.active -= 1
+            payload = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    fixture.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield fixture
+    server.shutdown()
+    server.server_close()
+
+
+def _crawler(site, cache_dir):
+    return SiteCrawler(site.base_url, cache_dir=cache_dir, incremental=True, per_host_limit=3, request_interval=0.0)
+
+
+def test_refresh_of_unchanged_site_uses_conditional_requests(site, tmp_path):
+    started = time.perf_counter()
+    first = _crawler(site, tmp_path).crawl()
+    elapsed = time.perf_counter() - started
+
+    assert len(first) == 1 + len(PAGE_NAMES)
+    assert first[f"{site.base_url}/page-3"]["title"] == "Page-3"
+    assert site.full_responses == len(first)
+    assert site.peak == 3
+    # Nine 0.1s responses one after another would take ~0.9s
+    assert elapsed < 0.7
+
+    site.set_page("/page-3", "Page-3 updated", '<a href="/">home</a>')
+    refresher = _crawler(site, tmp_path)
+    second = refresher.crawl()
+
+    assert second.keys() == first.keys()
+    assert second[f"{site.base_url}/page-3"]["title"] == "Page-3 updated"
+    assert refresher.stats == {"fetched": 1, "not_modified": len(first) - 1, "failed": 0}
+
+
+def test_sitemaps_are_fetched_through_the_crawler_cache(site, tmp_path):
+    leaves = ["/sitemap-pages.xml", "/sitemap-posts.xml"]
+    site.bodies["/sitemap_index.xml"] = (
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        + "".join(f"<sitemap><loc>{site.base_url}{leaf}</loc></sitemap>" for leaf in leaves)
+        + "</sitemapindex>"
+    )
+    for leaf in leaves:
+        site.bodies[leaf] = (
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            f"<url><loc>{site.base_url}/{leaf.strip('/').split('.')[0]}</loc></url></urlset>"
+        )
+    config = ProfilePipelineConfig(project_root=tmp_path, enlitens_site_root=site.base_url)
+
+    urls = BrandIntelligenceAgent(config)._fetch_sitemap_urls()
+    assert urls == [f"{site.base_url}/sitemap-pages", f"{site.base_url}/sitemap-posts"]
+    assert site.full_responses == 3
+
+    agent = BrandIntelligenceAgent(config)
+    assert agent._fetch_sitemap_urls() == urls
+    assert site.full_responses == 3
+    assert agent._site_crawler().stats["not_modified"] == 3
@@ -0,0 +1,68 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.synthesis.enlitens_rebellion_synthesizer import EnlitensRebellionSynthesizer
+from src.synthesis.step_executor import StepExecutor, SynthesisStep
+
+
+def _sleeper(seconds, result=None, fail=False):
+    async def run(*args):
+        await asyncio.sleep(seconds)
+        if fail:
+            raise RuntimeError("step broke")
+        return result if result is not None else list(args)
+
+    return run
+
+
+def test_independent_steps_overlap_and_failures_stay_local():
+    executor = StepExecutor(
+        [
+            SynthesisStep("a", _sleeper(0.2, {"a": 1}), ("x",)),
+            SynthesisStep("b", _sleeper(0.2, fail=True), ("x",)),
+            SynthesisStep("c", _sleeper(0.2), ("y",)),
+            SynthesisStep("d", _sleeper(0.1), ("y",), after=("a", "b")),
+        ],
+        max_concurrency=3,
+    )
+
+    outputs, report = asyncio.run(executor.run({"x": "X", "y": "Y"}))
+
+    assert list(outputs) == ["a", "b", "c", "d"]
+    assert outputs["a"] == {"a": 1} and outputs["b"] == {}
+    # d receives its source input and the degraded output of b
+    assert outputs["d"] == ["Y", {"a": 1}, {}]
+    assert report["steps"]["b"]["status"] == "failed"
+    assert report["critical_path"][-1] == "d" and report["critical_path"][0] in {"a", "b"}
+    assert report["total_seconds"] < 0.45 < report["summed_seconds"]
+
+
+def test_cycles_are_rejected():
+    step = _sleeper(0)
+    try:
+        StepExecutor([SynthesisStep("a", step, after=("b",)), SynthesisStep("b", step, after=("a",))])
+    except ValueError as exc:
+        assert "cycle" in str(exc)
+    else:
+        raise AssertionError("cycle not detected")
+
+
+def test_synthesizer_output_matches_sequential_steps():
+    synthesizer = EnlitensRebellionSynthesizer()
+    content = {
+        "module_1_narrative": {"narrative_insights": ["stories matter"], "systemic_critiques": ["gatekeeping"]},
+        "module_5_strengths": {"strengths": ["pattern recognition"]},
+        "aha_moments": ["it was never laziness"],
+    }
+
+    result = asyncio.run(
+        synthesizer.synthesize_rebellion_content({"source_metadata": {"title": "T", "abstract": "A"}}, content)
+    )
+
+    assert result["module_1_narrative"] == asyncio.run(synthesizer._synthesize_module_1(content["module_1_narrative"]))
+    assert result["aha_moments"] == asyncio.run(synthesizer._synthesize_aha_moments(content["aha_moments"]))
+    assert result["system_critique"] == asyncio.run(synthesizer._synthesize_system_critique(content))
+    assert set(synthesizer.last_timings["steps"]) == set(result)
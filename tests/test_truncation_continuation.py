@@ -0,0 +1,111 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.models.enlitens_schemas import ResearchContent
+from src.synthesis.ollama_client import VLLMClient
+
+TOKEN_CHARS = 4
+TARGET = json.dumps(
+    {
+        "findings": [f"Finding number {idx} about sensory processing" for idx in range(6)],
+        "statistics": ["n = 120, p < .01"],
+        "methodologies": ["Longitudinal cohort"],
+        "limitations": [],
+        "future_directions": [],
+        "implications": [],
+        "citations": [],
+        "references": [],
+    }
+)
+TARGET_TOKENS = -(-len(TARGET) // TOKEN_CHARS)
+
+
+class TruncatingServer:
+    """Fake completions server that stops every response after ``cap`` tokens."""
+
+    def __init__(self, cap, support_continuation=True):
+        self.cap = cap
+        self.support_continuation = support_continuation
+        self.requests = []
+        self.generated_tokens = 0
+
+    def __call__(self, request):
+        if request.url.path.endswith("/models"):
+            return httpx.Response(200, json={"data": [{"id": "fake", "max_model_len": 65536}]})
+        payload = json.loads(request.content)
+        self.requests.append(payload)
+        prefix = ""
+        if payload.get("continue_final_message"):
+            if not self.support_continuation:
+                return httpx.Response(400, json={"message": "Extra inputs are not permitted"})
+            prefix = payload["messages"][-1]["content"]
+            assert TARGET.startswith(prefix)
+        remaining = TARGET[len(prefix):]
+        tokens = min(self.cap, payload["max_tokens"])
+        text = remaining[: tokens * TOKEN_CHARS]
+        used = -(-len(text) // TOKEN_CHARS)
+        self.generated_tokens += used
+        finished = len(text) == len(remaining)
+        return httpx.Response(
+            200,
+            json={
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text},
+                        "finish_reason": "stop" if finished else "length",
+                    }
+                ],
+                "usage": {"completion_tokens": used},
+            },
+        )
+
+
+def _generate(server, **client_kwargs):
+    client = VLLMClient(
+        base_url="http://fake/v1",
+        default_model="fake",
+        enable_prefix_caching=False,
+        transport=httpx.MockTransport(server),
+        **client_kwargs,
+    )
+    result = asyncio.run(
+        client.generate_structured_response(
+            "PROMPT",
+            ResearchContent,
+            base_num_predict=40,
+            max_num_predict=1000,
+            use_cot_prompt=False,
+        )
+    )
+    return client, result
+
+
+def test_truncated_response_is_continued_not_regenerated():
+    server = TruncatingServer(cap=40)
+    client, result = _generate(server, enable_continuation=True)
+
+    assert result.model_dump() == json.loads(TARGET)
+    assert server.generated_tokens == TARGET_TOKENS
+    assert all(payload["messages"][0]["content"] == "PROMPT" for payload in server.requests)
+    stats = client.truncation_stats
+    assert stats["continuations"] == len(server.requests) - 1
+    assert stats["restarts"] == 0
+    # Restarting would have regenerated 40, 80, ... tokens of prefix
+    assert stats["tokens_saved"] == sum(40 * idx for idx in range(1, len(server.requests)))
+
+
+def test_rejected_continuation_falls_back_to_restart():
+    server = TruncatingServer(cap=10_000, support_continuation=False)
+    client, result = _generate(server, enable_continuation=True)
+
+    assert result.model_dump() == json.loads(TARGET)
+    assert client.enable_continuation is False
+    assert client.truncation_stats["restarts"] == 1
+    assert client.truncation_stats["tokens_saved"] == 0
@@ -0,0 +1,86 @@
+import json
+import multiprocessing
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.utils import usage_tracker
+
+
+@pytest.fixture
+def usage_paths(tmp_path, monkeypatch):
+    monkeypatch.setattr(usage_tracker, "USAGE_DB", tmp_path / "ai_usage.sqlite3")
+    monkeypatch.setattr(usage_tracker, "USAGE_FILE", tmp_path / "ai_usage.json")
+    return tmp_path
+
+
+def _record_many(count):
+    for _ in range(count):
+        usage_tracker.record_usage("gemini_cli", tokens_in=2, tokens_out=1, cost_usd=0.5)
+
+
+def test_concurrent_processes_do_not_lose_updates(usage_paths):
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_record_many, args=(25,)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+    summary = usage_tracker.get_usage_summary()["tools"]["gemini_cli"]
+    assert summary["count"] == 100
+    assert summary["tokens_in"] == 200
+    assert summary["cost_usd"] == pytest.approx(50.0)
+
+
+def test_legacy_json_is_imported_and_compaction_exports(usage_paths):
+    today = usage_tracker.datetime.utcnow().strftime("%Y-%m-%d")
+    legacy = {today: {"deep_research": {"count": 3, "events": [], "tokens_in": 10, "tokens_out": 4, "cost_usd": 0.1}}}
+    (usage_paths / "ai_usage.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    usage_tracker.record_usage("deep_research", metadata={"query": "adhd"})
+    assert usage_tracker.get_usage_summary()["tools"]["deep_research"]["count"] == 4
+
+    payload = usage_tracker.compact_usage(retain_days=0)
+    exported = json.loads((usage_paths / "ai_usage.json").read_text(encoding="utf-8"))
+    assert exported == payload
+    assert exported[today]["deep_research"]["count"] == 4
+    assert exported[today]["deep_research"]["events"][0]["metadata"] == {"query": "adhd"}
+
+
+def test_setup_and_compaction_run_once_per_database(usage_paths, monkeypatch):
+    imports = []
+    original = usage_tracker._import_legacy_json
+    monkeypatch.setattr(usage_tracker, "_import_legacy_json", lambda conn: imports.append(1) or original(conn))
+    old_day = (usage_tracker.datetime.utcnow() - usage_tracker.timedelta(days=30)).strftime("%Y-%m-%d")
+
+    usage_tracker.record_usage("codex_cli")
+    with usage_tracker._connect(write=True) as conn:
+        conn.execute(
+            "INSERT INTO usage_events (day, tool, timestamp) VALUES (?, 'codex_cli', ?)",
+            (old_day, old_day + "T00:00:00+00:00"),
+        )
+    usage_tracker.get_usage_summary()
+    assert imports == [1]
+
+    # A fresh process folds the month-old event into daily rows and exports the snapshot
+    usage_tracker._PREPARED.clear()
+    usage_tracker.get_usage_summary()
+    with usage_tracker._connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM usage_events WHERE day = ?", (old_day,)).fetchone()[0] == 0
+    exported = json.loads((usage_paths / "ai_usage.json").read_text(encoding="utf-8"))
+    assert exported[old_day]["codex_cli"]["count"] == 1
+
+
+def test_recent_events_skip_records_without_metadata(usage_paths):
+    usage_tracker.record_usage("gemini_cli", metadata={"prompt": "kept"})
+    for _ in range(usage_tracker.MAX_EVENTS_PER_TOOL + 5):
+        usage_tracker.record_usage("gemini_cli")
+
+    today = usage_tracker.datetime.utcnow().strftime("%Y-%m-%d")
+    events = usage_tracker._load_usage(today)[today]["gemini_cli"]["events"]
+    assert [event["metadata"] for event in events] == [{"prompt": "kept"}]
@@ -0,0 +1,106 @@
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.utils.artifact_cache import ArtifactCache
+from src.validation.web_quote_verifier import WebQuoteVerifier
+
+QUOTES = [
+    "Sensory over-responsivity predicted anxiety two years later",
+    "Executive function training improved planning in adolescents",
+    "Masking was associated with higher rates of autistic burnout",
+]
+
+
+class FakeWeb:
+    """Local search/scrape backend; every page lives on the same host."""
+
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.searches = 0
+        self.scrapes = 0
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def search(self, request):
+        self.searches += 1
+        time.sleep(self.delay)
+        index = next(idx for idx, quote in enumerate(QUOTES) if quote[:40] in request.query)
+        return [SimpleNamespace(url=f"https://journal.example.org/{index}/{rank}") for rank in range(2)]
+
+    def scrape(self, request):
+        with self._lock:
+            self.scrapes += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        index, rank = str(request.url).rstrip("/").split("/")[-2:]
+        # Only the second result of the first two quotes contains the quote
+        text = QUOTES[int(index)].upper() if rank == "1" and index != "2" else "unrelated page"
+        return SimpleNamespace(text=text)
+
+
+def _verifier(web, tmp_path, **kwargs):
+    return WebQuoteVerifier(
+        search=web.search,
+        scrape=web.scrape,
+        cache=ArtifactCache(root=tmp_path),
+        per_host_limit=2,
+        **kwargs,
+    )
+
+
+def test_fan_out_respects_host_limit_and_caches(tmp_path):
+    web = FakeWeb()
+    candidates = [{"claim": f"claim {idx}", "quote": quote} for idx, quote in enumerate(QUOTES)]
+
+    started = time.perf_counter()
+    verified = asyncio.run(_verifier(web, tmp_path).verify(candidates))
+    elapsed = time.perf_counter() - started
+
+    assert [item["claim"] for item in verified] == ["claim 0", "claim 1"]
+    assert web.searches == 3
+    assert web.peak == 2
+    # 3 searches + 6 scrapes run one at a time would take ~0.9s
+    assert elapsed < 0.7
+
+    calls = (web.searches, web.scrapes)
+    again = asyncio.run(_verifier(web, tmp_path).verify(candidates))
+    assert again == verified
+    assert (web.searches, web.scrapes) == calls
+
+
+def test_deadline_leaves_quotes_unverified_and_uncached(tmp_path):
+    web = FakeWeb(delay=0.5)
+    candidates = [{"claim": "claim 0", "quote": QUOTES[0]}]
+
+    verified = asyncio.run(_verifier(web, tmp_path, deadline_seconds=0.2).verify(candidates))
+
+    assert verified == []
+    assert ArtifactCache(root=tmp_path).get("quote_verdicts", QUOTES[0]) is None
+
+
+def test_failed_scrapes_are_retried_not_cached(tmp_path):
+    web = FakeWeb(delay=0.0)
+    ok_scrape = web.scrape
+    # scrape_url returns None for 429/503 responses
+    web.scrape = lambda request: None
+    candidates = [{"claim": "claim 0", "quote": QUOTES[0]}]
+
+    assert asyncio.run(_verifier(web, tmp_path).verify(candidates)) == []
+    cache = ArtifactCache(root=tmp_path)
+    assert cache.get("quote_verdicts", QUOTES[0]) is None
+    assert cache.get("scraped_pages", "https://journal.example.org/0/1") is None
+
+    web.scrape = ok_scrape
+    verified = asyncio.run(_verifier(web, tmp_path).verify(candidates))
+    assert [item["claim"] for item in verified] == ["claim 0"]
+    assert ArtifactCache(root=tmp_path).get("quote_verdicts", QUOTES[0]) == {"verified": True}